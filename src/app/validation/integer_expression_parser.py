@@ -1,7 +1,7 @@
 from my_math.integer_module import IntegerModule
 import sys
 from pathlib import Path
-from .math_expression_parser import MathExpressionParser
+from .math_expression_parser import MathExpressionParser, PendingPower
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 
@@ -17,12 +17,16 @@ class IntExpressionParser(MathExpressionParser):
             '%': 2,   # остаток от деления
             # служебный/низкоприоритетный оператор (если используется)
             '>': 0,
-            '~': 3    # унарный минус (искусственный оператор)
+            '~': 3,   # унарный минус (искусственный оператор)
+            '^': 4    # возведение в степень: -2^2 = -(2^2)
         }
+        # Правоассоциативные операторы: 2^3^2 = 2^(3^2)
+        self.right_assoc = {'^'}
         # Множество поддерживаемых функций над целыми.
         # ABS  – модуль числа
         # POZ  – знак числа (результат POZ_Z_D)
-        self.functions = {'ABS', 'POZ'}
+        # POWMOD – степень по модулю: POWMOD(a, b, m) = a ^ b % m
+        self.functions = {'ABS', 'POZ', 'POWMOD'}
 
     def to_postfix(self, expression: str) -> list:
         """
@@ -87,12 +91,9 @@ class IntExpressionParser(MathExpressionParser):
 
                 if is_unary:
                     # Унарный минус реализуется через искусственный оператор '~'
-                    # с собственным приоритетом.
-                    while (stack and
-                           stack[-1] != '(' and
-                           stack[-1] in self.priority and
-                           self.priority[stack[-1]] >= self.priority['~']):
-                        output.append(stack.pop())
+                    # с собственным приоритетом. Это префиксный оператор: левого
+                    # операнда у него нет, поэтому из стека ничего не выталкивается
+                    # (иначе в 2 ^ -3 оператор ^ попал бы в выход раньше операнда).
                     stack.append('~')
                 else:
                     # Обычный (бинарный) минус:
@@ -105,13 +106,16 @@ class IntExpressionParser(MathExpressionParser):
                         output.append(stack.pop())
                     stack.append(token)
 
-            # 7. Остальные операторы (+, *, /, %, >):
-            #    выталкиваем из стека операторы с приоритетом не ниже текущего.
+            # 7. Остальные операторы (+, *, /, %, ^, >):
+            #    выталкиваем из стека операторы с приоритетом не ниже текущего
+            #    (для правоассоциативного ^ - только с более высоким).
             elif token in self.priority:
                 while (stack and
                        stack[-1] != '(' and
                        stack[-1] in self.priority and
-                       self.priority[stack[-1]] >= self.priority[token]):
+                       (self.priority[stack[-1]] > self.priority[token] or
+                        (self.priority[stack[-1]] == self.priority[token] and
+                         token not in self.right_assoc))):
                     output.append(stack.pop())
                 stack.append(token)
 
@@ -125,6 +129,12 @@ class IntExpressionParser(MathExpressionParser):
 
         return output
 
+    def power(self, base, exponent):
+        """
+        base ^ exponent для неотрицательного показателя.
+        """
+        return base.POW_ZZ_Z(exponent)
+
     def evaluate(self, expression: str, module_class: IntegerModule):
         """
         Вычисляет значение целочисленного выражения.
@@ -133,7 +143,12 @@ class IntExpressionParser(MathExpressionParser):
         module_class – класс IntegerModule, используется для создания объектов.
 
         Возвращает строковое представление результата (str(stack[0])).
+        Выражение вида 'выражение mod m' вычисляется по модулю m (см. evaluate_mod).
         """
+        expression, modulus = self.split_modulus(expression)
+        if modulus is not None:
+            return self.evaluate_mod(expression, modulus)
+
         stack = []
 
         # Получаем список токенов в постфиксной записи.
@@ -142,29 +157,35 @@ class IntExpressionParser(MathExpressionParser):
         for token in postfix:
             # 1. Если это число – создаём объект IntegerModule и кладём в стек.
             if token.isdigit():
-                # массив цифр в обратном порядке
-                digits = [int(d) for d in token][::-1]
-                n = len(digits) - 1                    # индекс старшей цифры
-                num = module_class(0, n, digits)       # знак 0 = положительное
+                # знак 0 = положительное, массив цифр в обратном порядке
+                num = module_class.from_str(token)
                 stack.append(num)
 
             # 2. Унарный минус '~':
             #    снимаем один операнд со стека, меняем знак и кладём обратно.
             elif token == '~':
-                operand = stack.pop()
-                # Создаём новый объект с противоположным знаком: 0 -> 1, 1 -> 0.
-                result = module_class(
-                    1 - operand.b,    # новый знак
-                    operand.n,        # степень
-                    operand.A.copy()  # копия массива цифр
-                )
+                operand = self.pop(stack)
+                # Новый объект с противоположным знаком: копия (за O(1)) с изменённым знаком.
+                result = operand._clone().MUL_ZM_Z()
                 stack.append(result)
 
-            # 3. Бинарные арифметические операторы.
+            # 3. Степень откладывается: если за ней следует %, она вычисляется
+            #    по модулю без полного значения a ^ b.
+            elif token == '^':
+                right = self.pop(stack)
+                left = self.pop(stack)
+                stack.append(PendingPower(left, right))
+
+            elif token == '%' and len(stack) >= 2 and isinstance(stack[-2], PendingPower):
+                right = self.pop(stack)
+                pending = stack.pop()
+                stack.append(pending.base.POWMOD_ZZZ_Z(pending.exponent, right))
+
+            # 4. Бинарные арифметические операторы.
             elif token in ['+', '-', '*', '/', '%']:
                 # Снимаем два операнда: left (левый), right (правый).
-                right = stack.pop()
-                left = stack.pop()
+                right = self.pop(stack)
+                left = self.pop(stack)
 
                 # Выполняем соответствующую операцию методов IntegerModule.
                 if token == '+':
@@ -181,19 +202,19 @@ class IntExpressionParser(MathExpressionParser):
                 # Результат кладём обратно в стек.
                 stack.append(result)
 
-            # 4. Функция ABS: модуль числа.
+            # 5. Функция ABS: модуль числа.
             elif token == 'ABS':
-                operand = stack.pop()
+                operand = self.pop(stack)
                 result = operand.ABS_Z_Z()   # метод возвращает |operand|
                 stack.append(result)
 
-            # 5. Функция POZ: признак знака.
+            # 6. Функция POZ: признак знака.
             #    POZ_Z_D() возвращает:
             #       0 – если число равно 0,
             #       1 – если число > 0,
             #       2 – если число < 0.
             elif token == 'POZ':
-                operand = stack.pop()
+                operand = self.pop(stack)
                 result = operand.POZ_Z_D()
 
                 # Преобразуем результат (целое Python) обратно в IntegerModule.
@@ -206,6 +227,13 @@ class IntExpressionParser(MathExpressionParser):
                 num = module_class(0 if result > 0 else 1, n, digits)
                 stack.append(num)
 
+            # 7. Функция POWMOD(a, b, m): a ^ b % m.
+            elif token == 'POWMOD':
+                modulus = self.pop(stack)
+                exponent = self.pop(stack)
+                base = self.pop(stack)
+                stack.append(base.POWMOD_ZZZ_Z(exponent, modulus))
+
         # В стеке должен остаться единственный элемент – результат вычисления.
         # Возвращаем его строковое представление.
-        return str(stack[0]) if stack else None
+        return str(self.value(stack[0])) if stack else None
@@ -2,12 +2,14 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from my_math.natural_module import NaturalModule
+from my_math.integer_module import IntegerModule
+from my_math.modulus import Modulus
 from abc import ABC, abstractmethod
 import re
 
 
 
-class MathExpressionParser:
+class MathExpressionParser(ABC):
     def __init__(self):
         # Приоритеты операций (чем больше число, тем выше приоритет)
         self.priority = {
@@ -16,8 +18,11 @@ class MathExpressionParser:
             '*': 2,
             '/': 2,
             '%': 2,
+            '^': 3,
             '>': 0
         }
+        # Правоассоциативные операторы: 2^3^2 = 2^(3^2)
+        self.right_assoc = {'^'}
 
         # Список поддерживаемых функций
         self.functions = {'НОД', 'НОК', 'GCD',
@@ -28,7 +33,7 @@ class MathExpressionParser:
         Разбивает выражение на токены: числа, операторы, функции, скобки, запятые
         """
         # Паттерн для: функции, числа, операторы, скобки, запятые
-        pattern = r'([А-Яа-яA-Za-z_][А-Яа-яA-Za-z0-9_]*|\d+|[+\-*/%(),>])'
+        pattern = r'([А-Яа-яA-Za-z_][А-Яа-яA-Za-z0-9_]*|\d+|[+\-*/%^(),>])'
         tokens = re.findall(pattern, expression.replace(' ', ''))
         return tokens
 
@@ -75,11 +80,13 @@ class MathExpressionParser:
 
             # 6. Если оператор
             elif token in self.priority:
-                # Выталкиваем операторы с >= приоритетом
+                # Выталкиваем операторы с >= приоритетом (с > для правоассоциативных)
                 while (stack and
                        stack[-1] != '(' and
                        stack[-1] in self.priority and
-                       self.priority[stack[-1]] >= self.priority[token]):
+                       (self.priority[stack[-1]] > self.priority[token] or
+                        (self.priority[stack[-1]] == self.priority[token] and
+                         token not in self.right_assoc))):
                     output.append(stack.pop())
                 stack.append(token)
 
@@ -92,6 +99,110 @@ class MathExpressionParser:
 
         return output
 
+    @abstractmethod
+    def power(self, base, exponent):
+        """
+        Возведение в степень для оператора ^ (base не изменяется)
+        """
+
+    def value(self, item):
+        """
+        Значение элемента стека: отложенная степень вычисляется
+        """
+        if isinstance(item, PendingPower):
+            return self.power(item.base, item.exponent)
+        return item
+
+    def pop(self, stack: list):
+        """
+        Снимает операнд со стека, вычисляя отложенную степень
+        """
+        return self.value(stack.pop())
+
+    def split_modulus(self, expression: str):
+        """
+        Отделяет от выражения режим вычисления по модулю: 'выражение mod m'
+
+        Возвращает: (выражение, m) - m строкой из цифр или None, если режим не указан
+        """
+        match = re.fullmatch(r'(.*?)\s*mod\s*(\d+)\s*', expression, re.S)
+        if match is None:
+            return expression, None
+        return match.group(1), match.group(2)
+
+    def evaluate_mod(self, expression: str, modulus: str) -> str:
+        """
+        Вычисляет выражение в кольце вычетов по модулю m ('выражение mod m')
+
+        Все вычисления выполняются над приведёнными вычетами одного объекта
+        Modulus (константы редукции вычисляются один раз на выражение):
+        +, -, * и унарный минус - операции кольца, деление (и дробь a/b) -
+        умножение на обратный вычет, a ^ b - степень по модулю. Показатель
+        степени берётся как есть (не приводится по модулю m), отрицательный
+        показатель - степень обратного вычета.
+
+        Возвращает: строку с вычетом от 0 до m - 1
+        """
+        ring = Modulus(NaturalModule.from_str(modulus))
+        stack = []
+
+        for token in self.to_postfix(expression):
+            # Числа кладутся в стек без приведения (они могут оказаться показателями)
+            if re.fullmatch(r'-?\d+', token):
+                stack.append(IntegerModule.from_str(token))
+
+            # Дробь a/b - вычет a * b^(-1)
+            elif re.fullmatch(r'-?\d+/\d+', token):
+                numerator, denominator = token.split('/')
+                stack.append(ring.div(ring.reduce(IntegerModule.from_str(numerator)),
+                                      ring.reduce(NaturalModule.from_str(denominator))))
+
+            # Унарный минус у числа оставляет его точным (например, в показателе 2 ^ -1)
+            elif token == '~':
+                operand = stack.pop()
+                if isinstance(operand, IntegerModule):
+                    stack.append(operand._clone().MUL_ZM_Z())
+                else:
+                    stack.append(ring.neg(operand))
+
+            elif token == '^':
+                exponent = stack.pop()
+                base = ring.reduce(stack.pop())
+                if isinstance(exponent, IntegerModule):
+                    if exponent.POZ_Z_D() == -1:
+                        base = ring.inverse(base)
+                    exponent = exponent.magnitude
+                stack.append(ring.pow(base, exponent))
+
+            elif token in ['+', '-', '*', '/']:
+                right = ring.reduce(stack.pop())
+                left = ring.reduce(stack.pop())
+                if token == '+':
+                    stack.append(ring.add(left, right))
+                elif token == '-':
+                    stack.append(ring.sub(left, right))
+                elif token == '*':
+                    stack.append(ring.mul(left, right))
+                else:
+                    stack.append(ring.div(left, right))
+
+            else:
+                raise Exception(f"Операция {token} не поддерживается в режиме mod")
+
+        return str(ring.reduce(stack[0])) if stack else None
+
     @abstractmethod
     def evaluate(self, expression: str, module_class):
         pass
+
+
+class PendingPower:
+    """
+    Степень base^exponent, вычисление которой отложено до следующей операции.
+    Если следующая операция - остаток (%), степень сразу вычисляется по модулю,
+    без построения полного (очень длинного) значения base^exponent.
+    """
+
+    def __init__(self, base, exponent):
+        self.base = base
+        self.exponent = exponent
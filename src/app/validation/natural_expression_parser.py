@@ -1,12 +1,17 @@
 import re
 import sys
 from pathlib import Path
-from .math_expression_parser import MathExpressionParser
+from .math_expression_parser import MathExpressionParser, PendingPower
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from my_math.natural_module import NaturalModule
+from my_math.reciprocal import Reciprocal
 
 
 class NatExpressionParser(MathExpressionParser):
+    # Минимальная длина делителя (в цифрах), при которой повторяющийся делитель
+    # заменяется предвычисленной обратной величиной
+    RECIPROCAL_MIN_DIGITS = 200
+
     def __init__(self):
         # Приоритеты операций (чем больше число, тем выше приоритет)
         self.priority = {
@@ -15,91 +20,163 @@ class NatExpressionParser(MathExpressionParser):
             '*': 2,
             '/': 2,
             '%': 2,
+            '^': 3,
             '>': 0
         }
+        # Правоассоциативные операторы: 2^3^2 = 2^(3^2)
+        self.right_assoc = {'^'}
         
         # Список поддерживаемых функций
-        self.functions = {'НОД', 'НОК', 'GCD', 'LCM', 'nod', 'nok', 'NZER', 'TM'}
+        self.functions = {'НОД', 'НОК', 'GCD', 'LCM', 'nod', 'nok', 'NZER', 'TM', 'POWMOD',
+                          'SQRT', 'ROOT'}
     
    
+    def divide(self, result, right, token: str, divisors: dict):
+        """
+        Деление (/) или остаток (%) result на right
+
+        Если длинный делитель встречается в выражении повторно, для него один раз
+        строится обратная величина (Reciprocal), и все последующие деления на него
+        выполняются умножениями вместо деления "в столбик".
+
+        Возвращает: частное или остаток (result или новое число в режиме значений)
+        """
+        reciprocal = None
+        if right.n + 1 >= self.RECIPROCAL_MIN_DIGITS:
+            # Ключ - значение делителя (изменяемые числа не хэшируются)
+            key = right._key()
+            reciprocal = divisors.get(key)
+            if reciprocal is None:
+                divisors[key] = False  # Первое вхождение: делим обычным образом
+            elif reciprocal is False:
+                reciprocal = divisors[key] = Reciprocal(right)
+
+        if reciprocal:
+            if token == '/':
+                return reciprocal.DIV_NN_N(result)
+            return reciprocal.MOD_NN_N(result)
+        if token == '/':
+            return result.DIV_NN_N(right)
+        return result.MOD_NN_N(right)
+
+    def power(self, base, exponent):
+        """
+        base ^ exponent (base не изменяется)
+        """
+        return base._clone().POW_NN_N(exponent)
+
     def evaluate(self, expression: str, module_class: NaturalModule):
         """
         Вычисляет выражение в ОПН используя NaturalModule
+        ('выражение mod m' - вычисление по модулю m, см. evaluate_mod)
         """
+        expression, modulus = self.split_modulus(expression)
+        if modulus is not None:
+            return self.evaluate_mod(expression, modulus)
+
         stack = []
+        divisors = {}  # Длинные делители: значение (_key) -> Reciprocal
         postfix = self.to_postfix(expression)
         
         for token in postfix:
             # Если число - создаем NaturalModule и помещаем в стек
             if token.isdigit():
-                # Преобразуем строку в NaturalModule
-                digits = [int(d) for d in token][::-1]  # Младший разряд первый
-                n = len(digits) - 1
-                num = module_class(n, digits)
+                # Преобразуем строку в NaturalModule (длинные числа - сразу в лимбы)
+                num = module_class.from_str(token)
                 stack.append(num)
             
+            # Степень откладывается: если за ней следует %, она вычисляется по модулю
+            elif token == '^':
+                right = self.pop(stack)
+                left = self.pop(stack)
+                stack.append(PendingPower(left, right))
+
+            # a ^ b % m - возведение в степень по модулю без полного значения a ^ b
+            elif token == '%' and len(stack) >= 2 and isinstance(stack[-2], PendingPower):
+                right = self.pop(stack)
+                pending = stack.pop()
+                result = pending.base._clone()
+                stack.append(result.POWMOD_NNN_N(pending.exponent, right))
+
             # Если бинарный оператор
-            elif token in ['+', '-', '*', '/', '%', '^', '>']:
-                right = stack.pop()
-                left = stack.pop()
+            elif token in ['+', '-', '*', '/', '%', '>']:
+                right = self.pop(stack)
+                left = self.pop(stack)
                 
                 # Создаем копию для сохранения исходных значений
-                result = module_class(left.n, left.A.copy())
+                result = left._clone()
                 
                 if token == '+':
-                    result.ADD_NN_N(right)
+                    result = result.ADD_NN_N(right)
                 elif token == '-':
                     if result.COM_NN_D(right) != 1:
-                        result.SUB_NN_N(right)
+                        result = result.SUB_NN_N(right)
                     else:
                         raise Exception("Нельзя из меньшего вычесть большее!")
                 elif token == '*':
-                    result.MUL_NN_N(right)
-                elif token == '/':
-                    result.DIV_NN_N(right)
-                elif token == '%':
-                    result.MOD_NN_N(right)
+                    result = result.MUL_NN_N(right)
+                elif token in ('/', '%'):
+                    result = self.divide(result, right, token, divisors)
                 elif token == '>':
-                    temp = result.COM_NN_D(right)
-                    result.A = reversed([int(i) for i in str(temp)])
-                    result.n = len(str(temp)) - 1
+                    result = module_class.from_str(str(result.COM_NN_D(right)))
                 
                 stack.append(result)
             
             # Если функция НОД или НОК
             elif token in ['НОД', 'GCD', 'NOD']:
                 # НОД принимает 2 аргумента
-                right = stack.pop()
-                left = stack.pop()
-                result = module_class(left.n, left.A.copy())
-                result.GCF_NN_N(right)
+                right = self.pop(stack)
+                left = self.pop(stack)
+                result = left._clone()
+                result = result.GCF_NN_N(right)
                 stack.append(result)
             
             elif token in ['НОК', 'LCM', 'NOK']:
                 # НОК принимает 2 аргумента
-                right = stack.pop()
-                left = stack.pop()
+                right = self.pop(stack)
+                left = self.pop(stack)
                 
                 # Вычисляем НОД
-                lcm = module_class(left.n, left.A.copy())
-                lcm.LCM_NN_N(module_class(right.n, right.A.copy()))
+                lcm = left._clone()
+                lcm = lcm.LCM_NN_N(right._clone())
 
                 stack.append(lcm)
 
             elif token in ['NZER']:
                 # NZER принимает 1 аргумент
-                number = stack.pop()
+                number = self.pop(stack)
 
-                result = module_class(number.n, number.A.copy()).NZER_N_B()
+                result = number.NZER_N_B()
                 stack.append(int(result))
 
             elif token in ['TM']:
                 # TM принимает 2 аргумента
-                right = stack.pop()
-                left = stack.pop()
+                right = self.pop(stack)
+                left = self.pop(stack)
                 print(right, left)
-                result = module_class(left.n, left.A.copy()).MUL_Nk_N(int(str(right)))
+                result = left._clone().MUL_Nk_N(right._to_int())
                 stack.append(result)
 
+            elif token == 'POWMOD':
+                # POWMOD(a, b, m) = a ^ b % m
+                modulus = self.pop(stack)
+                exponent = self.pop(stack)
+                base = self.pop(stack)
+                result = base._clone()
+                stack.append(result.POWMOD_NNN_N(exponent, modulus))
+
+            elif token == 'SQRT':
+                # SQRT(a) - целая часть квадратного корня
+                number = self.pop(stack)
+                result = number._clone()
+                stack.append(result.SQRT_N_N())
+
+            elif token == 'ROOT':
+                # ROOT(a, k) - целая часть корня k-й степени
+                k = self.pop(stack)
+                number = self.pop(stack)
+                result = number._clone()
+                stack.append(result.ROOT_Nk_N(k._to_int()))
+
         
-        return str(stack[0]) if stack else None
+        return str(self.value(stack[0])) if stack else None
@@ -58,21 +58,14 @@ class PolExpressionParser(MathExpressionParser):
         - числитель -> IntegerModule
         - знаменатель -> NaturalModule
         """
-        neg = s.startswith('-')
-        if neg:
-            s = s[1:]
-
         if '/' in s:
             num_str, den_str = s.split('/')
         else:
             num_str, den_str = s, '1'
 
-        # Цифры храним в обратном порядке (как в IntegerModule/NaturalModule)
-        num_digits = [int(d) for d in num_str][::-1]
-        den_digits = [int(d) for d in den_str][::-1]
-
-        up = IntegerModule(1 if neg else 0, len(num_digits) - 1, num_digits)
-        down = NaturalModule(len(den_digits) - 1, den_digits)
+        # Числитель может быть со знаком, знаменатель - натуральный
+        up = IntegerModule.from_str(num_str)
+        down = NaturalModule.from_str(den_str)
 
         return RationalModule(up, down)
 
@@ -292,6 +285,23 @@ class PolExpressionParser(MathExpressionParser):
         one = RationalModule(IntegerModule(0, 0, [1]), NaturalModule(0, [1]))
         return RealModule(1, [zero, one])
 
+    def power(self, base: RealModule, k: int) -> RealModule:
+        """
+        Возведение многочлена в степень k >= 0.
+
+        Бинарное возведение в степень слева направо: на каждом бите результат
+        возводится в квадрат (SQR_P_P), при единичном бите домножается на base.
+        """
+        if k == 0:
+            one = RationalModule(IntegerModule(0, 0, [1]), NaturalModule(0, [1]))
+            return self.const_poly(one)
+        result = base
+        for bit in bin(k)[3:]:
+            result = result.SQR_P_P()
+            if bit == '1':
+                result = result.MUL_PP_P(base)
+        return result
+
     def evaluate(self, expression: str):
         """
         Вычисление полиномиального выражения.
@@ -327,10 +337,7 @@ class PolExpressionParser(MathExpressionParser):
                     NaturalModule(0, [1])
                 )
                 for coef in p.C:
-                    coef_copy = RationalModule(
-                        IntegerModule(coef.up.b, coef.up.n, coef.up.A.copy()),
-                        NaturalModule(coef.down.n, coef.down.A.copy())
-                    )
+                    coef_copy = coef._clone()
                     new_C.append(coef_copy.MUL_QQ_Q(minus_one))
                 stack.append(RealModule(len(new_C) - 1, new_C))
 
@@ -344,17 +351,14 @@ class PolExpressionParser(MathExpressionParser):
                     # пытаемся распознать случай base_poly = x
                     is_x_poly = (
                         base_poly.m == 1 and
-                        base_poly.C[0].up.POZ_Z_D() == 0 and      # C[0] = 0
-                        base_poly.C[1].up.POZ_Z_D() == 1 and      # C[1] = 1
-                        base_poly.C[1].down.n == 0 and base_poly.C[1].down.A[0] == 1   # знаменатель = 1
+                        base_poly.C[0].is_zero() and              # C[0] = 0
+                        base_poly.C[1].sign() == 1 and            # C[1] = 1
+                        base_poly.C[1].down.is_one()              # знаменатель = 1
                     )
 
                     exp_coef = exponent_poly.C[0]
-                    sign = -1 if exp_coef.up.b == 1 else 1
-                    val = 0
-                    for i, d in enumerate(exp_coef.up.A):
-                        val += d * (10 ** i)
-                    k = sign * val
+                    # Показатель - значение числителя (без распаковки в цифры)
+                    k = exp_coef.sign() * exp_coef.up._natural_abs()._to_int()
                     if k < 0:
                         raise ValueError("Степень должна быть неотрицательной")
 
@@ -365,7 +369,7 @@ class PolExpressionParser(MathExpressionParser):
                         coeffs = [zero] * k + [one]
                         result = RealModule(k, coeffs)
                     else:
-                        result = self.poly_pow(base_poly, k)
+                        result = self.power(base_poly, k)
 
                     stack.append(result)
                     continue
@@ -20,8 +20,11 @@ class RatExpressionParser(MathExpressionParser):
             '-': 1,   # вычитание (бинарный минус)
             '*': 2,   # умножение
             '/': 2,   # деление
-            '~': 3    # унарный минус (специальный внутренний оператор)
+            '~': 3,   # унарный минус (специальный внутренний оператор)
+            '^': 4    # возведение в целую степень: -2^2 = -(2^2)
         }
+        # Правоассоциативные операторы: 2^3^2 = 2^(3^2)
+        self.right_assoc = {'^'}
         # Множество имён функций, которые поддерживаются поверх рациональных чисел
         # RED – сокращение дроби, INT – проверка, является ли дробь целым числом
         self.functions = {'RED', 'INT'}  # Функции для рациональных чисел
@@ -33,11 +36,14 @@ class RatExpressionParser(MathExpressionParser):
         Разбивает строку на токены:
         - целые числа и дроби (в т.ч. с ведущим минусом, если он унарный),
         - имена функций RED/INT,
-        - знаки операций и скобки.
+        - знаки операций (+, -, *, /, ^) и скобки.
 
         Важный момент: минус может быть частью числа (унарный) или отдельным
         оператором вычитания (бинарный). Здесь сразу пытаемся "прикрепить"
         унарный минус к числу / дроби.
+
+        Рядом со знаком ^ дробь a/b не читается одним числом: '/' - обычное
+        деление с приоритетом ниже степени, 2^3/2 = (2^3)/2, 3/2^2 = 3/(2^2).
         """
         # Удаляем пробелы на всякий случай
         expression = expression.replace(' ', '')
@@ -50,6 +56,9 @@ class RatExpressionParser(MathExpressionParser):
                 i += 1
                 continue
 
+            # Сразу после ^ дробь одним числом не читается
+            after_power = bool(tokens) and tokens[-1] == '^'
+
             # Обработка символа '-': он может быть началом отрицательного числа/дроби
             # или отдельным оператором вычитания.
             if expression[i] == '-':
@@ -57,15 +66,18 @@ class RatExpressionParser(MathExpressionParser):
                 # - начало строки,
                 # - оператор или открывающая скобка,
                 # - запятая (аргументы функции)
-                if i == 0 or (tokens and tokens[-1] in ['(', '+', '-', '*', '/', ',']):
+                # Минус перед основанием степени к числу не прикрепляется:
+                # -2^2 = -(2^2), а не (-2)^2
+                if i == 0 or (tokens and tokens[-1] in ['(', '+', '-', '*', '/', '^', ',']):
                     # Пытаемся распознать отрицательную дробь вида -a/b
-                    match = re.match(r'-\d+/\d+', expression[i:])
+                    match = None if after_power else re.match(r'-\d+/\d+(?!\d|\^)', expression[i:])
                     if match:
                         tokens.append(match.group())
                         i += len(match.group())
                         continue
                     # Иначе пытаемся распознать просто отрицательное целое -a
-                    match = re.match(r'-\d+', expression[i:])
+                    # (после ^ - и перед '/': 2^-3/2 = (2^-3)/2)
+                    match = re.match(r'-\d+(?![\d^])' if after_power else r'-\d+(?![\d/^])', expression[i:])
                     if match:
                         tokens.append(match.group())
                         i += len(match.group())
@@ -76,8 +88,8 @@ class RatExpressionParser(MathExpressionParser):
                 i += 1
                 continue
 
-            # Положительная дробь a/b
-            match = re.match(r'\d+/\d+', expression[i:])
+            # Положительная дробь a/b (если за ней не следует ^)
+            match = None if after_power else re.match(r'\d+/\d+(?!\d|\^)', expression[i:])
             if match:
                 tokens.append(match.group())
                 i += len(match.group())
@@ -98,7 +110,7 @@ class RatExpressionParser(MathExpressionParser):
                 continue
 
             # Операторы и скобки
-            if expression[i] in '+*/(),':
+            if expression[i] in '+*/^(),':
                 tokens.append(expression[i])
                 i += 1
                 continue
@@ -122,40 +134,16 @@ class RatExpressionParser(MathExpressionParser):
             numerator_str = parts[0]      # может быть с минусом
             denominator_str = parts[1]
 
-            # Проверяем знак числителя
-            is_negative = numerator_str.startswith('-')
-            if is_negative:
-                # убираем '-' для разбора цифр
-                numerator_str = numerator_str[1:]
-
-            # Создаём IntegerModule для числителя
-            num_digits = [int(d) for d in numerator_str][::-1]
-            numerator = IntegerModule(
-                1 if is_negative else 0,       # 1 – отрицательное, 0 – положительное
-                len(num_digits) - 1,
-                num_digits
-            )
+            # Создаём IntegerModule для числителя (может быть с минусом)
+            numerator = IntegerModule.from_str(numerator_str)
 
             # Создаём NaturalModule для знаменателя
-            den_digits = [int(d) for d in denominator_str][::-1]
-            denominator = NaturalModule(
-                len(den_digits) - 1,
-                den_digits
-            )
+            denominator = NaturalModule.from_str(denominator_str)
 
             return RationalModule(numerator, denominator)
         else:
             # Токен – целое число (со знаком или без), приводим к виду a/1
-            is_negative = token.startswith('-')
-            if is_negative:
-                token = token[1:]
-
-            digits = [int(d) for d in token][::-1]
-            numerator = IntegerModule(
-                1 if is_negative else 0,
-                len(digits) - 1,
-                digits
-            )
+            numerator = IntegerModule.from_str(token)
 
             # Знаменатель = 1
             denominator = NaturalModule(0, [1])
@@ -227,12 +215,10 @@ class RatExpressionParser(MathExpressionParser):
                     is_unary = False
 
                 if is_unary:
-                    # Для унарного минуса используем искусственный оператор '~'
-                    while (stack and
-                           stack[-1] != '(' and
-                           stack[-1] in self.priority and
-                           self.priority[stack[-1]] >= self.priority['~']):
-                        output.append(stack.pop())
+                    # Для унарного минуса используем искусственный оператор '~'.
+                    # Это префиксный оператор: левого операнда у него нет, поэтому
+                    # из стека ничего не выталкивается (иначе в 2^-(1) оператор ^
+                    # попал бы в выход раньше своего правого операнда).
                     stack.append('~')
                 else:
                     # Обычный бинарный минус
@@ -243,12 +229,15 @@ class RatExpressionParser(MathExpressionParser):
                         output.append(stack.pop())
                     stack.append(token)
 
-            # Любой другой оператор из таблицы приоритетов (+, *, /)
+            # Любой другой оператор из таблицы приоритетов (+, *, /, ^);
+            # для правоассоциативного ^ выталкиваются только более приоритетные
             elif token in self.priority:
                 while (stack and
                        stack[-1] != '(' and
                        stack[-1] in self.priority and
-                       self.priority[stack[-1]] >= self.priority[token]):
+                       (self.priority[stack[-1]] > self.priority[token] or
+                        (self.priority[stack[-1]] == self.priority[token] and
+                         token not in self.right_assoc))):
                     output.append(stack.pop())
                 stack.append(token)
 
@@ -261,6 +250,26 @@ class RatExpressionParser(MathExpressionParser):
 
         return output
 
+    def power(self, base: RationalModule, exponent: RationalModule) -> RationalModule:
+        """
+        base ^ exponent для целого показателя (base не изменяется).
+
+        Числитель и знаменатель возводятся в степень по отдельности;
+        отрицательный показатель - степень обратной дроби.
+        """
+        exponent = exponent._clone().RED_Q_Q()
+        if not exponent.down.is_one():
+            raise ValueError("Показатель степени должен быть целым")
+        k = exponent.up._natural_abs()
+        if exponent.sign() == -1:
+            if base.is_zero():
+                raise ValueError("Деление на ноль")
+            # Обратная дробь: знак переходит к новому числителю
+            base = RationalModule(IntegerModule._from_natural(base.down._clone(), base.sign() == -1),
+                                  base.up._natural_abs())
+        return RationalModule(base.up.POW_ZZ_Z(IntegerModule._from_natural(k, False)),
+                              base.down._clone().POW_NN_N(k))
+
     def evaluate(self, expression: str) -> str:
         """
         Вычисление выражения с рациональными числами.
@@ -269,7 +278,14 @@ class RatExpressionParser(MathExpressionParser):
         2. Постфикс вычисляется, используя стек объектов RationalModule.
         3. Возвращается строковое представление результата (через __str__ у RationalModule)
            либо строка с результатом INT/RED в зависимости от выражения.
+
+        Выражение вида 'выражение mod m' вычисляется в вычетах по модулю m:
+        дробь a/b - вычет a * b^(-1) (см. evaluate_mod).
         """
+        expression, modulus = self.split_modulus(expression)
+        if modulus is not None:
+            return self.evaluate_mod(expression, modulus)
+
         stack = []
         postfix = self.to_postfix(expression)
 
@@ -283,29 +299,23 @@ class RatExpressionParser(MathExpressionParser):
             elif token == '~':
                 operand = stack.pop()
                 # Создаём новый RationalModule с противоположным знаком числителя
-                result = RationalModule(
-                    IntegerModule(
-                        1 - operand.up.b,      # инвертируем бит знака
-                        operand.up.n,
-                        operand.up.A.copy()
-                    ),
-                    NaturalModule(
-                        operand.down.n,
-                        operand.down.A.copy()
-                    )
-                )
+                # (копии числителя и знаменателя за O(1), цифры не копируются)
+                result = RationalModule(operand.up._clone().MUL_ZM_Z(), operand.down._clone())
                 stack.append(result)
 
+            # Возведение в целую степень
+            elif token == '^':
+                exponent = stack.pop()
+                base = stack.pop()
+                stack.append(self.power(base, exponent))
+
             # Бинарные операторы над рациональными
             elif token in ['+', '-', '*', '/']:
                 right = stack.pop()
                 left = stack.pop()
 
                 # Делаем копию левого операнда, чтобы не портить исходный объект
-                left_copy = RationalModule(
-                    IntegerModule(left.up.b, left.up.n, left.up.A.copy()),
-                    NaturalModule(left.down.n, left.down.A.copy())
-                )
+                left_copy = left._clone()
 
                 if token == '+':
                     result = left_copy.ADD_QQ_Q(right)
@@ -0,0 +1,7 @@
+from . import backends
+from . import values
+
+# Арифметический движок и режим значений выбираются один раз на процесс
+# (см. backends.py и values.py)
+backends.use_from_env()
+values.use_from_env()
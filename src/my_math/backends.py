@@ -0,0 +1,143 @@
+"""
+Реестр арифметических движков натуральных и целых чисел.
+
+Движок задаёт, в каком представлении NaturalModule и IntegerModule хранят
+значения и выполняют операции; интерфейс модулей (методы N-1, Z-1, ...) от
+выбора не зависит, поэтому вызывающий код ничего не меняет.
+
+Встроенные движки:
+    auto   - смешанный (по умолчанию): малые числа - int, короткие - массив цифр,
+             длинные - лимбы по основанию 10^9;
+    digits - эталонный: массивы десятичных цифр и исходные алгоритмы над ними
+             (сложение, умножение и деление "в столбик", НОД по Евклиду, НОК) -
+             для сверки результатов остальных движков. Степени, корни, степень
+             по модулю и расширенный НОД исходных версий по цифрам не имеют
+             и в любом движке выполняются в лимбах;
+    limbs  - все числа хранятся в лимбах;
+    native - все числа хранятся как int Python.
+
+Движок выбирается на весь процесс переменной окружения MY_MATH_BACKEND
+(читается при импорте пакета my_math) или вызовом use(name), например:
+    MY_MATH_BACKEND=digits python -m pytest
+"""
+import os
+from contextlib import contextmanager
+
+from .natural_module import NaturalModule
+from .integer_module import IntegerModule
+
+
+ENV_VAR = "MY_MATH_BACKEND"  # переменная окружения с именем движка
+DEFAULT = "auto"  # движок по умолчанию
+
+
+class Backend:
+    """
+    Арифметический движок: правила выбора представления чисел.
+    """
+
+    def __init__(self, name: str, packed_threshold, small_bound, description: str,
+                 reference: bool = False):
+        """
+        Принимает на вход:
+            name: имя движка
+            packed_threshold: длина (в цифрах), начиная с которой числа хранятся в лимбах
+            small_bound: граница, ниже которой числа хранятся как int (None - без границы)
+            description: краткое описание
+            reference: делить и вычислять НОД/НОК исходными алгоритмами по цифрам
+        """
+        self.name = name
+        self.packed_threshold = packed_threshold
+        self.small_bound = small_bound
+        self.description = description
+        self.reference = reference
+
+    def apply(self):
+        """
+        Делает движок текущим для NaturalModule и IntegerModule.
+        """
+        NaturalModule.PACKED_THRESHOLD = self.packed_threshold
+        NaturalModule.SMALL_BOUND = self.small_bound
+        NaturalModule.REFERENCE = self.reference
+        IntegerModule.SMALL_BOUND = self.small_bound
+
+
+_registry = {}
+_current = None
+
+
+def register(backend: Backend):
+    """
+    Добавление движка в реестр (движок с тем же именем заменяется).
+    """
+    _registry[backend.name] = backend
+    return backend
+
+
+def available() -> list:
+    """
+    Имена зарегистрированных движков.
+    """
+    return list(_registry)
+
+
+def get(name: str) -> Backend:
+    """
+    Движок по имени.
+    """
+    if name not in _registry:
+        raise ValueError(f"Неизвестный арифметический движок: {name} "
+                         f"(доступны: {', '.join(_registry)})")
+    return _registry[name]
+
+
+def current() -> str:
+    """
+    Имя текущего движка.
+    """
+    return _current
+
+
+def use(name: str) -> str:
+    """
+    Выбор движка для всего процесса.
+
+    Принимает на вход: name - имя движка
+    Возвращает: имя предыдущего движка
+    """
+    global _current
+    backend = get(name)
+    backend.apply()
+    previous, _current = _current, backend.name
+    return previous
+
+
+@contextmanager
+def using(name: str):
+    """
+    Временный выбор движка (например, в тестах, проверяющих представление чисел).
+    """
+    previous = use(name)
+    try:
+        yield get(name)
+    finally:
+        use(previous)
+
+
+def use_from_env(environ=None) -> str:
+    """
+    Выбор движка по переменной окружения MY_MATH_BACKEND (по умолчанию - auto).
+
+    Возвращает: имя выбранного движка
+    """
+    environ = os.environ if environ is None else environ
+    name = environ.get(ENV_VAR, "").strip() or DEFAULT
+    use(name)
+    return name
+
+
+register(Backend("auto", NaturalModule.PACKED_THRESHOLD, NaturalModule.SMALL_BOUND,
+                 "малые числа - int, короткие - цифры, длинные - лимбы"))
+register(Backend("digits", float("inf"), 0, "массивы десятичных цифр (эталон)", reference=True))
+register(Backend("limbs", 1, 0, "лимбы по основанию 10^9"))
+register(Backend("native", float("inf"), None, "int Python"))
@@ -0,0 +1,192 @@
+from . import limbs
+
+
+class DigitBuffer:
+    """
+    Массив десятичных цифр (от младшей к старшей) с копированием при записи.
+
+    Ведёт себя как list цифр: индексация, срезы, len, итерация, сравнение
+    со списком (A == [0]), append, pop и т.д. Отличия:
+    - copy() выполняется за O(1): копия использует тот же массив, а свой
+      массив заводит только при первой записи;
+    - буфер, построенный по лимбам (from_limbs), хранит их и распаковывает
+      цифры только при первом обращении к цифрам; пока буфер не изменён,
+      limbs возвращает исходные лимбы, и число снова упаковывается без
+      перевода цифр.
+    """
+
+    __slots__ = ("_data", "_limbs", "_shared")
+
+    def __init__(self, data=None):
+        """
+        Принимает на вход: data - список цифр (используется без копирования)
+        или любая последовательность цифр
+        """
+        if data is not None and not isinstance(data, list):
+            data = list(data)
+        self._data = data
+        self._limbs = None  # Лимбы того же значения (пока буфер не изменён)
+        self._shared = False  # Массив _data общий с другим буфером
+
+    @classmethod
+    def from_limbs(cls, L):
+        """
+        Буфер со значением нормализованного массива лимбов L (цифры строятся лениво).
+        """
+        buffer = cls()
+        buffer._limbs = L
+        return buffer
+
+    @property
+    def limbs(self):
+        """
+        Лимбы значения, если буфер построен по лимбам и не изменялся, иначе None.
+        """
+        return self._limbs
+
+    def _digits(self) -> list:
+        """
+        Массив цифр для чтения.
+        """
+        if self._data is None:
+            self._data = limbs.to_digits(self._limbs)
+        return self._data
+
+    def _writable(self) -> list:
+        """
+        Собственный массив цифр для записи (общий массив копируется один раз).
+        """
+        data = self._digits()
+        if self._shared:
+            data = self._data = data.copy()
+            self._shared = False
+        self._limbs = None
+        return data
+
+    def copy(self):
+        """
+        Копия за O(1): массив становится общим до первой записи в любой из копий.
+        """
+        clone = DigitBuffer()
+        clone._data = self._data
+        clone._limbs = self._limbs
+        if self._data is not None:
+            clone._shared = self._shared = True
+        return clone
+
+    def normalize(self):
+        """
+        Удаляет ведущие нули, оставляя минимум одну цифру (пустой буфер
+        становится нулём). Нормализованный буфер не изменяется и не копируется.
+        """
+        data = self._data
+        if data is None or (data and data[-1] != 0) or data == [0]:
+            return self
+        data = self._writable()
+        while len(data) > 1 and data[-1] == 0:
+            data.pop()
+        if not data:
+            data.append(0)
+        return self
+
+    def is_zero(self) -> bool:
+        """
+        Проверка на ноль за O(1) (для нормализованного буфера).
+        """
+        if self._data is None:
+            return limbs.is_zero(self._limbs)
+        return len(self._data) == 1 and self._data[0] == 0
+
+    # Чтение
+
+    def __len__(self):
+        if self._data is None:
+            return limbs.digit_count(self._limbs)
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return self._digits()[index]
+
+    def __iter__(self):
+        return iter(self._digits())
+
+    def __reversed__(self):
+        return reversed(self._digits())
+
+    def __contains__(self, digit):
+        return digit in self._digits()
+
+    def __eq__(self, other):
+        if isinstance(other, DigitBuffer):
+            if self._data is other._data and self._data is not None:
+                return True
+            other = other._digits()
+        elif not isinstance(other, list):
+            return NotImplemented
+        # Разная длина - разные массивы (без распаковки лимбов)
+        if len(self) != len(other):
+            return False
+        return self._digits() == other
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return self._digits() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self._digits()
+
+    def __repr__(self):
+        return repr(self._digits())
+
+    def index(self, *args):
+        return self._digits().index(*args)
+
+    def count(self, digit):
+        return self._digits().count(digit)
+
+    # Запись
+
+    def __setitem__(self, index, value):
+        self._writable()[index] = value
+
+    def __delitem__(self, index):
+        del self._writable()[index]
+
+    def __iadd__(self, other):
+        self._writable().extend(other)
+        return self
+
+    def append(self, digit):
+        self._writable().append(digit)
+
+    def extend(self, digits):
+        self._writable().extend(digits)
+
+    def insert(self, index, digit):
+        self._writable().insert(index, digit)
+
+    def pop(self, index=-1):
+        return self._writable().pop(index)
+
+    def remove(self, digit):
+        self._writable().remove(digit)
+
+    def reverse(self):
+        self._writable().reverse()
+
+    def sort(self, **kwargs):
+        self._writable().sort(**kwargs)
+
+    def clear(self):
+        self._writable().clear()
+
+
+def as_buffer(A):
+    """
+    Массив цифр в виде DigitBuffer (список оборачивается без копирования,
+    None и DigitBuffer возвращаются как есть).
+    """
+    if A is None or isinstance(A, DigitBuffer):
+        return A
+    return DigitBuffer(A)
@@ -0,0 +1,193 @@
+from array import array
+from . import limbs
+from . import multiplication
+
+
+# Порог (в десятичных цифрах делителя и частного), начиная с которого деление
+# выполняется рекурсивным методом Бурникеля-Циглера. Ниже порога и в базе
+# рекурсии - деление "в столбик" (алгоритм D).
+BURNIKEL_ZIEGLER_THRESHOLD = 1500
+
+# Порог в лимбах не меньше MIN_SPLIT_LIMBS: рекурсия делит делитель пополам
+MIN_SPLIT_LIMBS = 2
+
+
+def _divmod_knuth(a, b):
+    """
+    Деление "в столбик" по лимбам - алгоритм D Кнута.
+
+    Принимает на вход: a, b - нормализованные массивы лимбов, len(b) >= 2, a >= b
+    Возвращает: (частное, остаток) - нормализованные массивы лимбов
+
+    Алгоритм:
+    1. Нормализация: a и b умножаются на d = BASE // (старший лимб b + 1),
+       чтобы старший лимб делителя был не меньше BASE / 2.
+    2. Очередной лимб частного оценивается по двум старшим лимбам остатка и
+       старшему лимбу делителя; оценка уточняется по второму лимбу делителя
+       (не более двух уменьшений).
+    3. Из остатка на месте вычитается произведение делителя на оценку; если
+       результат отрицателен (редкий случай), делитель прибавляется обратно.
+    4. Остаток делится на d.
+    """
+    d = limbs.BASE // (b[-1] + 1)
+    u = list(limbs.mul_small(a, d))
+    if len(u) == len(a):
+        u.append(0)
+    v = list(limbs.mul_small(b, d))
+    n = len(v)
+    m = len(u) - n
+    base = limbs.BASE
+    v_top, v_second = v[-1], v[-2]
+    q = [0] * m
+
+    for j in range(m - 1, -1, -1):
+        # Оценка лимба частного по старшим лимбам
+        q_hat, r_hat = divmod(u[j + n] * base + u[j + n - 1], v_top)
+        while q_hat >= base or q_hat * v_second > r_hat * base + u[j + n - 2]:
+            q_hat -= 1
+            r_hat += v_top
+            if r_hat >= base:
+                break
+
+        # Вычитание q_hat * v из u[j .. j + n]
+        carry = 0
+        borrow = 0
+        for i in range(n):
+            carry, low = divmod(q_hat * v[i] + carry, base)
+            t = u[i + j] - low - borrow
+            if t < 0:
+                u[i + j] = t + base
+                borrow = 1
+            else:
+                u[i + j] = t
+                borrow = 0
+        t = u[j + n] - carry - borrow
+
+        if t < 0:
+            # Оценка оказалась на единицу больше: возвращаем делитель
+            q_hat -= 1
+            carry = 0
+            for i in range(n):
+                s = u[i + j] + v[i] + carry
+                if s >= base:
+                    u[i + j] = s - base
+                    carry = 1
+                else:
+                    u[i + j] = s
+                    carry = 0
+            t += carry
+        u[j + n] = t
+        q[j] = q_hat
+
+    remainder, _ = limbs.divmod_small(limbs.normalize(u[:n]), d)
+    return limbs.normalize(q), remainder
+
+
+def _divmod_basecase(a, b):
+    """
+    Деление "в столбик" для любых a и b != 0.
+    """
+    if limbs.compare(a, b) == 1:
+        return array(limbs.TYPECODE, [0]), a
+    if len(b) == 1:
+        q, r = limbs.divmod_small(a, b[0])
+        return q, array(limbs.TYPECODE, [r])
+    return _divmod_knuth(a, b)
+
+
+def _div_3n_2n(a12, a3, b, b1, b2, n: int):
+    """
+    Шаг Бурникеля-Циглера: деление (a12 * BASE^n + a3) на b = b1 * BASE^n + b2.
+
+    Частное (не более n лимбов) оценивается делением a12 на b1, затем
+    уточняется: остаток может стать "отрицательным" не более чем на 2b.
+    """
+    if limbs.compare(limbs.high(a12, n), b1) == 0:
+        # Частное делением a12 на b1 переполнилось бы: берём BASE^n - 1
+        q = limbs.normalize([limbs.BASE - 1] * n)
+        r = limbs.sub(limbs.add(a12, b1), limbs.shift(b1, n))
+    else:
+        q, r = _div_2n_1n(a12, b1, n)
+
+    # r = r * BASE^n + a3 - q * b2 (вычитаемое может оказаться больше)
+    r = limbs.add(limbs.shift(r, n), a3)
+    d = multiplication.mul(q, b2)
+    one = array(limbs.TYPECODE, [1])
+    while limbs.compare(r, d) == 1:
+        q = limbs.sub(q, one)
+        r = limbs.add(r, b)
+    return q, limbs.sub(r, d)
+
+
+def _div_2n_1n(a, b, n: int):
+    """
+    Рекурсивное деление Бурникеля-Циглера числа a < b * BASE^n на b из n лимбов.
+
+    Делитель должен быть нормализован (старший лимб не меньше BASE / 2).
+    Деление сводится к двум делениям 3n/2n половинной длины, каждое из которых
+    стоит одного деления 2n/1n и одного умножения половинной длины.
+    """
+    if len(a) - n <= limbs.limbs_for_digits(BURNIKEL_ZIEGLER_THRESHOLD, MIN_SPLIT_LIMBS):
+        return _divmod_basecase(a, b)
+
+    # При нечётном n домножаем a и b на BASE, чтобы длина делилась пополам
+    pad = n & 1
+    if pad:
+        a = limbs.shift(a, 1)
+        b = limbs.shift(b, 1)
+        n += 1
+
+    half = n >> 1
+    b1, b2 = limbs.high(b, half), limbs.low(b, half)
+    q1, r = _div_3n_2n(limbs.high(a, n), limbs.low(limbs.high(a, half), half), b, b1, b2, half)
+    q2, r = _div_3n_2n(r, limbs.low(a, half), b, b1, b2, half)
+    if pad:
+        r = limbs.high(r, 1)
+    return limbs.add(limbs.shift(q1, half), q2), r
+
+
+def _divmod_burnikel_ziegler(a, b):
+    """
+    Деление Бурникеля-Циглера для a >= b, len(b) >= 2.
+
+    Алгоритм: делитель нормализуется умножением на d (как в алгоритме D),
+    делимое разбивается на блоки по n = len(b) лимбов, и блоки обрабатываются
+    от старшего к младшему делениями 2n/1n; остаток делится на d.
+    """
+    d = limbs.BASE // (b[-1] + 1)
+    b = limbs.mul_small(b, d)
+    a = limbs.mul_small(a, d)
+    n = len(b)
+
+    blocks = [limbs.low(a[i:], n) for i in range(0, len(a), n)]
+    q_blocks = []
+    r = array(limbs.TYPECODE, [0])
+    for block in reversed(blocks):
+        q_block, r = _div_2n_1n(limbs.add(limbs.shift(r, n), block), b, n)
+        q_blocks.append(q_block)
+
+    # Каждый блок частного меньше BASE^n: собираем частное конкатенацией
+    q = []
+    for q_block in reversed(q_blocks):
+        q.extend(q_block)
+        q.extend([0] * (n - len(q_block)))
+    remainder, _ = limbs.divmod_small(r, d)
+    return limbs.normalize(q), remainder
+
+
+def div_mod(a, b):
+    """
+    Частное и остаток от деления чисел в лимбах за один проход.
+
+    Принимает на вход: a, b - нормализованные массивы лимбов, b != 0
+    Возвращает: (частное, остаток) - нормализованные массивы лимбов
+
+    Длинные деления (делитель и частное не короче BURNIKEL_ZIEGLER_THRESHOLD
+    цифр) выполняются методом Бурникеля-Циглера, остальные - алгоритмом D.
+    """
+    if limbs.is_zero(b):
+        raise ZeroDivisionError("Деление на ноль")
+    threshold = limbs.limbs_for_digits(BURNIKEL_ZIEGLER_THRESHOLD, MIN_SPLIT_LIMBS)
+    if len(b) >= threshold and len(a) - len(b) >= threshold:
+        return _divmod_burnikel_ziegler(a, b)
+    return _divmod_basecase(a, b)
@@ -0,0 +1,340 @@
+from array import array
+from . import limbs
+from . import division
+from . import multiplication
+
+
+# Длина (в лимбах), начиная с которой НОД вычисляется методом Лемера.
+# Числа короче переводятся в int и обрабатываются бинарным алгоритмом.
+LEHMER_THRESHOLD = 3
+
+# Порог (в десятичных цифрах), начиная с которого используется субквадратичный
+# half-GCD (Шёнхаге-Мёллер) поверх быстрого умножения
+HGCD_THRESHOLD = 9000
+
+
+def _binary_gcd(x: int, y: int) -> int:
+    """
+    Бинарный алгоритм НОД (Штейна) для коротких чисел: только сдвиги и вычитания.
+    """
+    if x == 0:
+        return y
+    if y == 0:
+        return x
+    # Общая степень двойки
+    shift = ((x | y) & -(x | y)).bit_length() - 1
+    x >>= (x & -x).bit_length() - 1
+    while y:
+        y >>= (y & -y).bit_length() - 1
+        if x > y:
+            x, y = y, x
+        y -= x
+    return x << shift
+
+
+def _lincomb(a, b, x: int, y: int):
+    """
+    Линейная комбинация x * a - y * b за один проход по лимбам.
+
+    Принимает на вход: a, b - массивы лимбов, x, y >= 0 - множители (любой длины),
+    результат должен быть неотрицателен
+    """
+    res = []
+    carry = 0
+    len_b = len(b)
+    for i in range(max(len(a), len_b)):
+        t = carry
+        if i < len(a):
+            t += x * a[i]
+        if i < len_b:
+            t -= y * b[i]
+        carry, low = divmod(t, limbs.BASE)  # для t < 0 перенос отрицателен
+        res.append(low)
+    while carry > 0:
+        carry, low = divmod(carry, limbs.BASE)
+        res.append(low)
+    return limbs.normalize(res)
+
+
+def _apply(a, b, s: int, t: int):
+    """
+    s * a + t * b для коэффициентов разных знаков (один из них может быть нулём).
+    """
+    if s >= 0:
+        return _lincomb(a, b, s, -t)
+    return _lincomb(b, a, t, -s)
+
+
+def _lehmer_step(a, b):
+    """
+    Один пакет шагов Евклида по старшим лимбам (алгоритм L Кнута).
+
+    По двум старшим лимбам a и соответствующим лимбам b строится матрица
+    [[A, B], [C, D]] из нескольких шагов алгоритма Евклида над короткими числами.
+    Шаги принимаются, пока частные для границ интервалов (x + A) / (y + C) и
+    (x + B) / (y + D) совпадают: тогда они совпадают и для полных чисел.
+    Возвращает: (A, B, C, D) или None, если ни одного шага выполнить нельзя
+    """
+    k = len(a)
+    x = a[k - 1] * limbs.BASE + a[k - 2]
+    y = 0
+    if len(b) == k:
+        y = b[k - 1] * limbs.BASE + b[k - 2]
+    elif len(b) == k - 1:
+        y = b[k - 2]
+
+    A, B, C, D = 1, 0, 0, 1
+    while y + C != 0 and y + D != 0:
+        q = (x + A) // (y + C)
+        if q != (x + B) // (y + D):
+            break
+        A, C = C, A - q * C
+        B, D = D, B - q * D
+        x, y = y, x - q * y
+    if B == 0:
+        return None
+    return A, B, C, D
+
+
+# Матрицы 2x2 half-GCD хранятся кортежами (m11, m12, m21, m22, det): элементы -
+# неотрицательные числа в лимбах, det = +-1 - определитель. Матрица M связывает
+# исходную пару с текущей: (a; b) = M * (a'; b'), поэтому НОД у пар общий.
+
+def _identity():
+    """
+    Единичная матрица.
+    """
+    one = array(limbs.TYPECODE, [1])
+    zero = array(limbs.TYPECODE, [0])
+    return one, zero, zero, one, 1
+
+
+def _mat_swap(M):
+    """
+    M * [[0, 1], [1, 0]]: перестановка a' и b'.
+    """
+    m11, m12, m21, m22, det = M
+    return m12, m11, m22, m21, -det
+
+
+def _mat_mul(M, N):
+    """
+    Произведение матриц M * N (восемь длинных умножений).
+    """
+    mul = multiplication.mul
+    return (limbs.add(mul(M[0], N[0]), mul(M[1], N[2])),
+            limbs.add(mul(M[0], N[1]), mul(M[1], N[3])),
+            limbs.add(mul(M[2], N[0]), mul(M[3], N[2])),
+            limbs.add(mul(M[2], N[1]), mul(M[3], N[3])),
+            M[4] * N[4])
+
+
+def _mat_quotient(M, q):
+    """
+    M * [[q, 1], [1, 0]]: один шаг Евклида с частным q (в лимбах).
+    """
+    m11, m12, m21, m22, det = M
+    return (limbs.add(multiplication.mul(m11, q), m12), m11,
+            limbs.add(multiplication.mul(m21, q), m22), m21, -det)
+
+
+def _mat_lehmer(M, step):
+    """
+    M * L^(-1) для матрицы L = [[A, B], [C, D]] пакета Лемера.
+
+    L - произведение матриц [[0, 1], [1, -q]], поэтому обратная к ней
+    [[|D|, |B|], [|C|, |A|]] состоит из неотрицательных элементов.
+    """
+    A, B, C, D = step
+    m11, m12, m21, m22, det = M
+    s11, s12, s21, s22 = abs(D), abs(B), abs(C), abs(A)
+    det_l = A * D - B * C
+    return (_lincomb(m11, m12, s11, -s21), _lincomb(m11, m12, s12, -s22),
+            _lincomb(m21, m22, s11, -s21), _lincomb(m21, m22, s12, -s22),
+            det * det_l)
+
+
+def _apply_low(M, a0, b0, a1, b1, p: int):
+    """
+    Применение M^(-1) к паре a = a0 * BASE^p + a1, b = b0 * BASE^p + b1, где
+    (a0; b0) = M * (a0'; b0') уже приведены (на входе a0', b0').
+
+    M^(-1) = det * [[m22, -m12], [-m21, m11]], поэтому
+    a' = a0' * BASE^p + det * (m22 * a1 - m12 * b1),
+    b' = b0' * BASE^p + det * (m11 * b1 - m21 * a1);
+    умножаются только младшие части.
+    """
+    m11, m12, m21, m22, det = M
+    x, y = multiplication.mul(m22, a1), multiplication.mul(m12, b1)
+    u, v = multiplication.mul(m11, b1), multiplication.mul(m21, a1)
+    if det < 0:
+        x, y = y, x
+        u, v = v, u
+    a = limbs.sub(limbs.add(limbs.shift(a0, p), x), y)
+    b = limbs.sub(limbs.add(limbs.shift(b0, p), u), v)
+    return a, b
+
+
+def _hgcd_base(a, b, s: int):
+    """
+    Базовый случай half-GCD: шаги Евклида (пакетами Лемера), пока следующий
+    остаток не станет меньше BASE^s.
+    """
+    M = _identity()
+    if limbs.compare(a, b) == 1:
+        a, b = b, a
+        M = _mat_swap(M)
+    while True:
+        step = _lehmer_step(a, b) if len(b) >= LEHMER_THRESHOLD else None
+        if step is not None:
+            A, B, C, D = step
+            new_b = _apply(a, b, C, D)
+            # Пакет, уводящий остаток ниже BASE^s, отбрасывается
+            if len(new_b) > s:
+                a, b = _apply(a, b, A, B), new_b
+                M = _mat_lehmer(M, step)
+                continue
+        q, r = division.div_mod(a, b)
+        if len(r) <= s:
+            return M, a, b
+        M = _mat_quotient(M, q)
+        a, b = b, r
+
+
+def _hgcd(a, b):
+    """
+    Half-GCD: приведение пары чисел примерно вдвое.
+
+    Принимает на вход: a, b - нормализованные массивы лимбов (в любом порядке)
+    Возвращает: (M, a', b'), где (a; b) = M * (a'; b'), M - неотрицательная
+    матрица с определителем +-1, a', b' >= BASE^s, s = n // 2 + 1 (n - длина
+    большего числа); None, если меньшее число короче BASE^s
+
+    Алгоритм (рекурсивный, на быстром умножении):
+    1. Half-GCD старших половин даёт матрицу M1; так как приведённые старшие части
+       не меньше BASE^s0, а элементы M1 меньше BASE^s0, M1 годится и для полных
+       чисел: применяем её к младшим частям (числа сокращаются до ~3n/4 лимбов).
+    2. Один полный шаг Евклида.
+    3. Half-GCD старших частей ещё раз (числа сокращаются до ~n/2 лимбов).
+    """
+    n = max(len(a), len(b))
+    s = n // 2 + 1
+    if min(len(a), len(b)) <= s:
+        return None
+    if n * limbs.BASE_DIGITS < HGCD_THRESHOLD:
+        return _hgcd_base(a, b, s)
+
+    M = _identity()
+    p = n // 2
+    r = _hgcd(limbs.high(a, p), limbs.high(b, p))
+    if r is not None:
+        M, a0, b0 = r
+        a, b = _apply_low(M, a0, b0, limbs.low(a, p), limbs.low(b, p), p)
+
+    if limbs.compare(a, b) == 1:
+        a, b = b, a
+        M = _mat_swap(M)
+    q, c = division.div_mod(a, b)
+    if len(c) <= s:
+        return M, a, b
+    M = _mat_quotient(M, q)
+    a, b = b, c
+
+    # Длины: s < len(b) <= len(a) <= 2s - 1, поэтому p >= 1 и s2 + p = s + 1
+    p = 2 * s - len(a)
+    r = _hgcd(limbs.high(a, p), limbs.high(b, p))
+    if r is not None:
+        M2, a0, b0 = r
+        a, b = _apply_low(M2, a0, b0, limbs.low(a, p), limbs.low(b, p), p)
+        M = _mat_mul(M, M2)
+    return M, a, b
+
+
+def gcd(a, b):
+    """
+    НОД чисел в лимбах.
+
+    Принимает на вход: a, b - нормализованные массивы лимбов
+    Возвращает: нормализованный массив лимбов
+
+    Алгоритм Лемера: пока числа длинные, шаги Евклида выполняются пакетами по
+    старшим лимбам, а к полным числам применяется только итоговая матрица 2x2
+    (два прохода умножения на короткие коэффициенты вместо деления на каждом
+    шаге). Если пакет пуст (частное велико), выполняется одно полное деление.
+    Короткие числа добиваются бинарным алгоритмом. Числа длиннее HGCD_THRESHOLD
+    цифр сначала сокращаются субквадратичным half-GCD.
+    """
+    if limbs.compare(a, b) == 1:
+        a, b = b, a
+    while len(b) * limbs.BASE_DIGITS >= HGCD_THRESHOLD:
+        r = _hgcd(a, b)
+        if r is not None:
+            _, a, b = r
+            if limbs.compare(a, b) == 1:
+                a, b = b, a
+        # Полный шаг Евклида гарантирует продвижение
+        _, r = division.div_mod(a, b)
+        a, b = b, r
+    while len(b) >= LEHMER_THRESHOLD:
+        step = _lehmer_step(a, b)
+        if step is None:
+            _, r = division.div_mod(a, b)
+            a, b = b, r
+        else:
+            A, B, C, D = step
+            a, b = _apply(a, b, A, B), _apply(a, b, C, D)
+    if limbs.is_zero(b):
+        return a
+    # b короткое: после одного деления оба числа помещаются в int
+    _, r = division.div_mod(a, b)
+    return limbs.from_int(_binary_gcd(limbs.to_int(b), limbs.to_int(r)))
+
+
+def gcdext(a, b):
+    """
+    Расширенный алгоритм Евклида для чисел в лимбах.
+
+    Принимает на вход: a, b - нормализованные массивы лимбов, a != 0
+    Возвращает: (g, x, y) - НОД и неотрицательные коэффициенты,
+    для которых a * x - b * y = g (при a = 0 таких коэффициентов нет)
+
+    Алгоритм: накапливается матрица M всех шагов (пакетов Лемера, half-GCD для
+    длинных чисел и одиночных делений), так что (a; b) = M * (g; 0). Тогда
+    g = det * (m22 * a - m12 * b); при det = -1 коэффициенты сдвигаются на
+    кратное (b / g, a / g) = (m21, m11), чтобы стать неотрицательными.
+    """
+    if limbs.is_zero(a):
+        raise ValueError("Первое число должно быть ненулевым")
+    M = _identity()
+    if limbs.compare(a, b) == 1:
+        a, b = b, a
+        M = _mat_swap(M)
+    while not limbs.is_zero(b):
+        if len(b) * limbs.BASE_DIGITS >= HGCD_THRESHOLD:
+            r = _hgcd(a, b)
+            if r is not None:
+                M1, a, b = r
+                M = _mat_mul(M, M1)
+                if limbs.compare(a, b) == 1:
+                    a, b = b, a
+                    M = _mat_swap(M)
+        elif len(b) >= LEHMER_THRESHOLD:
+            step = _lehmer_step(a, b)
+            if step is not None:
+                A, B, C, D = step
+                a, b = _apply(a, b, A, B), _apply(a, b, C, D)
+                M = _mat_lehmer(M, step)
+                continue
+        q, r = division.div_mod(a, b)
+        M = _mat_quotient(M, q)
+        a, b = b, r
+
+    m11, m12, m21, m22, det = M
+    if det > 0:
+        return a, m22, m12
+    # x = k * m21 - m22 >= 1, y = k * m11 - m12
+    k, _ = division.div_mod(m22, m21)
+    k = limbs.add(k, array(limbs.TYPECODE, [1]))
+    x = limbs.sub(multiplication.mul(k, m21), m22)
+    y = limbs.sub(multiplication.mul(k, m11), m12)
+    return a, x, y
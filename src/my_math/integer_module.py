@@ -1,11 +1,161 @@
+import math
+from . import values
 from .natural_module import NaturalModule
 
+@values.register
 class IntegerModule:
+    __slots__ = ("b", "_mag")
+
+    # Числа, модуль которых меньше этой границы, хранятся как int Python
+    # (None - граница не задана, все числа хранятся как int)
+    SMALL_BOUND = 2 ** 64
+
+    # Режимы деления со знаком (DIVMOD_ZZ_ZZ): как округляется частное
+    EUCLID = "euclid"  # остаток неотрицателен: 0 <= r < |b| (по умолчанию)
+    FLOOR = "floor"    # частное округляется вниз, знак остатка - знак делителя
+    TRUNC = "trunc"    # частное округляется к нулю, знак остатка - знак делимого
+    CEIL = "ceil"      # частное округляется вверх, знак остатка противоположен знаку делителя
+    DIVISION_MODES = (EUCLID, FLOOR, TRUNC, CEIL)
+
     def __init__(self, b: int, n: int, A: list):
+        """
+        Целое число - знак b и модуль, хранящийся как натуральное число
+        (NaturalModule: массив цифр, лимбы или int). Операции над целыми
+        передают модули в операции натуральных чисел без копирования цифр.
+
+        Число хранится в каноническом виде: в массиве цифр модуля нет ведущих
+        нулей, n == len(A) - 1, у нуля знак плюс (b = 0).
+        """
         self.b = b  # знак числа (1 - минус, 0 - плюс)
-        self.n = n  # номер старшей позиции
-        self.A = A  # массив цифр
+        self._mag = NaturalModule(n, A)  # модуль числа
+        if A is not None:
+            self._normalize()
+
+    @classmethod
+    def _wrap(cls, b: int, magnitude: NaturalModule):
+        """
+        Новое целое число со знаком b и модулем magnitude (натуральное число
+        используется без копирования и становится модулем нового числа).
+        """
+        result = cls.__new__(cls)
+        result.b = b
+        result._mag = magnitude
+        return result._normalize()
+
+    @property
+    def magnitude(self) -> NaturalModule:
+        """
+        Модуль числа - натуральное число, общее с этим целым (без копирования).
+        Для независимой копии используется TRANS_Z_N или ABS_Z_Z.
+        """
+        return self._mag
+
+    @property
+    def A(self):
+        """
+        Массив цифр модуля (DigitBuffer, copy() за O(1)). Для числа,
+        хранящегося как int или в лимбах, строится при первом обращении.
+        """
+        return self._mag.A
+
+    @A.setter
+    def A(self, value):
+        self._mag.A = value
+        self._normalize()
 
+    @property
+    def n(self):
+        return self._mag.n
+
+    @n.setter
+    def n(self, value):
+        self._mag.n = value
+
+    @property
+    def _small(self):
+        """
+        Модуль числа как int, если он хранится как int, иначе None.
+        """
+        return self._mag._small
+
+    def _normalize(self):
+        """
+        Приводит знак к каноническому виду: отрицательного нуля не бывает
+        (модуль нормализует NaturalModule).
+        """
+        if self._mag.is_zero():
+            self.b = 0
+        return self
+
+    def is_zero(self) -> bool:
+        """
+        Проверка на ноль за O(1) (без просмотра цифр).
+        """
+        return self._mag.is_zero()
+
+    def sign(self) -> int:
+        """
+        Знак числа за O(1): 0 - ноль, 1 - положительное, -1 - отрицательное.
+        """
+        if self.is_zero():
+            return 0
+        return -1 if self.b else 1
+
+    def _clone(self):
+        """
+        Новое изменяемое число с тем же значением (модуль копируется
+        за O(1), цифры - при записи).
+        """
+        return IntegerModule._wrap(self.b, self._mag._clone())
+
+    def _key(self):
+        """
+        Значение числа в каноническом виде (знак и модуль) для == и hash.
+        """
+        return self.POZ_Z_D() == -1, self._mag._key()
+
+    def __eq__(self, other):
+        if not isinstance(other, IntegerModule):
+            return NotImplemented
+        return self._key() == other._key()
+
+    # Изменяемое число не хэшируется; ключ словаря - values.frozen(x)
+    __hash__ = None
+
+    def _as_small(self):
+        """
+        Значение числа (со знаком) как int, если модуль меньше SMALL_BOUND, иначе None.
+        """
+        value = self._mag._as_small()
+        if value is None or (self.SMALL_BOUND is not None and value >= self.SMALL_BOUND):
+            return None
+        return -value if self.b else value
+
+    def _small_pair(self, other):
+        """
+        Значения обоих чисел как int, если оба малы, иначе None.
+        """
+        x = self._as_small()
+        if x is None:
+            return None
+        y = other._as_small()
+        if y is None:
+            return None
+        return x, y
+
+    @classmethod
+    def _from_int(cls, value: int):
+        """
+        Новое целое число из int: малый модуль хранится как int, большой - цифрами
+        или в лимбах (как решит NaturalModule).
+        """
+        constant = values.constant(cls, value)
+        if constant is not None:
+            return constant
+        sign = 1 if value < 0 else 0
+        return cls._wrap(sign, NaturalModule(None, None)._set_small(abs(value)))
+
+    @values.value_op
     def ABS_Z_Z(self):
         """
         Овчаренко 4384
@@ -20,22 +170,12 @@ class IntegerModule:
         """
         Овчаренко 4384
 
-        Алгоритм: проверяем, является ли число нулем (все цифры равны 0), затем смотрим знак.
+        Алгоритм: число хранится без ведущих нулей, поэтому ноль определяется
+        за O(1) (см. sign), затем смотрим знак.
         """
-        # Проверяем, является ли число нулем
-        is_zero = True
-        for el in self.A:
-            if el != 0:
-                is_zero = False
-                break
-
-        if is_zero:
-            return 0
-        elif self.b:
-            return -1
-        else:
-            return 1
+        return self.sign()
 
+    @values.value_op
     def MUL_ZM_Z(self):
         """
         Овчаренко 4384
@@ -44,17 +184,11 @@ class IntegerModule:
         Если число было положительным - становится отрицательным и наоборот.
         Если число является нулём - возвращаем само число.
         """
-        # Проверяем, является ли число нулем
-        is_zero = True
-        for el in self.A:
-            if el != 0:
-                is_zero = False
-                break
-
-        if not is_zero:
+        if not self.is_zero():
             self.b = 1 - self.b
         return self
 
+    @values.value_op
     def TRANS_N_Z(self, n: int, A: list):
         """
         Овчаренко 4384
@@ -65,20 +199,21 @@ class IntegerModule:
             A: массив цифр натурального числа
         """
         self.b = 0
-        self.n = n
-        self.A = A
+        self._mag = NaturalModule(n, A)
         return self
 
     def TRANS_Z_N(self) -> NaturalModule:
         """
         Овчаренко 4384
 
-        Алгоритм: проверяем, что число неотрицательное, затем возвращаем его цифровое представление без знака.
+        Алгоритм: проверяем, что число неотрицательное, затем возвращаем копию модуля
+        (за O(1): цифры копируются только при записи).
         """
         if self.b:
             raise ValueError("Отрицательное число не подходит для преобразования в натуральное")
-        return NaturalModule(self.n, self.A)
+        return self._mag._clone()
     
+    @values.value_op
     def ADD_ZZ_Z(self, other):
         """
         Водолазко 4384
@@ -89,58 +224,42 @@ class IntegerModule:
         Принимаемые значения: другое целое число (other)
         Возвращает: результат сложения двух целых чисел
         """
-        # Определяем знаки чисел с помощью функции POZ_Z_D()
-        # POZ_Z_D возвращает: 0 - если число равно нулю, 1 - если положительное, -1 - если отрицательное
-        sign_a = self.POZ_Z_D()  # знак первого числа (self)
-        sign_b = other.POZ_Z_D()  # знак второго числа (other)
-        
-        # Если одно из чисел равно нулю, возвращаем другое число (сложение с нулем)
-        if sign_a == 0:  # если первое число равно нулю
-            return other  # результат сложения равен второму числу
-        if sign_b == 0:  # если второе число равно нулю
-            return self   # результат сложения равен первому числу
-        
-        # Получаем натуральные модули чисел (абсолютные значения)
-        # ABS_Z_Z() - получает модуль целого числа (возвращает целое число без знака)
-        # TRANS_Z_N() - преобразует целое число в натуральное
-        abs_a = self.ABS_Z_Z().TRANS_Z_N()  # модуль первого числа в виде натурального числа
-        abs_b = other.ABS_Z_Z().TRANS_Z_N()  # модуль второго числа в виде натурального числа
-        
-        # Оба числа положительные: выполняем сложение модулей, результат положительный
-        if sign_a == 1 and sign_b == 1:
-            result_abs = abs_a.ADD_NN_N(abs_b)  # складываем модули как натуральные числа
-            return IntegerModule(0, result_abs.n, result_abs.A)  # возвращаем результат с положительным знаком (0)
-        
-        # Оба числа отрицательные: выполняем сложение модулей, результат отрицательный  
-        if sign_a == -1 and sign_b == -1:
-            result_abs = abs_a.ADD_NN_N(abs_b)  # складываем модули как натуральные числа
-            return IntegerModule(1, result_abs.n, result_abs.A)  # возвращаем результат с отрицательным знаком (1)
-        
-        # Числа разных знаков: выполняем вычитание модулей
-        comparison = abs_a.COM_NN_D(abs_b)  # сравниваем модули чисел (0 - равны, 1 - первое меньше, 2 - первое больше)
+        small = self._small_pair(other)
+        if small is not None:
+            return IntegerModule._from_int(small[0] + small[1])
+
+        # Определяем знаки чисел (0 - ноль, 1 - положительное, -1 - отрицательное)
+        sign_a = self.sign()  # знак первого числа (self)
+        sign_b = other.sign()  # знак второго числа (other)
+
+        # Если одно из чисел равно нулю, результат - копия другого числа
+        if sign_a == 0:
+            return other._clone()
+        if sign_b == 0:
+            return self._clone()
+
+        # Операции над модулями выполняются над копией модуля одного из чисел (за O(1)),
+        # модуль второго передаётся как есть: слагаемые не изменяются, цифры не копируются
+
+        # Знаки одинаковые: складываем модули, знак результата - общий знак
+        if sign_a == sign_b:
+            return IntegerModule._wrap(self.b, self._natural_abs().ADD_NN_N(other._mag))
+
+        # Числа разных знаков: из большего модуля вычитаем меньший
+        comparison = self._mag.COM_NN_D(other._mag)  # 0 - равны, 1 - первый меньше, 2 - первый больше
 
-        # Модули равны - результат ноль (положительное и отрицательное число с одинаковым модулем)
+        # Модули равны - результат ноль
         if comparison == 0:
-            return IntegerModule(0, 0, [0])  # возвращаем ноль
-        
-        # Модуль первого числа больше: вычитаем из первого модуля второй модуль
-        elif comparison == 2:
-            result_abs = abs_a.SUB_NN_N(abs_b)  # вычитаем модули: |a| - |b|
-            # Результат имеет знак первого числа
-            if sign_a == 1:  # если первое число положительное, а второе отрицательное
-                return IntegerModule(0, result_abs.n, result_abs.A)  # результат положительный
-            else:  # если первое число отрицательное, а второе положительное
-                return IntegerModule(1, result_abs.n, result_abs.A)  # результат отрицательный
-        
-        # Модуль второго числа больше: вычитаем из второго модуля первый модуль
-        else:  # comparison == 1
-            result_abs = abs_b.SUB_NN_N(abs_a)  # вычитаем модули: |b| - |a|
-            # Результат имеет знак второго числа
-            if sign_b == 1:  # если второе число положительное, а первое отрицательное
-                return IntegerModule(0, result_abs.n, result_abs.A)  # результат положительный
-            else:  # если второе число отрицательное, а первое положительное
-                return IntegerModule(1, result_abs.n, result_abs.A)  # результат отрицательный
+            return IntegerModule(0, 0, [0])
+
+        # Модуль первого числа больше: |a| - |b| со знаком первого числа
+        if comparison == 2:
+            return IntegerModule._wrap(self.b, self._natural_abs().SUB_NN_N(other._mag))
 
+        # Модуль второго числа больше: |b| - |a| со знаком второго числа
+        return IntegerModule._wrap(other.b, other._natural_abs().SUB_NN_N(self._mag))
+
+    @values.value_op
     def SUB_ZZ_Z(self, other):
         """
         Водолазко 4384
@@ -151,10 +270,16 @@ class IntegerModule:
         Принимаемые значения: другое целое число (other)
         Возвращает: результат вычитания (self - other)
         """
-        # Вычитание это сложение с противоположным числом: a - b = a + (-b)
-        negative_other = other.MUL_ZM_Z()  # Получаем -other (умножаем на -1)
+        small = self._small_pair(other)
+        if small is not None:
+            return IntegerModule._from_int(small[0] - small[1])
+
+        # Вычитание это сложение с противоположным числом: a - b = a + (-b);
+        # -b - число с тем же модулем (без копирования) и другим знаком, other не изменяется
+        negative_other = IntegerModule._wrap(1 - other.b, other._mag)
         return self.ADD_ZZ_Z(negative_other)  # Возвращаем self + (-other)
 
+    @values.value_op
     def MUL_ZZ_Z(self, other):
         """
         Водолазко 4384
@@ -165,167 +290,246 @@ class IntegerModule:
         Принимаемые значения: другое целое число (other)
         Возвращает: результат умножения двух целых чисел
         """
-        # Определяем знаки множителей
-        sign_self = self.POZ_Z_D()  # знак первого множителя
-        sign_other = other.POZ_Z_D()  # знак второго множителя
-        
+        small = self._small_pair(other)
+        if small is not None:
+            return IntegerModule._from_int(small[0] * small[1])
+
         # Если одно из чисел равно нулю, результат - ноль (умножение на ноль)
-        if sign_self == 0 or sign_other == 0:
+        if self.is_zero() or other.is_zero():
             return IntegerModule(0, 0, [0])  # возвращаем ноль
-        
-        # Получаем модули чисел (абсолютные значения)
-        # ABS_Z_Z() - получает модуль целого числа (убирает знак)
-        # TRANS_Z_N() - преобразует целое число в натуральное
-        abs_self = (self.ABS_Z_Z()).TRANS_Z_N()  # модуль первого числа
-        abs_other = (other.ABS_Z_Z()).TRANS_Z_N()  # модуль второго числа
-        
-        # Умножаем модули (натуральные числа)
-        abs_self.MUL_NN_N(abs_other)  # умножение натуральных чисел (результат сохраняется в abs_self)
-        abs_result = NaturalModule(abs_self.n, abs_self.A)  # создаем новый объект натурального числа с результатом
-        
-        # Создаем целое число с результатом (пока положительное)
-        result = IntegerModule(0, abs_result.n, abs_result.A)  # создаем целое число с положительным знаком
-        
-        # Определяем знак результата по правилу знаков:
+
+        # Умножаем модули: копия модуля self (за O(1)) умножается на модуль other
+        abs_result = self._natural_abs().MUL_NN_N(other._mag)
+
+        # Знак результата по правилу знаков: минус, если знаки разные
         # (+) * (+) = (+), (-) * (-) = (+), (+) * (-) = (-), (-) * (+) = (-)
-        if (sign_self == -1 and sign_other == 1) or (sign_self == 1 and sign_other == -1):
-            # Если знаки разные, результат отрицательный
-            result = result.MUL_ZM_Z()  # умножаем результат на -1 (меняем знак)
-        
-        return result  # возвращаем итоговый результат
+        return IntegerModule._wrap(self.b ^ other.b, abs_result)
 
-    def DIV_ZZ_Z(self, other):
+    @staticmethod
+    def _rounds_away(mode: str, negative_a: bool, negative_b: bool) -> bool:
+        """
+        Нужно ли при ненулевом остатке увеличить модуль частного на 1 (по сравнению
+        с делением модулей, т.е. округлением к нулю) для режима деления mode.
+        """
+        if mode == IntegerModule.EUCLID:
+            return negative_a
+        if mode == IntegerModule.FLOOR:
+            return negative_a != negative_b
+        if mode == IntegerModule.CEIL:
+            return negative_a == negative_b
+        if mode == IntegerModule.TRUNC:
+            return False
+        raise ValueError(f"Неизвестный режим деления: {mode}")
+
+    @values.value_op
+    def DIVMOD_ZZ_ZZ(self, other, mode: str = EUCLID):
+        """
+        Неполное частное и остаток от деления целых чисел за одно деление модулей.
+
+        Принимаемые значения: другое целое число (other), режим деления mode:
+            EUCLID - остаток неотрицателен: 0 <= остаток < |other| (по умолчанию),
+            FLOOR - частное округляется вниз (остаток со знаком other),
+            TRUNC - частное округляется к нулю (остаток со знаком self),
+            CEIL - частное округляется вверх (остаток со знаком, противоположным other)
+        Возвращает: (частное, остаток) - новые целые числа, для которых
+        self = other * частное + остаток, |остаток| < |other|
+
+        Алгоритм: модули делятся один раз (q0, r0 = |self| divmod |other|). Знак частного -
+        произведение знаков, знак остатка - знак self. Если остаток не ноль и режим требует
+        округления от нуля, модуль частного увеличивается на 1, остаток становится
+        |other| - r0 с противоположным знаком.
+        """
+        if other.POZ_Z_D() == 0:
+            raise Exception("Деление на ноль запрещено")
+        negative_a = self.POZ_Z_D() == -1
+        negative_b = other.POZ_Z_D() == -1
+        away = IntegerModule._rounds_away(mode, negative_a, negative_b)
+
+        small = self._small_pair(other)
+        if small is not None:
+            x, y = small
+            q, r = divmod(abs(x), abs(y))
+            if away and r:
+                q, r = q + 1, abs(y) - r
+                negative_r = not negative_a
+            else:
+                negative_r = negative_a
+            return (IntegerModule._from_int(-q if negative_a != negative_b else q),
+                    IntegerModule._from_int(-r if negative_r else r))
+
+        # Одно натуральное деление модулей даёт и частное, и остаток
+        q, r = self._natural_abs().DIVMOD_NN_NN(other._mag)
+        negative_r = negative_a
+
+        # Округление от нуля: модуль частного увеличивается на 1, остаток дополняется до |other|
+        if away and r.NZER_N_B():
+            q.ADD_1N_N()
+            r = other._natural_abs().SUB_NN_N(r)
+            negative_r = not negative_a
+
+        # Знак частного: минус при разных знаках (у нуля знак снимается при нормализации)
+        q_sign = 1 if negative_a != negative_b else 0
+        return IntegerModule._wrap(q_sign, q), IntegerModule._wrap(1 if negative_r else 0, r)
+
+    @values.value_op
+    def DIV_ZZ_Z(self, other, mode: str = EUCLID):
         """
         Водолазко 4384
         
         Целочисленное деление целых чисел.
         Алгоритм учитывает знаки чисел и правила округления при целочисленном делении.
         
-        Принимаемые значения: другое целое число (other)
+        Принимаемые значения: другое целое число (other), режим деления mode (см. DIVMOD_ZZ_ZZ)
         Возвращает: неполное частное (целочисленный результат деления)
         """
-        # Проверка деления на ноль - основное исключение в арифметике
-        if other.POZ_Z_D() == 0:
-            raise Exception("Деление на ноль запрещено")
-
-        # Определяем знаки делимого и делителя
-        sign_a = self.POZ_Z_D()  # знак делимого (0 - ноль, 1 - положительное, -1 - отрицательное)
-        sign_b = other.POZ_Z_D()  # знак делителя
+        # По умолчанию частное согласовано с неотрицательным остатком MOD_ZZ_Z
+        # (например, -7 / 3 = -3, так как -7 = 3 * (-3) + 2)
+        return self.DIVMOD_ZZ_ZZ(other, mode)[0]
 
-        # Если делимое равно нулю, результат тоже ноль (ноль делится на любое число)
-        if sign_a == 0:
-            return IntegerModule(0, 0, [0])  # возвращаем ноль
-
-        # Получаем натуральные модули чисел (создаем копии, чтобы не изменять исходные объекты)
-        abs_a = NaturalModule(self.n, self.A.copy())  # модуль делимого как натуральное число
-        abs_b = NaturalModule(other.n, other.A.copy())  # модуль делителя как натуральное число
-
-        # Сравниваем модули чисел для определения отношения их величин
-        comparison = abs_a.COM_NN_D(abs_b)  # 0 - модули равны, 1 - первый модуль меньше, 2 - первый модуль больше
-
-        # Если модуль делимого меньше модуля делителя
-        if comparison == 1:
-            # Результат будет 0, 1 или -1 в зависимости от комбинации знаков
-            if sign_a == 1 and sign_b == 1:
-                # Оба положительные: положительное / положительное = 0 (например, 2 / 5 = 0)
-                return IntegerModule(0, 0, [0])  
-            elif sign_a == 1 and sign_b == -1:
-                # Положительное / отрицательное = 0 (например, 2 / -5 = 0)
-                return IntegerModule(1, 0, [0])  
-            elif sign_a == -1 and sign_b == 1:
-                # Отрицательное / положительное = -1 (округление в меньшую сторону, например, -2 / 5 = -1)
-                return IntegerModule(1, 0, [1])  # -1
-            else:  # оба отрицательные
-                # Отрицательное / отрицательное = 1 (округление в большую сторону, например, -2 / -5 = 1)
-                return IntegerModule(0, 0, [1])  # 1
-        else:
-            # Модуль делимого больше или равен модулю делителя
-            # Вычисляем частное модулей (натуральное деление)
-            q0 = NaturalModule(abs_a.n, abs_a.A.copy())  # создаем копию модуля делимого
-            q0.DIV_NN_N(abs_b)  # выполняем натуральное деление: q0 = abs_a // abs_b
-
-            # Вычисляем остаток от деления модулей для проверки точности деления
-            product = NaturalModule(abs_b.n, abs_b.A.copy())  # создаем копию модуля делителя
-            product.MUL_NN_N(q0)  # умножаем делитель на частное: product = abs_b * q0
-            r0 = NaturalModule(abs_a.n, abs_a.A.copy())  # создаем копию модуля делимого
-            r0.SUB_NN_N(product)  # вычисляем остаток: r0 = abs_a - (abs_b * q0)
-
-            # Проверяем, равен ли остаток нулю (деление нацело)
-            is_zero_remainder = (r0.n == 0 and r0.A[0] == 0)
-
-            # Определяем знак результата и корректируем частное в зависимости от комбинации знаков
-            if sign_a == 1 and sign_b == 1:
-                # Оба положительные - результат положительный
-                result_sign = 0  # положительный знак
-                q_result = q0  # частное без изменений
-            elif sign_a == 1 and sign_b == -1:
-                # Делимое положительное, делитель отрицательный - результат отрицательный
-                result_sign = 1  # отрицательный знак
-                q_result = q0  # частное без изменений
-            elif sign_a == -1 and sign_b == 1:
-                # Делимое отрицательное, делитель положительный
-                if is_zero_remainder:
-                    # Деление нацело - результат отрицательный
-                    result_sign = 1  # отрицательный знак
-                    q_result = q0  # частное без изменений
-                else:
-                    # Есть остаток - увеличиваем частное на 1 и делаем отрицательным
-                    # (целочисленное деление с округлением в меньшую сторону)
-                    result_sign = 1  # отрицательный знак
-                    one = NaturalModule(0, [1])  # создаем натуральное число 1
-                    q_result = NaturalModule(q0.n, q0.A.copy())  # создаем копию частного
-                    q_result.ADD_NN_N(one)  # увеличиваем частное на 1: q_result = q0 + 1
-            else:
-                # Оба отрицательные
-                if is_zero_remainder:
-                    # Деление нацело - результат положительный
-                    result_sign = 0  # положительный знак
-                    q_result = q0  # частное без изменений
-                else:
-                    # Есть остаток - увеличиваем частное на 1 и делаем положительным
-                    # (целочисленное деление с округлением в большую сторону)
-                    result_sign = 0  # положительный знак
-                    one = NaturalModule(0, [1])  # создаем натуральное число 1
-                    q_result = NaturalModule(q0.n, q0.A.copy())  # создаем копию частного
-                    q_result.ADD_NN_N(one)  # увеличиваем частное на 1: q_result = q0 + 1
-
-            # Если частное равно нулю, устанавливаем положительный знак
-            # (отрицательный ноль не имеет смысла в целых числах)
-            if q_result.n == 0 and q_result.A[0] == 0:
-                result_sign = 0  # принудительно устанавливаем положительный знак для нуля
-
-            # Возвращаем результат в виде целого числа
-            return IntegerModule(result_sign, q_result.n, q_result.A)
-
-    def MOD_ZZ_Z(self, other):
+    @values.value_op
+    def MOD_ZZ_Z(self, other, mode: str = EUCLID):
         """
         Водолазко 4384
         
         Вычисление остатка от деления целых чисел.
         Основано на формуле: остаток = делимое - (делитель * частное).
         
-        Принимаемые значения: другое целое число (other)
+        Принимаемые значения: другое целое число (other), режим деления mode (см. DIVMOD_ZZ_ZZ)
         Возвращает: остаток от деления self на other
         """
-        # Создаем копию делимого, чтобы не изменять исходный объект
-        a = IntegerModule(self.b, self.n, self.A)
-        
-        # Проверка деления на ноль - основное исключение
-        if other.POZ_Z_D() == 0:
-            raise Exception("Деление на ноль")
+        # Остаток получается тем же делением модулей, что и частное,
+        # без повторного деления и обратного умножения
+        return self.DIVMOD_ZZ_ZZ(other, mode)[1]
+
+    def _natural_abs(self) -> NaturalModule:
+        """
+        Модуль числа - новое натуральное число (исходное число не изменяется,
+        копия модуля за O(1)).
+        """
+        return self._mag._clone()
+
+    @classmethod
+    def _from_natural(cls, natural: NaturalModule, negative: bool):
+        """
+        Новое целое число со знаком negative и модулем natural
+        (натуральное число становится модулем без копирования).
+        """
+        return cls._wrap(1 if negative else 0, natural)
 
-        # Вычисляем неполное частное (целочисленное деление)
-        q = self.DIV_ZZ_Z(other)
+    @values.value_op
+    def POW_ZZ_Z(self, other):
+        """
+        Возведение целого числа в неотрицательную целую степень.
 
-        # Вычисляем произведение делителя на частное: other * q
-        product = other.MUL_ZZ_Z(q)
+        Принимаемые значения: показатель - целое число (other) >= 0
+        Возвращает: новое целое число self^other (0^0 = 1)
+        """
+        if other.POZ_Z_D() == -1:
+            raise ValueError("Показатель степени должен быть неотрицательным")
+        exponent = other._natural_abs()
+        result = self._natural_abs().POW_NN_N(exponent)
+        # Отрицательное основание в нечётной степени даёт отрицательный результат
+        return IntegerModule._from_natural(result, self.POZ_Z_D() == -1 and exponent._to_int() & 1)
+
+    @values.value_op
+    def POWMOD_ZZZ_Z(self, exponent, modulus):
+        """
+        Возведение целого числа в неотрицательную степень по модулю.
 
-        # Вычисляем остаток как разность: self - (other * q)
-        # Формула: remainder = dividend - (divisor * quotient)
-        remainder = a.SUB_ZZ_Z(product)
+        Принимаемые значения: показатель (exponent) >= 0 и модуль (modulus) != 0 - целые числа
+        Возвращает: новое целое число self^exponent mod |modulus| (от 0 до |modulus| - 1),
+        согласованное с MOD_ZZ_Z
+        """
+        if modulus.POZ_Z_D() == 0:
+            raise Exception("Деление на ноль запрещено")
+        if exponent.POZ_Z_D() == -1:
+            raise ValueError("Показатель степени должен быть неотрицательным")
+        e = exponent._natural_abs()
+        m = modulus._natural_abs()
+        r = self._natural_abs().POWMOD_NNN_N(e, m)
+        # (-a)^e = -(a^e) при нечётном e: ненулевой вычет дополняется до модуля
+        if self.POZ_Z_D() == -1 and e._to_int() & 1 and r.NZER_N_B():
+            r = m.SUB_NN_N(r)
+        return IntegerModule._from_natural(r, False)
+
+    @values.value_op
+    def GCF_ZZ_Z(self, other):
+        """
+        НОД целых чисел (без коэффициентов Безу - быстрый путь).
 
-        # Возвращаем остаток от деления
-        return remainder
+        Принимаемые значения: другое целое число (other)
+        Возвращает: новое неотрицательное целое число НОД(|self|, |other|), НОД(0, 0) = 0
+        """
+        small = self._small_pair(other)
+        if small is not None:
+            return IntegerModule._from_int(math.gcd(*small))
+        return IntegerModule._from_natural(self._natural_abs().GCF_NN_N(other._mag), False)
+
+    @values.value_op
+    def GCFEXT_ZZ_ZZZ(self, other):
+        """
+        НОД целых чисел с коэффициентами Безу (расширенный алгоритм Евклида).
+
+        Принимаемые значения: другое целое число (other)
+        Возвращает: (НОД, x, y) - новые целые числа, НОД >= 0 и self * x + other * y = НОД;
+        НОД(0, 0) = 0 с x = y = 0
+
+        Алгоритм: расширенный алгоритм Евклида для модулей (GCFEXT_NN_NNN: пакеты
+        Лемера и half-GCD) даёт |self| * x' - |other| * y' = НОД с x', y' >= 0;
+        знаки коэффициентов берутся из знаков чисел: x = sign(self) * x',
+        y = -sign(other) * y'.
+        """
+        if self.is_zero():
+            # НОД(0, b) = |b| = b * sign(b)
+            g = other._natural_abs()
+            sign = IntegerModule._from_int(other.POZ_Z_D())
+            return IntegerModule._from_natural(g, False), IntegerModule(0, 0, [0]), sign
+        g, x, y = self._natural_abs().GCFEXT_NN_NNN(other._mag)
+        return (IntegerModule._from_natural(g, False),
+                IntegerModule._from_natural(x, self.POZ_Z_D() == -1),
+                IntegerModule._from_natural(y, other.POZ_Z_D() != -1))
+
+    @values.value_op
+    def INVMOD_ZZ_Z(self, modulus):
+        """
+        Обратный элемент по модулю.
+
+        Принимаемые значения: модуль (modulus) != 0 - целое число
+        Возвращает: новое целое число x от 0 до |modulus| - 1, для которого
+        self * x = 1 (mod |modulus|) (по модулю 1 обратный - 0)
+        Исключение: ValueError, если НОД(self, modulus) != 1 и обратного нет
+
+        Алгоритм: вычет self по модулю m = |modulus| и расширенный алгоритм Евклида:
+        a * x - m * y = НОД(a, m) = 1, значит x - обратный к a.
+        """
+        if modulus.POZ_Z_D() == 0:
+            raise Exception("Деление на ноль запрещено")
+        m = modulus._natural_abs()
+        if m.is_one():
+            return IntegerModule(0, 0, [0])
+        a = self.MOD_ZZ_Z(modulus)._mag  # 0 <= a < m
+        if a.is_zero():
+            raise ValueError(f"Обратного элемента нет: НОД({self}, {modulus}) != 1")
+        g, x, _ = a.GCFEXT_NN_NNN(m)
+        if not g.is_one():
+            raise ValueError(f"Обратного элемента нет: НОД({self}, {modulus}) != 1")
+        return IntegerModule._from_natural(x.MOD_NN_N(m), False)
+
+    @classmethod
+    def from_str(cls, s: str):
+        """
+        Целое число из десятичной записи (возможно, с минусом).
+
+        Принимает на вход: s - строка вида '123' или '-123'
+        Возвращает: новое целое число
+        """
+        if len(s) <= 2:
+            constant = values.constant(cls, int(s))
+            if constant is not None:
+                return constant
+        negative = s.startswith('-')
+        magnitude = NaturalModule._parse(s[1:] if negative else s)
+        return cls._wrap(1 if negative else 0, magnitude)
 
     def __str__(self) -> str:
         """
@@ -333,10 +537,12 @@ class IntegerModule:
 
         Метод вывода строкого представления целого числа
         """
-        res = ""
-        if self.b and self.A != [0]:
-            res += "-"
-        for i in self.A[::-1]:
-            res += str(i)
+        sign = "-" if self.b and not self.is_zero() else ""
+        return sign + str(self._mag)
+
 
-        return res
+# Неизменяемые константы (см. values.py)
+IntegerModule.ZERO = values.freeze(IntegerModule(0, 0, [0]))
+IntegerModule.ONE = values.freeze(IntegerModule(0, 0, [1]))
+IntegerModule.TEN = values.freeze(IntegerModule(0, 1, [0, 1]))
+IntegerModule._CONSTANTS = {0: IntegerModule.ZERO, 1: IntegerModule.ONE, 10: IntegerModule.TEN}
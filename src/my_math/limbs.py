@@ -0,0 +1,527 @@
+import decimal
+from array import array
+
+
+# Упакованное представление натуральных чисел: массив "лимбов" по основанию 10^9,
+# от младшего к старшему. Каждый лимб хранит 9 десятичных цифр, поэтому все циклы
+# сложения, вычитания и умножения проходят в 9 раз меньше итераций, чем по цифрам.
+BASE = 10 ** 9  # основание упакованного представления
+BASE_DIGITS = 9  # количество десятичных цифр в одном лимбе
+TYPECODE = 'I'  # беззнаковое 32-битное целое: 10^9 < 2^32
+
+
+def normalize(L):
+    """
+    Удаляет ведущие нулевые лимбы, оставляя минимум один.
+
+    Принимает на вход: массив лимбов (list или array)
+    Возвращает: array('I') без ведущих нулей
+    """
+    end = len(L)
+    while end > 1 and L[end - 1] == 0:
+        end -= 1
+    if end == 0:
+        return array(TYPECODE, [0])
+    if isinstance(L, array) and end == len(L):
+        return L
+    return array(TYPECODE, L[:end])
+
+
+def from_digits(A: list):
+    """
+    Упаковка массива десятичных цифр (от младшей к старшей) в лимбы.
+
+    Принимает на вход: A - массив цифр
+    Возвращает: array('I') лимбов без ведущих нулей
+    """
+    L = []
+    for i in range(0, len(A), BASE_DIGITS):
+        limb = 0
+        # Собираем лимб от старшей цифры группы к младшей
+        for d in reversed(A[i:i + BASE_DIGITS]):
+            limb = limb * 10 + d
+        L.append(limb)
+    return normalize(L)
+
+
+def to_digits(L) -> list:
+    """
+    Распаковка лимбов в массив десятичных цифр (от младшей к старшей).
+
+    Принимает на вход: L - массив лимбов без ведущих нулей
+    Возвращает: list цифр без ведущих нулей (ноль - [0])
+    """
+    A = []
+    # Все лимбы, кроме старшего, дают ровно 9 цифр (с учётом внутренних нулей)
+    for i in range(len(L) - 1):
+        limb = L[i]
+        for _ in range(BASE_DIGITS):
+            A.append(limb % 10)
+            limb //= 10
+    # Старший лимб даёт столько цифр, сколько в нём значащих
+    top = L[-1]
+    while top:
+        A.append(top % 10)
+        top //= 10
+    if not A:
+        A.append(0)
+    while len(A) > 1 and A[-1] == 0:
+        A.pop()
+    return A
+
+
+def from_string(s: str):
+    """
+    Упаковка десятичной записи числа в лимбы.
+
+    Принимает на вход: s - строка из цифр (допускаются ведущие нули)
+    Возвращает: array('I') лимбов без ведущих нулей
+
+    Основание 10^9 - степень десяти, поэтому каждый лимб - это ровно 9 цифр
+    записи: перевод линейный, без деления на степени основания.
+    """
+    L = [int(s[max(end - BASE_DIGITS, 0):end]) for end in range(len(s), 0, -BASE_DIGITS)]
+    return normalize(L)
+
+
+# Число лимбов, до которого int раскладывается на лимбы поочерёдным делением на BASE
+FROM_INT_BASECASE = 32
+
+_base_powers = [BASE]  # BASE^(2^k) для разложения int "разделяй и властвуй"
+
+
+def _base_power(k: int) -> int:
+    """
+    BASE^(2^k) (степени вычисляются один раз).
+    """
+    while len(_base_powers) <= k:
+        _base_powers.append(_base_powers[-1] * _base_powers[-1])
+    return _base_powers[k]
+
+
+def _fill(x: int, k: int, out: list):
+    """
+    Дописывает в out ровно 2^k младших лимбов числа x < BASE^(2^k).
+    """
+    if x == 0:
+        out.extend([0] * (1 << k))
+    elif (1 << k) <= FROM_INT_BASECASE:
+        for _ in range(1 << k):
+            x, low = divmod(x, BASE)
+            out.append(low)
+    else:
+        high, low = divmod(x, _base_power(k - 1))
+        _fill(low, k - 1, out)
+        _fill(high, k - 1, out)
+
+
+# Длина int в битах, начиная с которой from_int переводит число через десятичную
+# запись (_int_to_decimal): деление int в CPython квадратично, умножение decimal - нет
+FROM_INT_DECIMAL_BITS = 100000
+
+# Длина в битах, до которой int переводится в decimal.Decimal напрямую
+_DECIMAL_BASECASE_BITS = 3000
+
+_DECIMAL_CONTEXT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX)
+_two_powers = {}  # 2^w в decimal для разложения int "разделяй и властвуй"
+
+
+def _int_to_decimal(x: int, bits: int):
+    """
+    decimal.Decimal со значением неотрицательного x < 2^bits.
+
+    Число делится пополам по битам (сдвигом, за линейное время), половины
+    переводятся рекурсивно и собираются как старшая * 2^w + младшая в decimal,
+    где умножение длинных чисел субквадратично.
+    """
+    if bits <= _DECIMAL_BASECASE_BITS:
+        return decimal.Decimal(x)
+    w = bits >> 1
+    if w not in _two_powers:
+        _two_powers[w] = _DECIMAL_CONTEXT.power(decimal.Decimal(2), w)
+    high = x >> w
+    low = x - (high << w)
+    return _DECIMAL_CONTEXT.add(_DECIMAL_CONTEXT.multiply(_int_to_decimal(high, bits - w), _two_powers[w]),
+                                _int_to_decimal(low, w))
+
+
+def from_int(x: int):
+    """
+    Упаковка неотрицательного int в лимбы.
+
+    Число делится пополам на BASE^(2^k) (как to_int собирает его из половин);
+    очень длинные числа переводятся через десятичную запись (см. int_to_string),
+    так что перевод не квадратичен по числу лимбов.
+    """
+    if x.bit_length() >= FROM_INT_DECIMAL_BITS:
+        return from_string(int_to_string(x))
+    k = 0
+    while _base_power(k) <= x:
+        k += 1
+    L = []
+    _fill(x, k, L)
+    return normalize(L)
+
+
+def to_int(L) -> int:
+    """
+    Значение числа в лимбах как int.
+    Длинные числа собираются из половин, чтобы работало быстрое умножение int.
+    """
+    if len(L) > 64:
+        half = len(L) // 2
+        return to_int(L[half:]) * BASE ** half + to_int(L[:half])
+    x = 0
+    for i in range(len(L) - 1, -1, -1):
+        x = x * BASE + L[i]
+    return x
+
+
+def int_to_string(x: int) -> str:
+    """
+    Десятичная запись неотрицательного int любой длины.
+    str() отказывается переводить числа длиннее sys.get_int_max_str_digits()
+    (перевод в str квадратичен), такие числа переводятся через decimal делением
+    пополам (_int_to_decimal).
+    """
+    try:
+        return str(x)
+    except ValueError:
+        return str(_int_to_decimal(x, x.bit_length()))
+
+
+def int_from_string(s: str) -> int:
+    """
+    Неотрицательный int из десятичной записи любой длины (см. int_to_string).
+    """
+    try:
+        return int(s)
+    except ValueError:
+        return to_int(from_string(s))
+
+
+def to_string(L) -> str:
+    """
+    Десятичная запись числа, хранящегося в лимбах.
+    """
+    return str(L[-1]) + "".join(f"{L[i]:09d}" for i in range(len(L) - 2, -1, -1))
+
+
+def digit_count(L) -> int:
+    """
+    Количество десятичных цифр числа (для нуля - 1).
+    """
+    return (len(L) - 1) * BASE_DIGITS + len(str(L[-1]))
+
+
+def is_zero(L) -> bool:
+    """
+    Проверка на ноль (массив нормализован).
+    """
+    return len(L) == 1 and L[0] == 0
+
+
+def compare(a, b) -> int:
+    """
+    Сравнение двух чисел в лимбах.
+
+    Возвращает: 2 - если первое больше, 0 - равны, 1 - второе больше
+    (те же коды, что и у NaturalModule.COM_NN_D)
+    """
+    if len(a) != len(b):
+        return 2 if len(a) > len(b) else 1
+    for i in range(len(a) - 1, -1, -1):
+        if a[i] != b[i]:
+            return 2 if a[i] > b[i] else 1
+    return 0
+
+
+def add(a, b):
+    """
+    Сложение чисел в лимбах.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    res = []
+    carry = 0
+    for i in range(len(b)):
+        t = a[i] + b[i] + carry
+        if t >= BASE:
+            res.append(t - BASE)
+            carry = 1
+        else:
+            res.append(t)
+            carry = 0
+    for i in range(len(b), len(a)):
+        t = a[i] + carry
+        if t >= BASE:
+            res.append(t - BASE)
+            carry = 1
+        else:
+            res.append(t)
+            carry = 0
+    if carry:
+        res.append(carry)
+    return array(TYPECODE, res)
+
+
+def sub(a, b):
+    """
+    Вычитание чисел в лимбах.
+    Предполагается: a >= b
+    """
+    res = []
+    borrow = 0
+    for i in range(len(b)):
+        t = a[i] - b[i] - borrow
+        if t < 0:
+            res.append(t + BASE)
+            borrow = 1
+        else:
+            res.append(t)
+            borrow = 0
+    for i in range(len(b), len(a)):
+        t = a[i] - borrow
+        if t < 0:
+            res.append(t + BASE)
+            borrow = 1
+        else:
+            res.append(t)
+            borrow = 0
+    if borrow:
+        raise ValueError("Вычитаемое больше уменьшаемого")
+    return normalize(res)
+
+
+def mul_small(a, d: int):
+    """
+    Умножение числа в лимбах на число 0 <= d < BASE.
+    """
+    if d == 0:
+        return array(TYPECODE, [0])
+    res = []
+    carry = 0
+    for x in a:
+        t = x * d + carry
+        carry, low = divmod(t, BASE)
+        res.append(low)
+    while carry:
+        carry, low = divmod(carry, BASE)
+        res.append(low)
+    return array(TYPECODE, res)
+
+
+def shift(a, k: int):
+    """
+    Умножение числа в лимбах на BASE^k (добавление k младших нулевых лимбов).
+    """
+    if k == 0 or is_zero(a):
+        return a
+    return array(TYPECODE, [0] * k) + a
+
+
+def high(x, k: int):
+    """
+    Старшая часть числа: x // BASE^k (отбрасывание k младших лимбов).
+    """
+    if len(x) <= k:
+        return array(TYPECODE, [0])
+    return x[k:]
+
+
+def low(x, k: int):
+    """
+    Младшая часть числа: x mod BASE^k (k младших лимбов без ведущих нулей).
+    """
+    return normalize(x[:k])
+
+
+def limbs_for_digits(digits: int, minimum: int = 1) -> int:
+    """
+    Перевод порога из десятичных цифр в количество лимбов (не меньше minimum).
+    """
+    return max(minimum, -(-digits // BASE_DIGITS))
+
+
+def mul_pow10(a, k: int):
+    """
+    Умножение числа в лимбах на 10^k.
+    """
+    q, r = divmod(k, BASE_DIGITS)
+    if r:
+        a = mul_small(a, 10 ** r)
+    return shift(a, q)
+
+
+def mul_basecase(a, b) -> list:
+    """
+    Умножение "столбиком" без нормализации: O(len(a) * len(b)) операций над лимбами.
+
+    Принимает на вход: a, b - последовательности лимбов (допускаются ведущие нули)
+    Возвращает: list длины len(a) + len(b)
+
+    Произведения лимбов накапливаются в разрядах результата без переносов
+    (int Python не переполняется), переносы выполняются одним проходом в конце.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    res = [0] * (len(a) + len(b))
+    # Внешний цикл по более короткому множителю
+    for j in range(len(b)):
+        bj = b[j]
+        if bj == 0:
+            continue
+        k = j
+        for ai in a:
+            res[k] += ai * bj
+            k += 1
+    return _carry(res)
+
+
+def mul_low(a, b, n: int):
+    """
+    Младшие n лимбов произведения: a * b mod BASE^n.
+
+    Вычисляются только произведения лимбов a[i] * b[j] с i + j < n -
+    примерно половина работы полного умножения при len(a), len(b) <= n.
+    """
+    res = [0] * n
+    for j in range(min(len(b), n)):
+        bj = b[j]
+        if bj == 0:
+            continue
+        for i in range(min(len(a), n - j)):
+            res[i + j] += a[i] * bj
+    return normalize(_carry(res))
+
+
+def _carry(res: list) -> list:
+    """
+    Перенос переполнений разрядов: каждый элемент приводится к [0, BASE),
+    перенос из старшего разряда отбрасывается (его нет, если длина достаточна).
+    """
+    carry = 0
+    for k in range(len(res)):
+        carry, res[k] = divmod(res[k] + carry, BASE)
+    return res
+
+
+def sqr_basecase(a) -> list:
+    """
+    Возведение в квадрат "столбиком" без нормализации.
+
+    Принимает на вход: a - последовательность лимбов (допускаются ведущие нули)
+    Возвращает: list длины 2 * len(a)
+
+    Каждое попарное произведение a[i] * a[j] (i < j) вычисляется один раз и
+    удваивается, к нему добавляются квадраты a[i]: умножений почти вдвое меньше,
+    чем в mul_basecase.
+    """
+    n = len(a)
+    res = [0] * (2 * n)
+    for i in range(n - 1):
+        ai = a[i]
+        if ai == 0:
+            continue
+        k = 2 * i + 1
+        for j in range(i + 1, n):
+            res[k] += ai * a[j]
+            k += 1
+    for i in range(n):
+        res[2 * i] = 2 * res[2 * i] + a[i] * a[i]
+        res[2 * i + 1] *= 2
+    return _carry(res)
+
+
+def mul_schoolbook(a, b):
+    """
+    Умножение чисел в лимбах "столбиком".
+    """
+    if is_zero(a) or is_zero(b):
+        return array(TYPECODE, [0])
+    return normalize(mul_basecase(a, b))
+
+
+def add_at(res: list, x, offset: int):
+    """
+    Прибавляет x к res, начиная с лимба offset (res изменяется на месте).
+    Предполагается, что в res достаточно старших лимбов для переноса.
+    """
+    carry = 0
+    k = offset
+    for v in x:
+        t = res[k] + v + carry
+        if t >= BASE:
+            res[k] = t - BASE
+            carry = 1
+        else:
+            res[k] = t
+            carry = 0
+        k += 1
+    while carry:
+        t = res[k] + 1
+        if t == BASE:
+            res[k] = 0
+        else:
+            res[k] = t
+            carry = 0
+        k += 1
+
+
+def sub_at(res: list, x, offset: int):
+    """
+    Вычитает x из res, начиная с лимба offset (res изменяется на месте).
+    Предполагается, что результат неотрицателен.
+    """
+    borrow = 0
+    k = offset
+    for v in x:
+        t = res[k] - v - borrow
+        if t < 0:
+            res[k] = t + BASE
+            borrow = 1
+        else:
+            res[k] = t
+            borrow = 0
+        k += 1
+    while borrow:
+        t = res[k] - 1
+        if t < 0:
+            res[k] = t + BASE
+        else:
+            res[k] = t
+            borrow = 0
+        k += 1
+
+
+def strip(x: list) -> list:
+    """
+    Удаляет ведущие нулевые лимбы у списка (на месте), оставляя минимум один.
+    """
+    while len(x) > 1 and x[-1] == 0:
+        x.pop()
+    return x
+
+
+def divmod_small(a, d: int):
+    """
+    Деление числа в лимбах на число 0 < d < BASE.
+
+    Возвращает: (частное в лимбах, остаток int)
+    """
+    res = [0] * len(a)
+    r = 0
+    for i in range(len(a) - 1, -1, -1):
+        t = r * BASE + a[i]
+        res[i], r = divmod(t, d)
+    return normalize(res), r
+
+
+def mod_small(a, d: int) -> int:
+    """
+    Остаток от деления числа в лимбах на int d > 0 (без построения частного).
+    """
+    r = 0
+    for i in range(len(a) - 1, -1, -1):
+        r = (r * BASE + a[i]) % d
+    return r
@@ -0,0 +1,203 @@
+"""
+Арифметика в кольце вычетов Z/mZ с фиксированным модулем.
+
+Modulus один раз вычисляет по модулю m константы редукции и затем выполняет
+сложение, вычитание, умножение, возведение в степень и обращение над вычетами,
+которые всегда хранятся приведёнными (0 <= x < m). Ни одна операция не делит
+на m "в столбик":
+- сложение и вычитание - одно сравнение и не более одного вычитания/сложения m;
+- умножение - произведение и редукция Барретта по предвычисленной обратной
+  величине floor(BASE^(2n) / m) (см. reciprocal.py): два умножения и не более
+  двух вычитаний;
+- степень - скользящее окно; для модуля, взаимно простого с 10, - в форме
+  Монтгомери (см. power.py), иначе с редукцией Барретта.
+
+Модули меньше NaturalModule.SMALL_BOUND обрабатываются встроенными операциями int.
+
+Пример:
+    ring = Modulus(NaturalModule.from_str("1000000007"))
+    x = ring.mul(ring.reduce(a), ring.reduce(b))
+    ring.pow(x, NaturalModule.from_str("65537"))
+"""
+from . import limbs
+from . import multiplication
+from . import power
+from . import gcd
+from .natural_module import NaturalModule
+from .integer_module import IntegerModule
+from .reciprocal import Reciprocal
+
+
+class Modulus:
+    """
+    Модуль m с предвычисленными константами редукции (Барретт и Монтгомери).
+
+    Вычеты - объекты NaturalModule от 0 до m - 1; операции не изменяют
+    аргументы и возвращают новые вычеты.
+    """
+
+    def __init__(self, modulus: NaturalModule, montgomery: bool = True):
+        """
+        Принимает на вход: modulus - натуральное число, отличное от нуля;
+        montgomery - возводить в степень в форме Монтгомери, если m взаимно просто с 10
+        """
+        if modulus.is_zero():
+            raise ZeroDivisionError("Деление на ноль")
+        self.modulus = modulus._clone()
+        self._small = modulus._as_small()
+        self._reciprocal = None
+        self._montgomery = None
+        if self._small is None:
+            m = modulus._get_limbs()
+            self._m = m
+            self._reciprocal = Reciprocal(modulus)  # floor(BASE^(2n) / m) для Барретта
+            if montgomery and m[0] % 2 and m[0] % 5:
+                self._montgomery = power._Montgomery(m)
+
+    def __str__(self):
+        return str(self.modulus)
+
+    # Перевод в вычеты и обратно
+
+    def _residue(self, value) -> NaturalModule:
+        """
+        Новый вычет из int (модуль короткий) или массива лимбов.
+        """
+        if self._small is not None:
+            return NaturalModule(None, None)._set_small(value)
+        return NaturalModule(None, None)._set_limbs(value)
+
+    def reduce(self, number) -> NaturalModule:
+        """
+        Вычет числа по модулю m
+
+        Принимает на вход: натуральное (NaturalModule) или целое (IntegerModule) число
+        Возвращает: новый вычет от 0 до m - 1 (для отрицательного числа - m - (|x| mod m))
+        """
+        negative = isinstance(number, IntegerModule) and number.POZ_Z_D() == -1
+        if isinstance(number, IntegerModule):
+            number = number.magnitude
+        if self._small is not None:
+            value = number._as_small()
+            if value is None:
+                value = limbs.mod_small(number._get_limbs(), self._small)
+            return self._residue(-value % self._small if negative else value % self._small)
+        x = number._get_limbs()
+        if limbs.compare(x, self._m) != 1:
+            x = self._reciprocal._div_mod(x)[1]
+        if negative and not limbs.is_zero(x):
+            x = limbs.sub(self._m, x)
+        return self._residue(x)
+
+    def from_int(self, value: int) -> NaturalModule:
+        """
+        Вычет целого числа Python.
+        """
+        return self.reduce(IntegerModule._from_int(value))
+
+    # Операции над вычетами
+
+    def add(self, x: NaturalModule, y: NaturalModule) -> NaturalModule:
+        """
+        (x + y) mod m: сложение и не более одного вычитания m.
+        """
+        if self._small is not None:
+            return self._residue((x._to_int() + y._to_int()) % self._small)
+        s = limbs.add(x._get_limbs(), y._get_limbs())
+        if limbs.compare(s, self._m) != 1:
+            s = limbs.sub(s, self._m)
+        return self._residue(s)
+
+    def sub(self, x: NaturalModule, y: NaturalModule) -> NaturalModule:
+        """
+        (x - y) mod m: при x < y к разности добавляется m.
+        """
+        if self._small is not None:
+            return self._residue((x._to_int() - y._to_int()) % self._small)
+        a, b = x._get_limbs(), y._get_limbs()
+        if limbs.compare(a, b) == 1:
+            a = limbs.add(a, self._m)
+        return self._residue(limbs.sub(a, b))
+
+    def neg(self, x: NaturalModule) -> NaturalModule:
+        """
+        (-x) mod m.
+        """
+        if self._small is not None:
+            return self._residue(-x._to_int() % self._small)
+        if x.is_zero():
+            return self._residue(x._get_limbs())
+        return self._residue(limbs.sub(self._m, x._get_limbs()))
+
+    def _mul(self, a, b):
+        """
+        Произведение значений вычетов с редукцией Барретта (x * y < m^2 < BASE^(2n)).
+        """
+        return self._reciprocal._reduce(multiplication.mul(a, b))[1]
+
+    def _sqr(self, a):
+        return self._reciprocal._reduce(multiplication.sqr(a))[1]
+
+    def mul(self, x: NaturalModule, y: NaturalModule) -> NaturalModule:
+        """
+        (x * y) mod m: одно умножение и редукция Барретта (ещё два умножения).
+        """
+        if self._small is not None:
+            return self._residue(x._to_int() * y._to_int() % self._small)
+        return self._residue(self._mul(x._get_limbs(), y._get_limbs()))
+
+    def pow(self, x: NaturalModule, exponent) -> NaturalModule:
+        """
+        x^exponent mod m
+
+        Принимает на вход: вычет x и показатель - натуральное число или int >= 0
+        Возвращает: новый вычет (x^0 = 1 mod m)
+
+        Алгоритм: скользящее окно по битам показателя (power._sliding_window)
+        в форме Монтгомери или с редукцией Барретта на каждом шаге.
+        """
+        e = exponent if isinstance(exponent, int) else exponent._to_int()
+        if e < 0:
+            raise ValueError("Показатель степени должен быть неотрицательным")
+        if self._small is not None:
+            return self._residue(pow(x._to_int(), e, self._small))
+        if e == 0:
+            return self.reduce(NaturalModule(0, [1]))
+        a = x._get_limbs()
+        if limbs.is_zero(a):
+            return self._residue(a)
+        mont = self._montgomery
+        if mont is not None:
+            return self._residue(mont.reduce(power._sliding_window(mont.to_form(a), e, mont.mul, mont.sqr)))
+        return self._residue(power._sliding_window(a, e, self._mul, self._sqr))
+
+    def inverse(self, x: NaturalModule) -> NaturalModule:
+        """
+        Обратный вычет: y, для которого x * y = 1 (mod m)
+
+        Исключение: ValueError, если НОД(x, m) != 1 и обратного нет
+        (по модулю 1 обратный - 0)
+        """
+        if self.modulus.is_one():
+            return self.reduce(self.modulus)
+        if self._small is not None:
+            try:
+                return self._residue(pow(x._to_int(), -1, self._small))
+            except ValueError:
+                raise ValueError(f"Обратного элемента нет: НОД({x}, {self}) != 1") from None
+        a = x._get_limbs()
+        if limbs.is_zero(a):
+            raise ValueError(f"Обратного элемента нет: НОД({x}, {self}) != 1")
+        # a * u - m * v = НОД(a, m)
+        g, u, _ = gcd.gcdext(a, self._m)
+        if limbs.compare(g, limbs.from_int(1)) != 0:
+            raise ValueError(f"Обратного элемента нет: НОД({x}, {self}) != 1")
+        if limbs.compare(u, self._m) != 1:
+            u = self._reciprocal._div_mod(u)[1]
+        return self._residue(u)
+
+    def div(self, x: NaturalModule, y: NaturalModule) -> NaturalModule:
+        """
+        x * y^(-1) mod m.
+        """
+        return self.mul(x, self.inverse(y))
@@ -0,0 +1,317 @@
+"""
+Многомодульная арифметика: вычисления по модулю многих простых чисел
+размером в машинное слово с восстановлением результата по китайской теореме
+об остатках (КТО).
+
+Целое число x, для которого |x| < M / 2, где M = p_1 * ... * p_k, однозначно
+задаётся вектором вычетов (x mod p_1, ..., x mod p_k). Сложение, вычитание и
+умножение выполняются покомпонентно над короткими числами (меньше 2^30), так
+что длинные промежуточные результаты (произведения, определители) не строятся;
+длинным остаётся только итог, который собирается один раз.
+
+Перевод числа в вычеты - дерево остатков: число последовательно приводится по
+модулю произведений всё меньших групп простых. Восстановление - дерево
+произведений: x = сумма (r_i * s_i mod p_i) * M / p_i, где s_i = (M / p_i)^(-1)
+mod p_i, и сумма собирается снизу вверх: значение узла = значение левого
+поддерева * произведение правого + значение правого * произведение левого.
+Оба прохода стоят O(M(n) log k) вместо O(n k) при поочерёдной обработке простых.
+
+Пример:
+    basis = multimodular.basis_for_bits(4000)
+    x = ResidueVector.from_number(a, basis).mul(ResidueVector.from_number(b, basis))
+    x.to_integer()  # a * b как IntegerModule (если |a * b| < M / 2)
+"""
+import math
+from . import limbs
+from . import multiplication
+from . import division
+from .natural_module import NaturalModule
+from .integer_module import IntegerModule
+
+
+PRIME_BITS = 30  # простые базиса меньше 2^PRIME_BITS (произведение двух вычетов < 2^60)
+
+# Число лимбов, начиная с которого вычеты считаются деревом остатков,
+# а не отдельным проходом по лимбам для каждого простого
+REMAINDER_TREE_THRESHOLD = 64
+
+
+def _is_prime(n: int) -> bool:
+    """
+    Детерминированный тест Миллера-Рабина для n < 3 215 031 751 (основания 2, 3, 5, 7).
+    """
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7):
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+_primes = []  # таблица простых: по убыванию, начиная с наибольшего меньше 2^PRIME_BITS
+
+
+def primes(count: int) -> list:
+    """
+    Первые count простых таблицы (наибольшие простые меньше 2^PRIME_BITS по убыванию).
+    """
+    candidate = _primes[-1] - 2 if _primes else (1 << PRIME_BITS) - 1
+    while len(_primes) < count:
+        if _is_prime(candidate):
+            _primes.append(candidate)
+        candidate -= 2
+    return _primes[:count]
+
+
+def _product_tree(leaves: list) -> list:
+    """
+    Дерево произведений: уровни от листьев (массивы лимбов) до корня.
+    """
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([multiplication.mul(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                       for i in range(0, len(level), 2)])
+    return levels
+
+
+def _remainders(a, levels: list, moduli: list) -> list:
+    """
+    Дерево остатков: a mod p_i для всех листьев дерева произведений levels.
+    """
+    if len(a) < REMAINDER_TREE_THRESHOLD:
+        return [limbs.mod_small(a, p) for p in moduli]
+    current = [a]
+    for level in reversed(levels[:-1]):
+        # Каждый остаток приводится по модулю произведений двух своих детей
+        current = [division.div_mod(current[i // 2], node)[1] for i, node in enumerate(level)]
+    return [limbs.to_int(r) % p for r, p in zip(current, moduli)]
+
+
+def _bits(L) -> int:
+    """
+    Оценка сверху числа бит в числе из лимбов (BASE < 2^30).
+    """
+    return (len(L) - 1) * 30 + L[-1].bit_length()
+
+
+class PrimeBasis:
+    """
+    Набор простых p_1, ..., p_k с данными для перевода чисел в вычеты и обратно:
+    дерево произведений, M = p_1 * ... * p_k и множители s_i = (M / p_i)^(-1) mod p_i.
+    """
+
+    def __init__(self, moduli: list):
+        self.moduli = list(moduli)
+        self.levels = _product_tree([limbs.from_int(p) for p in self.moduli])
+        self.M = self.levels[-1][0]
+        self.half = limbs.normalize(limbs.divmod_small(self.M, 2)[0])  # M // 2
+        # (M / p_i) mod p_i = (M mod p_i^2) / p_i: остатки M по дереву квадратов
+        squares = [p * p for p in self.moduli]
+        square_levels = _product_tree([limbs.from_int(q) for q in squares])
+        cofactors = [r // p for r, p in zip(_remainders(self.M, square_levels, squares), self.moduli)]
+        self.inverses = [pow(c, -1, p) for c, p in zip(cofactors, self.moduli)]
+
+    def __len__(self):
+        return len(self.moduli)
+
+    @property
+    def bits(self) -> int:
+        """
+        Сколько бит со знаком представимо: |x| < 2^bits <= M / 2.
+        """
+        return limbs.to_int(self.M).bit_length() - 2
+
+    def reduce(self, a) -> list:
+        """
+        Вычеты натурального числа a (массив лимбов) по модулям базиса.
+        """
+        return _remainders(a, self.levels, self.moduli)
+
+    def combine(self, residues: list):
+        """
+        КТО: число 0 <= x < M (массив лимбов) с заданными вычетами.
+        """
+        level = [limbs.from_int(r * s % p) for r, s, p in zip(residues, self.inverses, self.moduli)]
+        for products in self.levels[:-1]:
+            combined = []
+            for i in range(0, len(level), 2):
+                if i + 1 < len(level):
+                    # value(левое) * P(правое) + value(правое) * P(левое)
+                    combined.append(limbs.add(multiplication.mul(level[i], products[i + 1]),
+                                              multiplication.mul(level[i + 1], products[i])))
+                else:
+                    combined.append(level[i])
+            level = combined
+        # Сумма меньше k * M: одно деление приводит её в [0, M)
+        return division.div_mod(level[0], self.M)[1]
+
+
+_bases = {}  # базисы по числу простых
+
+
+def basis(count: int) -> PrimeBasis:
+    """
+    Базис из count первых простых таблицы (строится один раз).
+    """
+    if count not in _bases:
+        _bases[count] = PrimeBasis(primes(count))
+    return _bases[count]
+
+
+def basis_for_bits(bits: int) -> PrimeBasis:
+    """
+    Наименьший базис, в котором представимы целые числа |x| < 2^bits.
+    Каждое простое таблицы больше 2^(PRIME_BITS - 1).
+    """
+    return basis(max(1, math.ceil((bits + 2) / (PRIME_BITS - 1))))
+
+
+class ResidueVector:
+    """
+    Целое число, заданное вычетами по модулям простых базиса.
+
+    Операции покомпонентные и возвращают новые векторы; результат верен,
+    пока модуль точного значения меньше M / 2 (см. PrimeBasis.bits).
+    """
+    __slots__ = ("basis", "residues")
+
+    def __init__(self, basis: PrimeBasis, residues: list):
+        self.basis = basis
+        self.residues = residues
+
+    @classmethod
+    def from_number(cls, number, basis: PrimeBasis):
+        """
+        Вектор вычетов натурального (NaturalModule) или целого (IntegerModule) числа.
+        """
+        if isinstance(number, IntegerModule):
+            residues = basis.reduce(number.magnitude._get_limbs())
+            if number.POZ_Z_D() == -1:
+                residues = [(p - r) % p for r, p in zip(residues, basis.moduli)]
+            return cls(basis, residues)
+        return cls(basis, basis.reduce(number._get_limbs()))
+
+    @classmethod
+    def from_int(cls, value: int, basis: PrimeBasis):
+        return cls(basis, [value % p for p in basis.moduli])
+
+    def _check(self, other):
+        if other.basis is not self.basis:
+            raise ValueError("Векторы вычетов заданы в разных базисах")
+
+    def add(self, other):
+        self._check(other)
+        return ResidueVector(self.basis, [(x + y) % p for x, y, p in
+                                          zip(self.residues, other.residues, self.basis.moduli)])
+
+    def sub(self, other):
+        self._check(other)
+        return ResidueVector(self.basis, [(x - y) % p for x, y, p in
+                                          zip(self.residues, other.residues, self.basis.moduli)])
+
+    def mul(self, other):
+        self._check(other)
+        return ResidueVector(self.basis, [x * y % p for x, y, p in
+                                          zip(self.residues, other.residues, self.basis.moduli)])
+
+    def neg(self):
+        return ResidueVector(self.basis, [(p - x) % p for x, p in zip(self.residues, self.basis.moduli)])
+
+    def pow(self, e: int):
+        if e < 0:
+            raise ValueError("Показатель степени должен быть неотрицательным")
+        return ResidueVector(self.basis, [pow(x, e, p) for x, p in zip(self.residues, self.basis.moduli)])
+
+    def to_natural(self) -> NaturalModule:
+        """
+        Восстановление неотрицательного значения 0 <= x < M.
+        """
+        return NaturalModule(None, None)._set_limbs(self.basis.combine(self.residues))
+
+    def to_integer(self) -> IntegerModule:
+        """
+        Восстановление значения со знаком из симметричного диапазона -M/2 < x <= M/2.
+        """
+        x = self.basis.combine(self.residues)
+        if limbs.compare(x, self.basis.half) == 2:
+            x = limbs.sub(self.basis.M, x)
+            return IntegerModule._from_natural(NaturalModule(None, None)._set_limbs(x), True)
+        return IntegerModule._from_natural(NaturalModule(None, None)._set_limbs(x), False)
+
+
+def _number_bits(number) -> int:
+    magnitude = number.magnitude if isinstance(number, IntegerModule) else number
+    return _bits(magnitude._get_limbs())
+
+
+def product(numbers: list) -> IntegerModule:
+    """
+    Произведение целых или натуральных чисел через вычеты: числа переводятся
+    в вычеты, перемножаются покомпонентно и результат собирается один раз.
+    """
+    bits = sum(_number_bits(x) for x in numbers)
+    b = basis_for_bits(bits)
+    result = ResidueVector.from_int(1, b)
+    for x in numbers:
+        result = result.mul(ResidueVector.from_number(x, b))
+    return result.to_integer()
+
+
+def _det_mod(matrix: list, p: int) -> int:
+    """
+    Определитель матрицы вычетов по простому модулю p (метод Гаусса).
+    """
+    a = [row[:] for row in matrix]
+    n = len(a)
+    det = 1
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if a[r][col]), None)
+        if pivot is None:
+            return 0
+        if pivot != col:
+            a[col], a[pivot] = a[pivot], a[col]
+            det = -det
+        det = det * a[col][col] % p
+        inv = pow(a[col][col], -1, p)
+        for r in range(col + 1, n):
+            factor = a[r][col] * inv % p
+            if factor:
+                row, base = a[r], a[col]
+                for c in range(col, n):
+                    row[c] = (row[c] - factor * base[c]) % p
+    return det % p
+
+
+def determinant(matrix: list) -> IntegerModule:
+    """
+    Определитель квадратной матрицы целых чисел (IntegerModule) без дробей и
+    длинных промежуточных чисел: метод Гаусса по модулю каждого простого базиса,
+    число простых - по оценке Адамара |det| <= прод. ||строка_i||.
+    """
+    n = len(matrix)
+    if n == 0:
+        return IntegerModule(0, 0, [1])
+    if any(len(row) != n for row in matrix):
+        raise ValueError("Матрица должна быть квадратной")
+    # ||строка|| <= sqrt(n) * max|a_ij|
+    bits = sum(max(_number_bits(x) for x in row) for row in matrix) + math.ceil(n * math.log2(n) / 2) + 1
+    b = basis_for_bits(bits)
+    columns = [[ResidueVector.from_number(x, b).residues for x in row] for row in matrix]
+    residues = [_det_mod([[entry[i] for entry in row] for row in columns], p)
+                for i, p in enumerate(b.moduli)]
+    return ResidueVector(b, residues).to_integer()
@@ -0,0 +1,401 @@
+from array import array
+from . import limbs
+
+
+# Пороги переключения алгоритмов умножения. Значения по умолчанию подобраны
+# для CPython 3.11; для конкретной машины их можно откалибровать командой
+# python -m my_math.tuning (из каталога src).
+
+# Порог (в десятичных цифрах более короткого множителя), начиная с которого
+# умножение выполняется методом Карацубы. Ниже порога - умножение "столбиком".
+KARATSUBA_THRESHOLD = 576
+
+# Порог (в десятичных цифрах более короткого множителя) для метода Тоома-Кука (Toom-3).
+# Toom-3 применяется к операндам, длины которых отличаются не более чем вдвое.
+TOOM3_THRESHOLD = 2304
+
+# Порог (в десятичных цифрах более короткого множителя) для умножения через
+# теоретико-числовое преобразование (NTT) - верхний уровень умножения.
+NTT_THRESHOLD = 12000
+
+# Простые числа вида c * 2^k + 1 с первообразным корнем 3 для NTT.
+# Их произведение (~7.9 * 10^25) больше любого коэффициента свёртки
+# n * (10^9)^2 при n <= 2^23, поэтому восстановление по КТО точное.
+NTT_PRIMES = (998244353, 167772161, 469762049)
+NTT_ROOT = 3
+NTT_MAX_LOG = 23  # длиннее 2^NTT_MAX_LOG лимбов произведение делится на части
+
+# Пороги в лимбах не меньше MIN_SPLIT_LIMBS: на более коротких операндах
+# рекурсия Карацубы и Toom-3 не уменьшает их длину
+MIN_SPLIT_LIMBS = 4
+
+# Обратный к 3 элемент по модулю BASE: 3 * INV3 = 2 * 10^9 + 1
+INV3 = 666666667
+
+
+def _add_lists(x, y) -> list:
+    """
+    Сумма двух последовательностей лимбов (без нормализации).
+    """
+    if len(x) < len(y):
+        x, y = y, x
+    res = list(x)
+    res.append(0)
+    limbs.add_at(res, y, 0)
+    return res
+
+
+def _karatsuba(a, b) -> list:
+    """
+    Рекурсивное умножение Карацубы.
+
+    Принимает на вход: a, b - списки лимбов, len(a) >= len(b)
+    Возвращает: list длины len(a) + len(b)
+
+    Алгоритм: a = a1 * B^m + a0, b = b1 * B^m + b0, тогда
+    a * b = z2 * B^2m + (z1 - z2 - z0) * B^m + z0, где
+    z0 = a0 * b0, z2 = a1 * b1, z1 = (a0 + a1) * (b0 + b1) - три умножения вместо четырёх.
+    Если a и b - один и тот же список, все три умножения - возведения в квадрат.
+    """
+    la, lb = len(a), len(b)
+    square = a is b
+    if lb < limbs.limbs_for_digits(KARATSUBA_THRESHOLD, MIN_SPLIT_LIMBS):
+        return limbs.sqr_basecase(a) if square else limbs.mul_basecase(a, b)
+
+    m = (la + 1) // 2
+    res = [0] * (la + lb + 1)
+
+    # Сильно несимметричный случай: b целиком помещается в младшую половину.
+    # Умножаем b на куски a длины lb и складываем со сдвигом.
+    if lb <= m:
+        for start in range(0, la, lb):
+            part = a[start:start + lb]
+            prod = _mul_lists(part, b)
+            limbs.add_at(res, prod, start)
+        res.pop()
+        return res
+
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = (a0, a1) if square else (b[:m], b[m:])
+
+    z0 = _mul_lists(a0, b0)
+    z2 = _mul_lists(a1, b1)
+    s = _add_lists(a0, a1)
+    z1 = _mul_lists(s, s if square else _add_lists(b0, b1))
+
+    # z1 = (a0 + a1)(b0 + b1) - z0 - z2
+    limbs.sub_at(z1, z0, 0)
+    limbs.sub_at(z1, z2, 0)
+
+    limbs.add_at(res, z0, 0)
+    limbs.add_at(res, limbs.strip(z1), m)
+    limbs.add_at(res, limbs.strip(z2), 2 * m)
+    res.pop()
+    return res
+
+
+def _compare_lists(x, y) -> int:
+    """
+    Сравнение двух списков лимбов (ведущие нули допускаются).
+
+    Возвращает: 1 - первое больше, 0 - равны, -1 - второе больше
+    """
+    lx, ly = len(x), len(y)
+    while lx > 0 and x[lx - 1] == 0:
+        lx -= 1
+    while ly > 0 and y[ly - 1] == 0:
+        ly -= 1
+    if lx != ly:
+        return 1 if lx > ly else -1
+    for i in range(lx - 1, -1, -1):
+        if x[i] != y[i]:
+            return 1 if x[i] > y[i] else -1
+    return 0
+
+
+def _sub_lists(x, y) -> list:
+    """
+    Разность двух последовательностей лимбов, x >= y (без нормализации).
+    """
+    res = list(x)
+    limbs.sub_at(res, limbs.strip(list(y)), 0)
+    return res
+
+
+def _signed_add(sx: bool, x, sy: bool, y):
+    """
+    Сумма чисел со знаком, заданных парами (знак, модуль).
+    Знак: True - отрицательное число.
+    """
+    if sx == sy:
+        return sx, _add_lists(x, y)
+    if _compare_lists(x, y) >= 0:
+        return sx, _sub_lists(x, y)
+    return sy, _sub_lists(y, x)
+
+
+def _signed_sub(sx: bool, x, sy: bool, y):
+    """
+    Разность чисел со знаком, заданных парами (знак, модуль).
+    """
+    return _signed_add(sx, x, not sy, y)
+
+
+def _halve(x) -> list:
+    """
+    Точное деление на 2 (x чётно).
+    """
+    res = [0] * len(x)
+    r = 0
+    for i in range(len(x) - 1, -1, -1):
+        t = r * limbs.BASE + x[i]
+        res[i] = t >> 1
+        r = t & 1
+    return res
+
+
+def _divexact_by3(x) -> list:
+    """
+    Точное деление на 3 (x делится на 3) без деления лимбов.
+
+    Алгоритм: идём от младшего лимба к старшему; очередной лимб частного
+    однозначно определяется умножением на обратный к 3 элемент по модулю BASE,
+    а перенос - разницей между q * 3 и текущим лимбом делимого.
+    """
+    res = []
+    carry = 0
+    for v in x:
+        t = v - carry
+        q = (t * INV3) % limbs.BASE
+        carry = (q * 3 - t) // limbs.BASE
+        res.append(q)
+    return res
+
+
+def _toom3(a, b) -> list:
+    """
+    Умножение Тоома-Кука (Toom-3).
+
+    Принимает на вход: a, b - списки лимбов, len(a) >= len(b) > 2/3 * len(a)
+    Возвращает: list длины len(a) + len(b)
+
+    Алгоритм: числа разбиваются на три части по k лимбов и рассматриваются как
+    многочлены второй степени от B^k. Произведение (многочлен четвёртой степени)
+    вычисляется в точках 0, 1, -1, -2, бесконечность (пять умножений вместо девяти)
+    и восстанавливается интерполяцией Бодрато с точным делением на 2 и 3.
+    Если a и b - один и тот же список, вычисляются пять квадратов.
+    """
+    la, lb = len(a), len(b)
+    square = a is b
+    k = (la + 2) // 3
+    a0, a1, a2 = a[:k], a[k:2 * k], a[2 * k:]
+    b0, b1, b2 = (a0, a1, a2) if square else (b[:k], b[k:2 * k], b[2 * k:] or [0])
+
+    def evaluate(x0, x1, x2):
+        # Значения многочлена x0 + x1*t + x2*t^2 в точках 1, -1, -2
+        t = _add_lists(x0, x2)
+        v1 = _add_lists(t, x1)
+        sm1, vm1 = _signed_sub(False, t, False, x1)
+        # p(-2) = 2 * (p(-1) + x2) - x0
+        sm2, vm2 = _signed_add(sm1, vm1, False, x2)
+        vm2 = _add_lists(vm2, vm2)
+        sm2, vm2 = _signed_sub(sm2, vm2, False, x0)
+        return limbs.strip(v1), (sm1, limbs.strip(vm1)), (sm2, limbs.strip(vm2))
+
+    p1, (sp_m1, p_m1), (sp_m2, p_m2) = evaluate(a0, a1, a2)
+    if square:
+        q1, (sq_m1, q_m1), (sq_m2, q_m2) = p1, (sp_m1, p_m1), (sp_m2, p_m2)
+    else:
+        q1, (sq_m1, q_m1), (sq_m2, q_m2) = evaluate(b0, b1, b2)
+
+    # Пять поточечных умножений
+    r0 = _mul_lists(a0, b0)
+    r1 = _mul_lists(p1, q1)
+    s_m1, r_m1 = sp_m1 != sq_m1, _mul_lists(p_m1, q_m1)
+    s_m2, r_m2 = sp_m2 != sq_m2, _mul_lists(p_m2, q_m2)
+    r_inf = _mul_lists(a2, b2)
+
+    # Интерполяция (последовательность Бодрато)
+    s3, c3 = _signed_sub(s_m2, r_m2, False, r1)
+    c3 = _divexact_by3(c3)                              # c3 = (r(-2) - r(1)) / 3
+    s1, c1 = _signed_sub(False, r1, s_m1, r_m1)
+    c1 = _halve(c1)                                     # c1 = (r(1) - r(-1)) / 2
+    s2, c2 = _signed_sub(s_m1, r_m1, False, r0)         # c2 = r(-1) - r(0)
+    s3, c3 = _signed_sub(s2, c2, s3, c3)
+    c3 = _halve(c3)
+    s3, c3 = _signed_add(s3, c3, False, _add_lists(r_inf, r_inf))  # c3 = (c2 - c3) / 2 + 2 r(inf)
+    s2, c2 = _signed_add(s2, c2, s1, c1)
+    s2, c2 = _signed_sub(s2, c2, False, r_inf)          # c2 = c2 + c1 - r(inf)
+    s1, c1 = _signed_sub(s1, c1, s3, c3)                # c1 = c1 - c3
+
+    # Все коэффициенты произведения неотрицательны: собираем результат со сдвигами
+    res = [0] * (la + lb + 2)
+    for offset, coef in ((0, r0), (k, c1), (2 * k, c2), (3 * k, c3), (4 * k, r_inf)):
+        limbs.add_at(res, limbs.strip(coef), offset)
+    del res[la + lb:]
+    return res
+
+
+def _ntt_roots(p: int, h: int, inverse: bool) -> list:
+    """
+    Степени корня из единицы порядка 2h по модулю p: w^0, ..., w^(h-1).
+    """
+    w = pow(NTT_ROOT, (p - 1) // (2 * h), p)
+    if inverse:
+        w = pow(w, p - 2, p)
+    roots = [1] * h
+    for j in range(1, h):
+        roots[j] = roots[j - 1] * w % p
+    return roots
+
+
+def _ntt(a: list, p: int, inverse: bool):
+    """
+    Теоретико-числовое преобразование длины 2^k по модулю p (на месте).
+
+    Прямое преобразование - схема Джентльмена-Сэнди (результат в бит-реверсном
+    порядке), обратное - схема Кули-Тьюки (вход в бит-реверсном порядке),
+    поэтому перестановка элементов не нужна. Бабочки одного уровня выполняются
+    срезами: либо по блокам, либо по позициям внутри блока - смотря где
+    итераций меньше.
+    """
+    n = len(a)
+    h = n // 2 if not inverse else 1
+    while 1 <= h < n:
+        roots = _ntt_roots(p, h, inverse)
+        step = 2 * h
+        if h >= n // step:
+            # Мало блоков: обрабатываем каждый блок целиком
+            for i in range(0, n, step):
+                lo = a[i:i + h]
+                hi = a[i + h:i + step]
+                if not inverse:
+                    a[i:i + h] = [(x + y) % p for x, y in zip(lo, hi)]
+                    a[i + h:i + step] = [(x - y) * w % p for x, y, w in zip(lo, hi, roots)]
+                else:
+                    hi = [y * w % p for y, w in zip(hi, roots)]
+                    a[i:i + h] = [(x + y) % p for x, y in zip(lo, hi)]
+                    a[i + h:i + step] = [(x - y) % p for x, y in zip(lo, hi)]
+        else:
+            # Много коротких блоков: обрабатываем j-е позиции всех блоков сразу
+            for j in range(h):
+                w = roots[j]
+                lo = a[j::step]
+                hi = a[j + h::step]
+                if not inverse:
+                    a[j::step] = [(x + y) % p for x, y in zip(lo, hi)]
+                    a[j + h::step] = [(x - y) * w % p for x, y in zip(lo, hi)]
+                else:
+                    hi = [y * w % p for y in hi]
+                    a[j::step] = [(x + y) % p for x, y in zip(lo, hi)]
+                    a[j + h::step] = [(x - y) % p for x, y in zip(lo, hi)]
+        h = h // 2 if not inverse else h * 2
+
+
+def _ntt_convolution(a, b, p: int, size: int) -> list:
+    """
+    Циклическая свёртка a и b по модулю p длины size
+    (для квадрата, когда a и b - один объект, прямое преобразование одно).
+    """
+    fa = list(a) + [0] * (size - len(a))
+    _ntt(fa, p, False)
+    if b is a:
+        fb = fa
+    else:
+        fb = list(b) + [0] * (size - len(b))
+        _ntt(fb, p, False)
+    fc = [x * y % p for x, y in zip(fa, fb)]
+    _ntt(fc, p, True)
+    inv_size = pow(size, p - 2, p)
+    return [x * inv_size % p for x in fc]
+
+
+def _mul_ntt(a, b) -> list:
+    """
+    Умножение через NTT по трём простым модулям с восстановлением по КТО.
+
+    Принимает на вход: a, b - списки лимбов
+    Возвращает: list длины len(a) + len(b)
+
+    Алгоритм: лимбы рассматриваются как коэффициенты многочленов, свёртка
+    вычисляется точно по каждому модулю, коэффициенты восстанавливаются
+    алгоритмом Гарнера (все вычисления целочисленные, без округлений),
+    затем выполняются переносы по основанию BASE.
+    """
+    la, lb = len(a), len(b)
+    size = 1
+    while size < la + lb - 1:
+        size *= 2
+    if size > 1 << NTT_MAX_LOG:
+        # _mul_lists не передаёт сюда такие операнды (см. NTT_MAX_LOG)
+        raise ValueError("Слишком длинные операнды для NTT")
+
+    p1, p2, p3 = NTT_PRIMES
+    c1 = _ntt_convolution(a, b, p1, size)
+    c2 = _ntt_convolution(a, b, p2, size)
+    c3 = _ntt_convolution(a, b, p3, size)
+
+    # Алгоритм Гарнера: x = x1 + x2 * p1 + x3 * p1 * p2
+    inv_p1_p2 = pow(p1, p2 - 2, p2)
+    inv_p1p2_p3 = pow(p1 * p2 % p3, p3 - 2, p3)
+    p1p2 = p1 * p2
+    res = []
+    carry = 0
+    for i in range(la + lb - 1):
+        x1 = c1[i]
+        x2 = (c2[i] - x1) * inv_p1_p2 % p2
+        x3 = (c3[i] - x1 - x2 * p1) * inv_p1p2_p3 % p3
+        carry, low = divmod(x1 + x2 * p1 + x3 * p1p2 + carry, limbs.BASE)
+        res.append(low)
+    res.append(carry)
+    return res
+
+
+def _mul_lists(a, b) -> list:
+    """
+    Выбор алгоритма умножения по размеру операндов (списки лимбов, без нормализации).
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    lb = len(b)
+    if lb >= limbs.limbs_for_digits(NTT_THRESHOLD, MIN_SPLIT_LIMBS):
+        if len(a) + lb - 1 <= 1 << NTT_MAX_LOG:
+            return _mul_ntt(a, b)
+        # Произведение длиннее самого длинного преобразования: Карацуба делит
+        # операнды на части, и умножения частей снова попадают в NTT
+        return _karatsuba(a, b)
+    if lb >= limbs.limbs_for_digits(TOOM3_THRESHOLD, MIN_SPLIT_LIMBS) and 3 * lb > 2 * len(a):
+        return _toom3(a, b)
+    return _karatsuba(a, b)
+
+
+def mul(a, b):
+    """
+    Умножение чисел в лимбах с автоматическим выбором алгоритма.
+
+    Принимает на вход: a, b - нормализованные массивы лимбов
+    Возвращает: array('I') - произведение без ведущих нулей
+    """
+    # Квадрат (тот же объект или то же значение) - отдельным ядром
+    if a is b or (len(a) == len(b) and a == b):
+        return sqr(a)
+    if limbs.is_zero(a) or limbs.is_zero(b):
+        return array(limbs.TYPECODE, [0])
+    return limbs.normalize(_mul_lists(list(a), list(b)))
+
+
+def sqr(a):
+    """
+    Возведение в квадрат числа в лимбах.
+
+    Принимает на вход: a - нормализованный массив лимбов
+    Возвращает: array('I') - квадрат без ведущих нулей
+
+    Те же уровни, что и в mul, но каждый использует симметрию: попарные
+    произведения лимбов считаются один раз, рекурсивные умножения Карацубы и
+    Toom-3 - тоже квадраты, в NTT выполняется одно прямое преобразование вместо двух.
+    """
+    if limbs.is_zero(a):
+        return array(limbs.TYPECODE, [0])
+    x = list(a)
+    return limbs.normalize(_mul_lists(x, x))
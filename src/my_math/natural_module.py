@@ -1,4 +1,46 @@
+import math
+from . import limbs
+from . import multiplication
+from . import division
+from . import gcd
+from . import power
+from . import roots
+from . import values
+from .digit_buffer import DigitBuffer, as_buffer
+
+
+def _divmod_small(x: int, y: int):
+    """
+    Частное и остаток для малых чисел (с той же ошибкой деления на ноль).
+    """
+    if y == 0:
+        raise ZeroDivisionError("Деление на ноль")
+    return divmod(x, y)
+
+
+def _below(value: int, bound):
+    """
+    value, если оно меньше границы (None - граница не задана), иначе None.
+    """
+    return value if bound is None or value < bound else None
+
+
+@values.register
 class NaturalModule:
+    __slots__ = ("_n", "_A", "_limbs", "_small")
+
+    # Начиная с этого количества цифр сложение, вычитание и умножение
+    # выполняются в упакованном представлении (лимбы по основанию 10^9)
+    PACKED_THRESHOLD = 40
+
+    # Числа меньше этой границы хранятся как int Python: арифметика над ними
+    # выполняется встроенными операциями без массивов цифр
+    # (None - граница не задана, все числа хранятся как int)
+    SMALL_BOUND = 2 ** 64
+
+    # Деление, НОД и НОК исходными алгоритмами над массивами цифр вместо ядер
+    # в лимбах (эталонный движок digits, см. backends.py)
+    REFERENCE = False
 
     def __init__(self, n: int, A: list):
         """
@@ -6,11 +48,229 @@ class NaturalModule:
 
         Параметры:
         n (int): номер старшей позиции
-        A (list): массив цифр
+        A (list): массив цифр (список используется без копирования)
+
+        Число всегда хранится в каноническом виде: в массиве цифр нет ведущих
+        нулей (ноль - это [0]) и n == len(A) - 1. Ведущие нули переданного
+        массива удаляются, n берётся по длине массива.
         """
-        self.n = n  # Индекс старшей цифры
-        self.A = A  # Массив цифр от младшей к старшей
-    
+        self._n = n  # Индекс старшей цифры
+        self._A = as_buffer(A)  # Массив цифр от младшей к старшей (DigitBuffer)
+        self._limbs = None  # Упакованное представление (если число хранится в лимбах)
+        self._small = None  # Значение int (если число меньше SMALL_BOUND)
+        if A is not None:
+            self._normalize()
+
+    @property
+    def A(self):
+        """
+        Массив цифр от младшей к старшей.
+
+        Возвращается DigitBuffer: его можно изменять как список, а copy() выполняется
+        за O(1) (копирование при записи). Если число хранится как int, массив цифр
+        строится при первом обращении. Для числа в лимбах буфер строится по лимбам
+        и распаковывает цифры только при чтении цифр; пока буфер не изменён,
+        операции над числом по-прежнему выполняются в лимбах.
+        """
+        if self._A is None:
+            if self._small is not None:
+                self._A = DigitBuffer(map(int, reversed(limbs.int_to_string(self._small))))
+                self._small = None
+            else:
+                self._A = DigitBuffer.from_limbs(self._limbs)
+                self._limbs = None
+            self._n = len(self._A) - 1
+        return self._A
+
+    @A.setter
+    def A(self, value):
+        self._A = as_buffer(value)
+        self._limbs = None
+        self._small = None
+        self._normalize()
+
+    def _normalize(self):
+        """
+        Приводит массив цифр к каноническому виду: без ведущих нулей, n == len(A) - 1.
+        Вызывается при записи массива; код, изменяющий цифры на месте, сохраняет вид сам.
+        """
+        self._n = len(self._A.normalize()) - 1
+        return self
+
+    def is_zero(self) -> bool:
+        """
+        Проверка на ноль за O(1) (без просмотра цифр).
+        """
+        if self._small is not None:
+            return self._small == 0
+        if self._A is None:
+            return limbs.is_zero(self._limbs)
+        return self._A.is_zero()
+
+    def is_one(self) -> bool:
+        """
+        Проверка на единицу за O(1) (без просмотра цифр).
+        """
+        if self._small is not None:
+            return self._small == 1
+        L = self._packed()
+        if L is not None:
+            return len(L) == 1 and L[0] == 1
+        return len(self._A) == 1 and self._A[0] == 1
+
+    @property
+    def n(self):
+        """
+        Индекс старшей цифры.
+        """
+        if self._A is None:
+            if self._small is not None:
+                return len(limbs.int_to_string(self._small)) - 1
+            return limbs.digit_count(self._limbs) - 1
+        return self._n
+
+    @n.setter
+    def n(self, value):
+        if self._A is None:
+            self.A  # Переходим к массиву цифр, чтобы не потерять значение
+        self._n = value
+
+    def _clone(self):
+        """
+        Новое изменяемое число с тем же значением (массив цифр копируется за O(1)
+        при записи, лимбы и int не изменяются на месте и используются совместно).
+        """
+        clone = NaturalModule(self._n, None if self._A is None else self._A.copy())
+        clone._limbs = self._limbs
+        clone._small = self._small
+        return clone
+
+    def _key(self) -> bytes:
+        """
+        Значение числа в каноническом виде (нормализованные лимбы) для == и hash.
+        """
+        return limbs.normalize(self._get_limbs()).tobytes()
+
+    def __eq__(self, other):
+        if not isinstance(other, NaturalModule):
+            return NotImplemented
+        return self._key() == other._key()
+
+    # Изменяемое число не хэшируется; ключ словаря - values.frozen(x)
+    __hash__ = None
+
+    def _is_packed(self) -> bool:
+        """
+        Проверка: хранится ли число в лимбах.
+        """
+        return self._packed() is not None
+
+    def _packed(self):
+        """
+        Лимбы числа, если оно хранится в лимбах (в том числе в буфере цифр,
+        построенном по лимбам и не изменённом), иначе None.
+        """
+        if self._A is None:
+            return self._limbs
+        return self._A.limbs
+
+    def _get_limbs(self):
+        """
+        Возвращает упакованное представление числа.
+        Для числа, хранящегося цифрами, лимбы строятся заново и не кэшируются,
+        так как массив цифр мог быть изменён снаружи.
+        """
+        if self._small is not None:
+            return limbs.from_int(self._small)
+        L = self._packed()
+        if L is not None:
+            return L
+        return limbs.from_digits(self._A)
+
+    def _set_limbs(self, L):
+        """
+        Записывает в число результат, полученный в лимбах.
+        Результат меньше SMALL_BOUND сохраняется как int.
+        """
+        bound = self.SMALL_BOUND
+        # Число из k лимбов не меньше 2^(29(k-1)): длинные заведомо не малые
+        if bound is None or (len(L) - 1) * 29 < bound.bit_length():
+            value = limbs.to_int(L)
+            if bound is None or value < bound:
+                return self._set_small(value)
+        self._limbs = L
+        self._A = None
+        self._n = None
+        self._small = None
+        return self
+
+    def _set_small(self, value: int):
+        """
+        Записывает в число результат, полученный как int.
+        Значения не меньше SMALL_BOUND переводятся в массив цифр или в лимбы.
+        """
+        if self.SMALL_BOUND is not None and value >= self.SMALL_BOUND:
+            s = limbs.int_to_string(value)
+            if len(s) >= self.PACKED_THRESHOLD:
+                return self._set_limbs(limbs.from_string(s))
+            self.A = list(map(int, reversed(s)))
+            self._n = len(s) - 1
+            return self
+        if value < 0:
+            raise ValueError("Вычитаемое больше уменьшаемого")
+        self._small = value
+        self._A = None
+        self._n = None
+        self._limbs = None
+        return self
+
+    def _as_small(self):
+        """
+        Значение числа как int, если оно меньше SMALL_BOUND, иначе None.
+        Короткий массив цифр переводится в int (цифры могут быть ненормализованы).
+        """
+        if self._small is not None:
+            return self._small
+        bound = self.SMALL_BOUND
+        L = self._packed()
+        if L is not None:
+            if bound is not None and (len(L) - 1) * 29 >= bound.bit_length():
+                return None
+            return _below(limbs.to_int(L), bound)
+        A = self._A
+        if bound is None:
+            return limbs.to_int(limbs.from_digits(A))
+        # 10^(k-1) >= 2^(3(k-1)): длинный массив цифр заведомо не малый
+        if (len(A) - 1) * 3 >= bound.bit_length():
+            return None
+        value = 0
+        for i in range(len(A) - 1, -1, -1):
+            value = value * 10 + A[i]
+        return _below(value, bound)
+
+    def _use_packed(self, other) -> bool:
+        """
+        Выбор упакованного представления для операции над self и other:
+        если хотя бы одно из чисел уже в лимбах или оба числа достаточно длинные.
+        """
+        if self._packed() is not None or other._packed() is not None:
+            return True
+        if self._A is None or other._A is None:
+            return True
+        return max(len(self._A), len(other._A)) >= self.PACKED_THRESHOLD
+
+    def _small_pair(self, other):
+        """
+        Значения обоих чисел как int, если оба малы, иначе None.
+        """
+        x = self._as_small()
+        if x is None:
+            return None
+        y = other._as_small()
+        if y is None:
+            return None
+        return x, y
+
     def COM_NN_D(self, other):
         """
         N-1: Сравнение натуральных чисел
@@ -19,6 +279,16 @@ class NaturalModule:
         Принимает на вход: другое натуральное число (other)
         Возвращает: 2 - если первое больше, 0 - равны, 1 - второе больше
         """
+        small = self._small_pair(other)
+        if small is not None:
+            x, y = small
+            return 2 if x > y else (1 if x < y else 0)
+
+        # Если хотя бы одно число хранится в лимбах, сравниваем лимбы
+        if (self._A is None or other._A is None
+                or self._packed() is not None or other._packed() is not None):
+            return limbs.compare(self._get_limbs(), other._get_limbs())
+
         # Сравниваем количество цифр (если разное, сразу определяем больше/меньше)
         if self.n > other.n:
             return 2  # У первого числа больше разрядов
@@ -40,11 +310,9 @@ class NaturalModule:
 
         Возвращает: False если число равно нулю, True иначе
         """
-        # Проверяем условие нуля: n=0 и единственная цифра равна 0
-        if self.n == 0 and self.A[0] == 0:
-            return False  # Число равно нулю
-        return True  # Число не ноль
+        return not self.is_zero()
     
+    @values.value_op
     def ADD_1N_N(self):
         """
         N-3: Добавление 1 к натуральному числу
@@ -53,6 +321,11 @@ class NaturalModule:
         Добавляет 1 к текущему натуральному числу.
         Возвращает: self (изменённый объект)
         """
+        if self._small is not None:
+            return self._set_small(self._small + 1)
+        if self._packed() is not None:
+            return self._set_limbs(limbs.add(self._packed(), limbs.from_digits([1])))
+
         carry = 1  # Начинаем с переноса 1 (это и есть прибавляемая единица)
         
         # Проходим от младшей цифры с переносом
@@ -71,6 +344,7 @@ class NaturalModule:
             self.n += 1  # Увеличиваем индекс старшего разряда
         return self
 
+    @values.value_op
     def MUL_ND_N(self, d: int):
         """
         N-6: Умножение натурального числа на цифру
@@ -79,6 +353,11 @@ class NaturalModule:
         Принимает на вход: d - цифра (0-9)
         Возвращает: self (изменённый объект)
         """
+        if self._small is not None:
+            return self._set_small(self._small * d)
+        if self._packed() is not None:
+            return self._set_limbs(limbs.mul_small(self._packed(), d))
+
         # Особый случай: умножение на 0
         if d == 0:
             self.n = 0  # Результат - число из одной цифры
@@ -103,6 +382,7 @@ class NaturalModule:
         self.n = len(new_A) - 1  # Обновляем индекс старшей позиции
         return self
 
+    @values.value_op
     def MUL_Nk_N(self, k: int):
         """
         N-7: Умножение натурального числа на 10^k
@@ -111,16 +391,21 @@ class NaturalModule:
         Принимает на вход: k - степень десятки
         Возвращает: self (изменённый объект)
         """
+        if self._small is not None:
+            return self._set_small(self._small * 10 ** k)
+        if self._packed() is not None:
+            return self._set_limbs(limbs.mul_pow10(self._packed(), k))
+
         # Если число 0, результат не меняется
-        if self.n == 0 and self.A[0] == 0:
+        if self.is_zero():
             return self
         
         # Умножение на 10^k = добавление k нулей справа (в начало массива A)
-        self.A = [0] * k + self.A  # Добавляем k нулей в младшие разряды
-        self.n = self.n + k  # Увеличиваем индекс старшей позиции на k
+        self.A = [0] * k + self.A  # Добавляем k нулей в младшие разряды (n растёт на k)
         
         return self
 
+    @values.value_op
     def ADD_NN_N(self, other):
         """
         N-4: Сложение натуральных чисел
@@ -129,6 +414,14 @@ class NaturalModule:
         Принимает на вход: другое натуральное число (other)
         Возвращает: self (изменённый объект)
         """
+        small = self._small_pair(other)
+        if small is not None:
+            return self._set_small(small[0] + small[1])
+
+        # Длинные числа складываем в лимбах
+        if self._use_packed(other):
+            return self._set_limbs(limbs.add(self._get_limbs(), other._get_limbs()))
+
         result_A = []  # Массив для результата
         carry = 0  # Перенос
         max_len = max(self.n, other.n) + 1  # Максимальная длина + 1 на случай переноса
@@ -150,6 +443,7 @@ class NaturalModule:
         self.n = len(result_A) - 1  # Обновляем индекс старшей позиции
         return self
 
+    @values.value_op
     def SUB_NN_N(self, other):
         """
         N-5: Вычитание из натурального другого натурального
@@ -159,6 +453,14 @@ class NaturalModule:
         Возвращает: self (изменённый объект)
         Предполагается: self >= other
         """
+        small = self._small_pair(other)
+        if small is not None:
+            return self._set_small(small[0] - small[1])
+
+        # Длинные числа вычитаем в лимбах
+        if self._use_packed(other):
+            return self._set_limbs(limbs.sub(self._get_limbs(), other._get_limbs()))
+
         result_A = []  # Массив для результата
         borrow = 0  # Переменная для заимствования из старшего разряда
         
@@ -184,6 +486,7 @@ class NaturalModule:
         self.n = len(result_A) - 1  # Обновляем индекс старшей позиции
         return self
 
+    @values.value_op
     def MUL_NN_N(self, other):
         """
         N-8: Умножение натуральных чисел
@@ -194,18 +497,18 @@ class NaturalModule:
 
         Использование в других методах: 1
         """
+        small = self._small_pair(other)
+        if small is not None:
+            return self._set_small(small[0] * small[1])
 
-        # Проверяем наличие массива цифр, если пуст — инициализируем как 0
-        if not getattr(self, "A", None):
-            self.A = [0]
-            self.n = 0
-        if not getattr(other, "A", None):
-            other.A = [0]
-            other.n = 0
+        # Длинные числа перемножаем в лимбах (столбиком или методом Карацубы);
+        # равные множители multiplication.mul сам возводит в квадрат
+        if self._use_packed(other):
+            return self._set_limbs(multiplication.mul(self._get_limbs(), other._get_limbs()))
 
-        # Синхронизируем индекс старшей позиции с длиной массива
-        self.n = len(self.A) - 1
-        other.n = len(other.A) - 1
+        # Умножение числа на себя - возведение в квадрат
+        if other is self or self.A == other.A:
+            return self.SQR_N_N()
 
         # Инициализация массива для результата с запасом
         result_len = (self.n + 1) + (other.n + 1)
@@ -233,6 +536,56 @@ class NaturalModule:
 
         return self
 
+    @values.value_op
+    def SQR_N_N(self):
+        """
+        Возведение натурального числа в квадрат
+
+        Возвращает: self (изменённый объект)
+
+        Алгоритм: умножение "столбиком" с учётом симметрии - каждое произведение
+        цифр A[i] * A[j] (i < j) вычисляется один раз и удваивается, к нему
+        добавляются квадраты цифр (почти вдвое меньше умножений, чем в MUL_NN_N).
+        Длинные числа возводятся в квадрат в лимбах (multiplication.sqr).
+        """
+        x = self._as_small()
+        if x is not None:
+            return self._set_small(x * x)
+        if self._packed() is not None or len(self._A) >= self.PACKED_THRESHOLD:
+            return self._set_limbs(multiplication.sqr(self._get_limbs()))
+
+        A = self.A
+        size = len(A)
+        result_A = [0] * (2 * size)
+        # Попарные произведения разных цифр (каждое один раз)
+        for i in range(size - 1):
+            if A[i] == 0:
+                continue
+            for j in range(i + 1, size):
+                result_A[i + j] += A[i] * A[j]
+        # Удвоение и квадраты цифр на диагонали
+        for i in range(2 * size):
+            result_A[i] *= 2
+        for i in range(size):
+            result_A[2 * i] += A[i] * A[i]
+
+        # Переносы по всем разрядам
+        carry = 0
+        for i in range(len(result_A)):
+            carry, result_A[i] = divmod(result_A[i] + carry, 10)
+        while carry:
+            carry, digit = divmod(carry, 10)
+            result_A.append(digit)
+
+        # Удаляем ведущие нули, оставляя минимум одну цифру
+        while len(result_A) > 1 and result_A[-1] == 0:
+            result_A.pop()
+
+        self.A = result_A
+        self.n = len(result_A) - 1
+        return self
+
+    @values.value_op
     def SUB_NDN_N(self, other, d: int):
         """
         N-9: Вычитание из натурального другого, умноженного на цифру
@@ -266,8 +619,8 @@ class NaturalModule:
         # Подбираем максимальную цифру d: d * other * 10^k <= self
         for d in range(9, -1, -1):  # Перебираем от 9 до 0
             temp = NaturalModule(other.n, other.A.copy())  # Копируем делитель
-            temp.MUL_ND_N(d)  # Умножаем на цифру d
-            temp.MUL_Nk_N(k)  # Умножаем на 10^k
+            temp = temp.MUL_ND_N(d)  # Умножаем на цифру d
+            temp = temp.MUL_Nk_N(k)  # Умножаем на 10^k
             
             # Если temp <= self, нашли нужную цифру
             if temp.COM_NN_D(self) <= 1:  # temp <= self или temp < self
@@ -275,6 +628,7 @@ class NaturalModule:
         
         return (0, k)  # На случай если ничего не подошло
     
+    @values.value_op
     def DIV_NN_N(self, other):
         """
         N-11: Неполное частное от деления первого натурального на второе
@@ -282,50 +636,21 @@ class NaturalModule:
 
         Принимает на вход: другое натуральное число (other)
         Возвращает: self (изменённый объект) - неполное частное
-        """
-        quotient_A = []  # Массив для цифр частного
-        remainder = NaturalModule(0, [0])  # Остаток, изначально 0
-        
-        # Алгоритм длинного деления: обрабатываем цифры делимого от старшей
-        for i in range(self.n, -1, -1):  # Идём от старшей цифры к младшей
-            # Сдвигаем остаток влево и добавляем следующую цифру делимого
-            if not (remainder.n == 0 and remainder.A[0] == 0):  # Если остаток не 0
-                remainder.MUL_Nk_N(1)  # Сдвигаем влево (умножаем на 10)
-            remainder.A[0] = self.A[i]  # Добавляем текущую цифру делимого
-            
-            # Обновляем индекс старшей позиции остатка
-            while len(remainder.A) > 1 and remainder.A[-1] == 0:  # Убираем ведущие нули
-                remainder.A.pop()
-            remainder.n = len(remainder.A) - 1
-            
-            # Находим максимальную цифру частного для текущей позиции
-            d = 0  # Изначально 0
-            for test_d in range(9, -1, -1):  # Перебираем от 9 до 0
-                temp = NaturalModule(other.n, other.A.copy())  # Копируем делитель
-                temp.MUL_ND_N(test_d)  # Умножаем на test_d
-                if temp.COM_NN_D(remainder) != 2:  # Если temp <= remainder
-                    d = test_d  # Нашли подходящую цифру
-                    break
-            
-            quotient_A.append(d)  # Добавляем цифру в частное
-            
-            # Вычитаем d * other из остатка
-            if d > 0:  # Если цифра не 0
-                temp = NaturalModule(other.n, other.A.copy())  # Копируем делитель
-                temp.MUL_ND_N(d)  # Умножаем на d
-                remainder.SUB_NN_N(temp)  # Вычитаем из остатка
-        
-        # Переворачиваем массив цифр частного (собирали в обратном порядке)
-        quotient_A.reverse()
-
-        # Удаляем ведущие нули
-        while len(quotient_A) > 1 and quotient_A[-1] == 0:
-            quotient_A.pop()
-        
-        self.A = quotient_A  # Записываем результат
-        self.n = len(quotient_A) - 1  # Обновляем индекс старшей позиции
-        return self
 
+        Алгоритм: деление "в столбик" по лимбам (алгоритм D Кнута, см. division.py):
+        каждый лимб частного оценивается по старшим лимбам остатка с не более чем
+        двумя поправками, остаток обновляется на месте. Для длинных операндов
+        используется рекурсивное деление Бурникеля-Циглера через быстрое умножение.
+        """
+        if self.REFERENCE:
+            return self._divmod_digits(other)[0]
+        small = self._small_pair(other)
+        if small is not None:
+            return self._set_small(_divmod_small(*small)[0])
+        quotient, _ = division.div_mod(self._get_limbs(), other._get_limbs())
+        return self._set_limbs(quotient)
+
+    @values.value_op
     def MOD_NN_N(self, other):
         """
         N-12: Остаток от деления первого натурального на второе
@@ -334,16 +659,38 @@ class NaturalModule:
         Принимает на вход: другое натуральное число (other)
         Возвращает: self (изменённый объект) - остаток
         """
-        # Формула: остаток = делимое - (делимое // делитель) * делитель
-        quotient = NaturalModule(self.n, self.A.copy())  # Копируем делимое
-        quotient.DIV_NN_N(other)  # Вычисляем частное
-        
-        temp = NaturalModule(quotient.n, quotient.A.copy())  # Копируем частное
-        temp.MUL_NN_N(other)  # Умножаем частное на делитель
-        
-        self.SUB_NN_N(temp)  # Вычитаем из делимого
-        return self  # Остаток в self
+        if self.REFERENCE:
+            remainder = self._divmod_digits(other)[1]
+            self.A = remainder.A
+            return self
+        small = self._small_pair(other)
+        if small is not None:
+            return self._set_small(_divmod_small(*small)[1])
+        # Деление в столбик (алгоритм D) оставляет остаток после последнего шага
+        _, remainder = division.div_mod(self._get_limbs(), other._get_limbs())
+        return self._set_limbs(remainder)  # Остаток в self
+
+    @values.value_op
+    def DIVMOD_NN_NN(self, other):
+        """
+        Неполное частное и остаток от деления за одно деление
+
+        Принимает на вход: другое натуральное число (other)
+        Возвращает: (self, remainder) - self становится неполным частным,
+        remainder - новый объект NaturalModule с остатком
+        """
+        if self.REFERENCE:
+            return self._divmod_digits(other)
+        small = self._small_pair(other)
+        if small is not None:
+            quotient, remainder = _divmod_small(*small)
+            self._set_small(quotient)
+            return self, NaturalModule(None, None)._set_small(remainder)
+        quotient, remainder = division.div_mod(self._get_limbs(), other._get_limbs())
+        self._set_limbs(quotient)
+        return self, NaturalModule(None, None)._set_limbs(remainder)
     
+    @values.value_op
     def GCF_NN_N(self, other):
         """
         N-13: НОД натуральных чисел
@@ -354,57 +701,266 @@ class NaturalModule:
 
         Использование в других методах: 1
         """
-        # Алгоритм Евклида: НОД(a,b) = НОД(b, a mod b)
-        while other.NZER_N_B():  # Пока other не равно 0
-            remainder = NaturalModule(self.n, self.A.copy())  # Копируем self
-            remainder.MOD_NN_N(other)  # Вычисляем остаток от деления self на other
-            
-            # Меняем местами: self = other, other = remainder
-            self.n = other.n
-            self.A = other.A.copy()
-
-            other.n = remainder.n
-            other.A = remainder.A.copy()
-        
+        # Алгоритм Лемера по лимбам (см. gcd.py): шаги Евклида выполняются
+        # пакетами по старшим лимбам, короткие числа - бинарным алгоритмом,
+        # очень длинные сначала сокращаются half-GCD. other не изменяется
+        if self.REFERENCE:
+            return self._gcf_digits(other)
+        small = self._small_pair(other)
+        if small is not None:
+            return self._set_small(gcd._binary_gcd(*small))
+        self._set_limbs(gcd.gcd(self._get_limbs(), other._get_limbs()))
         return self  # В self остался НОД
 
+    @values.value_op
+    def GCFEXT_NN_NNN(self, other):
+        """
+        НОД натуральных чисел с коэффициентами Безу (расширенный алгоритм Евклида)
+
+        Принимает на вход: другое натуральное число (other), self != 0
+        Возвращает: (self, x, y) - self становится НОДом, x и y - новые
+        натуральные числа, для которых self * x - other * y = НОД
+        (для исходного значения self)
+        """
+        g, x, y = gcd.gcdext(self._get_limbs(), other._get_limbs())
+        self._set_limbs(g)
+        return self, NaturalModule(None, None)._set_limbs(x), NaturalModule(None, None)._set_limbs(y)
+
+    @values.value_op
     def LCM_NN_N(self, other):
         """
         Водолазко 4384
         
         Вычисление наименьшего общего кратного (НОК) двух натуральных чисел.
         Алгоритм основан на фундаментальной связи между НОК и НОД:
-        НОК(a, b) = (a * b) / НОД(a, b)
+        НОК(a, b) = (a / НОД(a, b)) * b
         
         Принимает на вход: другое натуральное число (other)
         Возвращает: натуральное число - НОК исходных чисел
         """
-        # Создаем копию второго числа (other) для дальнейших вычислений
-        # Это необходимо, чтобы не изменять исходный объект other
-        other_1 = NaturalModule(other.n, other.A)
-        
-        # Формула связи НОК и НОД: НОК(a,b) = (a*b)/НОД(a,b)
-        # Создаем временную переменную temp как копию первого числа (self)
-        # Это нужно потому, что метод GCF_NN_N изменяет объект, к которому применяется
-        temp = NaturalModule(self.n, self.A.copy())
-        
-        # Вычисляем наибольший общий делитель (НОД) двух чисел
-        # Метод GCF_NN_N модифицирует объект temp, сохраняя в нем НОД(a,b)
-        temp.GCF_NN_N(other)  # temp = НОД(a,b)
-
-        # Умножаем первое число (self) на второе число (other_1)
-        # После этой операции self становится равным произведению a * b
-        # Метод MUL_NN_N модифицирует текущий объект self
-        self.MUL_NN_N(other_1)  # self = a * b
-
-        # Делим произведение чисел на их НОД
-        # По формуле: НОК(a,b) = (a*b) / НОД(a,b)
-        # Метод DIV_NN_N выполняет натуральное деление и модифицирует объект self
-        self.DIV_NN_N(temp)  # self = (a*b) / НОД(a,b)
-
-        # Возвращаем текущий объект self, который теперь содержит НОК исходных чисел
-        # Важно: исходный объект self изменяется в процессе вычислений!
+        if self.REFERENCE:
+            return self._lcm_digits(other)
+        small = self._small_pair(other)
+        if small is not None:
+            x, y = small
+            return self._set_small(x // gcd._binary_gcd(x, y) * y if x and y else 0)
+
+        a = self._get_limbs()
+        b = other._get_limbs()
+        # НОК с нулём равен нулю
+        if limbs.is_zero(a) or limbs.is_zero(b):
+            return self._set_limbs(limbs.normalize([0]))
+
+        # На НОД делится меньшее число, и только потом выполняется умножение:
+        # полное произведение a * b (вдвое длиннее нужного) не строится
+        if limbs.compare(a, b) == 1:
+            a, b = b, a
+        reduced, _ = division.div_mod(a, gcd.gcd(a, b))
+        # Важно: исходный объект self изменяется, other остаётся прежним
+        return self._set_limbs(multiplication.mul(reduced, b))
+
+    # Эталонные алгоритмы над массивами цифр (движок digits)
+
+    def _divmod_digits(self, other):
+        """
+        Деление "в столбик" по десятичным цифрам: цифра частного подбирается
+        сравнением остатка с кратными делителя d * other (d = 9..0)
+
+        Возвращает: (self, remainder) - self становится неполным частным,
+        remainder - новый объект NaturalModule с остатком
+        """
+        if other.is_zero():
+            raise ZeroDivisionError("Деление на ноль")
+        # Кратные делителя вычисляются один раз, а не для каждой цифры частного
+        multiples = [NaturalModule(other.n, other.A.copy()).MUL_ND_N(d) for d in range(10)]
+        quotient_A = []  # Цифры частного от старшей к младшей
+        remainder = NaturalModule(0, [0])
+        A = self.A
+        for i in range(self.n, -1, -1):
+            # Сдвигаем остаток влево и дописываем следующую цифру делимого
+            remainder.MUL_Nk_N(1)
+            remainder.A[0] = A[i]
+            remainder._normalize()
+
+            # Наибольшая цифра d, для которой d * other <= остатка
+            d = 9
+            while multiples[d].COM_NN_D(remainder) == 2:
+                d -= 1
+            quotient_A.append(d)
+            if d:
+                remainder.SUB_NN_N(multiples[d])
+
+        quotient_A.reverse()
+        self.A = quotient_A
+        return self, remainder
+
+    def _gcf_digits(self, other):
+        """
+        НОД алгоритмом Евклида с делением по цифрам (other не изменяется).
+        """
+        b = NaturalModule(other.n, other.A.copy())
+        while b.NZER_N_B():
+            remainder = NaturalModule(self.n, self.A.copy())._divmod_digits(b)[1]
+            self.A = b.A
+            b = remainder
         return self
 
+    def _lcm_digits(self, other):
+        """
+        НОК(a, b) = (a * b) / НОД(a, b) с умножением и делением по цифрам.
+        """
+        if self.is_zero() or other.is_zero():
+            self.A = [0]
+            return self
+        g = NaturalModule(self.n, self.A.copy())._gcf_digits(other)
+        self.MUL_NN_N(other)
+        return self._divmod_digits(g)[0]
+
+    @staticmethod
+    def LCM_MANY_N(numbers: list):
+        """
+        НОК нескольких натуральных чисел
+
+        Принимает на вход: numbers - непустой список натуральных чисел (не изменяются)
+        Возвращает: новое натуральное число - НОК всех чисел
+
+        Алгоритм: дерево произведений - НОК вычисляется попарно для соседних чисел,
+        затем для соседних результатов и т.д. Операнды на каждом уровне близки
+        по длине, поэтому умножения попадают на быстрые алгоритмы, а не сводятся
+        к длинному накопленному НОК, умножаемому на короткие числа.
+        """
+        level = [NaturalModule(None, None)._set_limbs(number._get_limbs()) for number in numbers]
+        while len(level) > 1:
+            pairs = []
+            for i in range(0, len(level) - 1, 2):
+                pairs.append(level[i].LCM_NN_N(level[i + 1]))
+            if len(level) % 2:
+                pairs.append(level[-1])
+            level = pairs
+        return level[0]
+
+    def _to_int(self) -> int:
+        """
+        Значение числа как int (например, для показателя степени).
+        """
+        value = self._as_small()
+        if value is None:
+            value = limbs.to_int(self._get_limbs())
+        return value
+
+    @values.value_op
+    def POW_NN_N(self, other):
+        """
+        Возведение натурального числа в натуральную степень
+
+        Принимает на вход: показатель - натуральное число (other)
+        Возвращает: self (изменённый объект) - self^other (0^0 = 1)
+
+        Алгоритм: бинарное возведение в степень с отдельным ядром возведения
+        в квадрат (см. power.py)
+        """
+        e = other._to_int()
+        x = self._as_small()
+        bound = self.SMALL_BOUND
+        # Малое основание с малым результатом возводится встроенной операцией
+        if x is not None and (bound is None or x.bit_length() * e < bound.bit_length()):
+            return self._set_small(x ** e)
+        return self._set_limbs(power.power(self._get_limbs(), e))
+
+    @values.value_op
+    def POWMOD_NNN_N(self, exponent, modulus):
+        """
+        Возведение натурального числа в степень по модулю
+
+        Принимает на вход: показатель (exponent) и модуль (modulus) - натуральные числа
+        Возвращает: self (изменённый объект) - self^exponent mod modulus
+
+        Алгоритм: скользящее окно по битам показателя с редукцией Монтгомери
+        (см. power.py) - в цикле нет делений на модуль
+        """
+        x = self._as_small()
+        m = modulus._as_small()
+        if x is not None and m is not None:
+            if m == 0:
+                raise ZeroDivisionError("Деление на ноль")
+            return self._set_small(pow(x, exponent._to_int(), m))
+        return self._set_limbs(power.powmod(self._get_limbs(), exponent._to_int(), modulus._get_limbs()))
+
+    @values.value_op
+    def SQRT_N_N(self):
+        """
+        Целая часть квадратного корня из натурального числа
+
+        Возвращает: self (изменённый объект) - наибольшее x, для которого x^2 <= self
+
+        Алгоритм: итерации Ньютона с делением в лимбах от оценки по старшим
+        лимбам (см. roots.py)
+        """
+        x = self._as_small()
+        if x is not None:
+            return self._set_small(math.isqrt(x))
+        return self._set_limbs(roots.isqrt(self._get_limbs()))
+
+    @values.value_op
+    def ROOT_Nk_N(self, k: int):
+        """
+        Целая часть корня k-й степени из натурального числа
+
+        Принимает на вход: k >= 1 - степень корня
+        Возвращает: self (изменённый объект) - наибольшее x, для которого x^k <= self
+        """
+        if k < 1:
+            raise ValueError("Степень корня должна быть положительной")
+        return self._set_limbs(roots.root(self._get_limbs(), k))
+
+    def PERFPOW_N_Nk(self):
+        """
+        Проверка, является ли натуральное число точной степенью
+
+        Возвращает: (x, k) - новое натуральное число x и наибольший показатель
+        k >= 2, для которых self = x^k; None, если self - не точная степень
+        (0 и 1 степенями не считаются). Число не изменяется.
+        """
+        found = roots.perfect_power(self._get_limbs())
+        if found is None:
+            return None
+        x, k = found
+        return NaturalModule(None, None)._set_limbs(x), k
+
+    @classmethod
+    def from_str(cls, s: str):
+        """
+        Натуральное число из десятичной записи.
+
+        Принимает на вход: s - строка из цифр
+        Возвращает: новое натуральное число; длинные записи сразу упаковываются
+        в лимбы (по 9 цифр), минуя массив цифр, короткие хранятся как int
+        """
+        if len(s) <= 2:
+            constant = values.constant(cls, int(s))
+            if constant is not None:
+                return constant
+        return cls._parse(s)
+
+    @classmethod
+    def _parse(cls, s: str):
+        """
+        Новое изменяемое натуральное число из десятичной записи (без констант).
+        """
+        if len(s) >= cls.PACKED_THRESHOLD:
+            return cls(None, None)._set_limbs(limbs.from_string(s))
+        return cls(None, None)._set_small(limbs.int_from_string(s))
+
     def __str__(self):
-        return "".join([str(i) for i in self.A])[::-1]
+        if self._small is not None:
+            return limbs.int_to_string(self._small)
+        if self._packed() is not None:
+            return limbs.to_string(self._packed())
+        return "".join(map(str, reversed(self.A)))
+
+
+# Неизменяемые константы (см. values.py)
+NaturalModule.ZERO = values.freeze(NaturalModule(0, [0]))
+NaturalModule.ONE = values.freeze(NaturalModule(0, [1]))
+NaturalModule.TEN = values.freeze(NaturalModule(1, [0, 1]))
+NaturalModule._CONSTANTS = {0: NaturalModule.ZERO, 1: NaturalModule.ONE, 10: NaturalModule.TEN}
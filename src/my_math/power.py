@@ -0,0 +1,243 @@
+from array import array
+from . import limbs
+from . import multiplication
+from . import division
+from . import gcd
+
+
+def _one():
+    """
+    Единица в лимбах.
+    """
+    return array(limbs.TYPECODE, [1])
+
+
+def _mul_low(a, b, n: int):
+    """
+    a * b mod BASE^n: короткие числа - усечённым умножением "столбиком",
+    длинные - полным умножением с отбрасыванием старших лимбов.
+    """
+    if n < limbs.limbs_for_digits(multiplication.KARATSUBA_THRESHOLD, multiplication.MIN_SPLIT_LIMBS):
+        return limbs.mul_low(a, b, n)
+    return limbs.low(multiplication.mul(limbs.low(a, n), limbs.low(b, n)), n)
+
+
+def power(a, e: int):
+    """
+    Возведение в степень: a^e.
+
+    Принимает на вход: a - нормализованный массив лимбов, e >= 0 - показатель
+    Возвращает: array('I') лимбов
+
+    Алгоритм: бинарное возведение в степень слева направо; на каждом бите
+    результат возводится в квадрат отдельным ядром (multiplication.sqr),
+    при единичном бите домножается на a.
+    """
+    if e == 0:
+        return _one()
+    result = a
+    for bit in bin(e)[3:]:
+        result = multiplication.sqr(result)
+        if bit == '1':
+            result = multiplication.mul(result, a)
+    return result
+
+
+def _window_size(bits: int) -> int:
+    """
+    Ширина окна для показателя из bits битов: окно шириной k требует 2^(k-1)
+    предвычисленных нечётных степеней и экономит примерно bits * (1 - 1/k) умножений.
+    """
+    for k, limit in ((1, 8), (2, 24), (3, 80), (4, 240), (5, 672)):
+        if bits <= limit:
+            return k
+    return 6
+
+
+def _sliding_window(x, e: int, mul, sqr):
+    """
+    Возведение в степень e >= 1 скользящим окном в кольце с операциями mul и sqr.
+
+    Показатель просматривается слева направо; нули пропускаются одним возведением
+    в квадрат, единичный бит открывает окно длиной до k битов, заканчивающееся
+    единицей, и окно обрабатывается k возведениями в квадрат и одним умножением
+    на предвычисленную нечётную степень x.
+    """
+    bits = bin(e)[2:]
+    k = _window_size(len(bits))
+
+    # Нечётные степени x, x^3, ..., x^(2^k - 1)
+    odd = [x]
+    if k > 1:
+        x2 = sqr(x)
+        for _ in range((1 << (k - 1)) - 1):
+            odd.append(mul(odd[-1], x2))
+
+    result = None
+    i = 0
+    while i < len(bits):
+        if bits[i] == '0':
+            result = sqr(result)
+            i += 1
+            continue
+        # Самое длинное окно bits[i:j] не длиннее k, оканчивающееся единицей
+        j = min(i + k, len(bits))
+        while bits[j - 1] == '0':
+            j -= 1
+        value = int(bits[i:j], 2)
+        if result is None:
+            result = odd[value >> 1]
+        else:
+            for _ in range(j - i):
+                result = sqr(result)
+            result = mul(result, odd[value >> 1])
+        i = j
+    return result
+
+
+class _Montgomery:
+    """
+    Арифметика по модулю m, взаимно простому с 10, в форме Монтгомери.
+
+    Вычет x хранится как x * R mod m, где R = BASE^n (n - длина m в лимбах).
+    Произведение двух таких вычетов приводится редукцией Монтгомери
+    REDC(T) = T / R mod m: u = (T mod R) * m' mod R, где m' = -m^(-1) mod R;
+    T + u * m делится на R нацело, деление - отбрасывание n младших лимбов.
+    Редукция стоит двух умножений и не требует деления на m.
+    """
+
+    def __init__(self, m):
+        self.m = m
+        self.n = len(m)
+        self.m_neg_inv = self._neg_inverse(m, self.n)
+        _, self.r2_mod = division.div_mod(limbs.shift(_one(), 2 * self.n), m)  # R^2 mod m
+
+    @staticmethod
+    def _neg_inverse(m, n: int):
+        """
+        -m^(-1) mod BASE^n подъёмом Гензеля: из обратного по модулю BASE^k
+        шаг x = x * (2 - m * x) даёт обратный по модулю BASE^(2k).
+        """
+        x = array(limbs.TYPECODE, [pow(m[0], -1, limbs.BASE)])
+        k = 1
+        two = array(limbs.TYPECODE, [2])
+        while k < n:
+            k = min(2 * k, n)
+            t = _mul_low(m, x, k)
+            # 2 - t по модулю BASE^k (t = 1 mod BASE^(k/2), поэтому 2 - t + BASE^k > 0)
+            s = limbs.low(limbs.sub(limbs.add(limbs.shift(_one(), k), two), t), k)
+            x = _mul_low(x, s, k)
+        return limbs.sub(limbs.shift(_one(), n), x)
+
+    def reduce(self, t):
+        """
+        REDC: t / R mod m для 0 <= t < m * R.
+        """
+        n = self.n
+        u = _mul_low(t, self.m_neg_inv, n)
+        x = limbs.high(limbs.add(t, multiplication.mul(u, self.m)), n)
+        if limbs.compare(x, self.m) != 1:
+            x = limbs.sub(x, self.m)
+        return x
+
+    def to_form(self, x):
+        """
+        Перевод вычета x < m в форму Монтгомери.
+        """
+        return self.reduce(multiplication.mul(x, self.r2_mod))
+
+    def mul(self, x, y):
+        return self.reduce(multiplication.mul(x, y))
+
+    def sqr(self, x):
+        return self.reduce(multiplication.sqr(x))
+
+
+def _split_modulus(m):
+    """
+    Разложение m = m1 * m2, где m1 взаимно просто с 10, а m2 = 2^a * 5^b.
+
+    Возвращает: (m1, m2, c) - c = max(a, b), так что m2 делит 10^c
+    """
+    m1 = m
+    m2 = 1
+    twos = fives = 0
+    for p in (2, 5):
+        while True:
+            q, r = limbs.divmod_small(m1, p)
+            if r:
+                break
+            m1 = q
+            m2 *= p
+            if p == 2:
+                twos += 1
+            else:
+                fives += 1
+    return m1, m2, max(twos, fives)
+
+
+def _low_digits(x, c: int):
+    """
+    x mod 10^c: младшие c десятичных цифр (без деления).
+    """
+    q, r = divmod(c, limbs.BASE_DIGITS)
+    low = list(x[:q + 1])
+    if len(low) > q:
+        low[q] %= 10 ** r
+    return limbs.normalize(low)
+
+
+def _powmod_pow10(a, e: int, c: int):
+    """
+    a^e mod 10^c: каждое приведение - отбрасывание старших цифр.
+    """
+    return _sliding_window(_low_digits(a, c), e,
+                           lambda x, y: _low_digits(multiplication.mul(x, y), c),
+                           lambda x: _low_digits(multiplication.sqr(x), c))
+
+
+def powmod(a, e: int, m):
+    """
+    Возведение в степень по модулю: a^e mod m.
+
+    Принимает на вход: a, m - нормализованные массивы лимбов (m != 0), e >= 0
+    Возвращает: array('I') лимбов - число от 0 до m - 1
+
+    Алгоритм: m раскладывается на m1, взаимно простое с 10, и m2 = 2^a * 5^b.
+    По модулю m1 степень вычисляется скользящим окном в форме Монтгомери
+    (в цикле нет делений на m), по модулю 10^c (кратному m2) - скользящим
+    окном с отбрасыванием старших цифр. Результаты объединяются по КТО; деления
+    выполняются только при подготовке и объединении, а не на каждом шаге.
+    """
+    if limbs.is_zero(m):
+        raise ZeroDivisionError("Деление на ноль")
+    one = _one()
+    if limbs.compare(m, one) == 0:
+        return array(limbs.TYPECODE, [0])
+    if e == 0:
+        return one
+
+    m1, m2, c = _split_modulus(m)
+    _, a1 = division.div_mod(a, m1)
+
+    # Вычет по модулю m1 (Монтгомери)
+    r1 = array(limbs.TYPECODE, [0])
+    if limbs.compare(m1, one) != 0 and not limbs.is_zero(a1):
+        mont = _Montgomery(m1)
+        r1 = mont.reduce(_sliding_window(mont.to_form(a1), e, mont.mul, mont.sqr))
+    if m2 == 1:
+        return r1
+
+    # Вычет по модулю m2 через степень по модулю 10^c
+    m2_limbs = limbs.from_int(m2)
+    _, r2 = division.div_mod(_powmod_pow10(a, e, c), m2_limbs)
+    if limbs.compare(m1, one) == 0:
+        return r2
+
+    # КТО: x = r1 + m1 * ((r2 - r1) * m1^(-1) mod m2)
+    _, m1_mod = division.div_mod(m1, m2_limbs)
+    _, inv, _ = gcd.gcdext(m1_mod, m2_limbs)
+    _, r1_mod = division.div_mod(r1, m2_limbs)
+    diff = limbs.sub(limbs.add(r2, m2_limbs), r1_mod)
+    _, t = division.div_mod(multiplication.mul(diff, inv), m2_limbs)
+    return limbs.add(r1, multiplication.mul(m1, t))
@@ -1,15 +1,53 @@
+from . import values
 from .natural_module import NaturalModule
 from .integer_module import IntegerModule
 
 
+@values.register
 class RationalModule:
+    __slots__ = ("up", "down")
+    _PARTS = ("up", "down")  # части, которые values.frozen замораживает вместе с дробью
+
     def __init__(self, up: IntegerModule, down: NaturalModule):
         if not down.NZER_N_B():
             raise ValueError("Знаменатель не может быть равен нулю")
         self.up = up
         self.down = down
 
+    def _clone(self):
+        """
+        Новая изменяемая дробь с тем же значением (числитель и знаменатель копируются).
+        """
+        return RationalModule(self.up._clone(), self.down._clone())
+
+    def _key(self):
+        """
+        Значение дроби в каноническом виде (несократимая дробь) для == и hash.
+        """
+        reduced = self._clone().RED_Q_Q()
+        return reduced.up._key(), reduced.down._key()
+
+    def __eq__(self, other):
+        if not isinstance(other, RationalModule):
+            return NotImplemented
+        return self._key() == other._key()
 
+    # Изменяемое число не хэшируется; ключ словаря - values.frozen(x)
+    __hash__ = None
+
+    def is_zero(self) -> bool:
+        """
+        Проверка дроби на ноль за O(1) (по числителю).
+        """
+        return self.up.is_zero()
+
+    def sign(self) -> int:
+        """
+        Знак дроби за O(1): 0 - ноль, 1 - положительная, -1 - отрицательная.
+        """
+        return self.up.sign()
+
+    @values.value_op
     def RED_Q_Q(self):
         """
         Овчаренко 4384
@@ -20,18 +58,19 @@ class RationalModule:
 
         Алгоритм: Находим НОД модуля числителя и знаменателя, затем сокращаем дробь, деля числитель и знаменатель на НОД
         """
-        abs_up = NaturalModule(self.up.n, self.up.A) # Преобразуем числитель в натуральное число по модулю
-        gcd = abs_up.GCF_NN_N(NaturalModule(self.down.n, self.down.A)) # Находим НОД числителя и знаменателя
+        abs_up = self.up._natural_abs() # Модуль числителя (копия за O(1))
+        gcd = abs_up.GCF_NN_N(self.down) # Находим НОД числителя и знаменателя
         # Если НОД не равен 1, сокращаем числитель и знаменатель
-        if not (gcd.A[0] == 1 and gcd.n == 0):
+        if not gcd.is_one():
             # Сокращаем числитель, деля его на НОД
-            self.up = self.up.DIV_ZZ_Z(IntegerModule(0, gcd.n, gcd.A))
+            self.up = self.up.DIV_ZZ_Z(IntegerModule._from_natural(gcd, False))
             # Сокращаем знаменатель, деля его на НОД
-            self.down.DIV_NN_N(gcd)
+            self.down = self.down.DIV_NN_N(gcd)
         # Возвращаем сокращенную дробь (self)
         return self
 
 
+    @values.value_op
     def INT_Q_B(self) -> str:
         """
         Боков 4384
@@ -40,8 +79,8 @@ class RationalModule:
         знаменатель=1 (рациональное=целое) иначе "нет"
         """
         red = self.RED_Q_Q() # Сокращаем дробь
-        # Проверяем, что знаменатель равен 1 (нулевая степень n, единичный первый элемент в массиве)
-        if red.down.n == 0 and red.down.A[0] == 1:
+        # Проверяем, что знаменатель равен 1
+        if red.down.is_one():
             return "да"
         else:
             return "нет"
@@ -54,8 +93,8 @@ class RationalModule:
         использует целое число z из инициализации, если оно = 0 возвращает "0" 
         иначе переданное число/1
         """
-         # Проверяем, равен ли z нулю (первый элемент массива A равен 0, степень n равна 0)
-        if z.A[0] == 0 and z.n == 0:
+        # Проверяем, равен ли z нулю
+        if z.is_zero():
             return "0"
         else:
             return f'{z}/1'
@@ -69,11 +108,12 @@ class RationalModule:
         знаменатель=1 иначе возвращает None
         """
         # Проверяем, равен ли знаменатель 1
-        if self.down.n == 0 and self.down.A[0] == 1:
+        if self.down.is_one():
             return self.up # Возвращаем числитель как целое число
         else:
             return None # Преобразование невозможно
         
+    @values.value_op
     def ADD_QQ_Q(self, other):
         """
         Овчаренко 4384
@@ -85,16 +125,15 @@ class RationalModule:
         Принимает на вход: другую дробь (other)
         Алгоритм: Находим НОК знаменателей, вычисляем дополнительные множители, затем приводим дроби к общему знаменателю и складываем
         """
-        lcm = NaturalModule(self.down.n, self.down.A)
-        lcm.LCM_NN_N(NaturalModule(other.down.n, other.down.A)) # НОК знаменателей
+        lcm = self.down._clone().LCM_NN_N(other.down) # НОК знаменателей
         
         # Вычисляем множители для числителей: НОК / знаменатель
-        m1 = NaturalModule(lcm.n, lcm.A).DIV_NN_N(self.down) # дополнительный множитель для первой дроби
-        m2 = NaturalModule(lcm.n, lcm.A).DIV_NN_N(other.down) # для второй дроби
+        m1 = lcm._clone().DIV_NN_N(self.down) # дополнительный множитель для первой дроби
+        m2 = lcm._clone().DIV_NN_N(other.down) # для второй дроби
         
-        # Умножаем числители на соответствующие множители
-        new_up1 = self.up.MUL_ZZ_Z(IntegerModule(0, m1.n, m1.A)) # числитель первой дроби после умножения
-        new_up2 = other.up.MUL_ZZ_Z(IntegerModule(0, m2.n, m2.A)) # числитель второй дроби после умножения
+        # Умножаем числители на соответствующие множители (числители не изменяются)
+        new_up1 = self.up.MUL_ZZ_Z(IntegerModule._from_natural(m1, False)) # числитель первой дроби после умножения
+        new_up2 = other.up.MUL_ZZ_Z(IntegerModule._from_natural(m2, False)) # числитель второй дроби после умножения
 
 
         self.up = new_up1.ADD_ZZ_Z(new_up2) # сложение числителей
@@ -102,6 +141,7 @@ class RationalModule:
         return self.RED_Q_Q() # сокращение
 
 
+    @values.value_op
     def SUB_QQ_Q(self, other):
         """
         Овчаренко 4384
@@ -112,17 +152,16 @@ class RationalModule:
         Принимает на вход: другую дробь (other)
         Алгоритм: Находим НОК знаменателей, вычисляем дополнительные множители, затем приводим дроби к общему знаменателю и вычитаем
         """
-        lcm = NaturalModule(self.down.n, self.down.A)
-        lcm.LCM_NN_N(NaturalModule(other.down.n, other.down.A)) # НОК знаменателей
+        lcm = self.down._clone().LCM_NN_N(other.down) # НОК знаменателей
 
 
         # Вычисляем множители для числителей
-        m1 = NaturalModule(lcm.n, lcm.A).DIV_NN_N(self.down) # дополнительный множитель для первой дроби
-        m2 = NaturalModule(lcm.n, lcm.A).DIV_NN_N(other.down) # для второй дроби
+        m1 = lcm._clone().DIV_NN_N(self.down) # дополнительный множитель для первой дроби
+        m2 = lcm._clone().DIV_NN_N(other.down) # для второй дроби
         
-        # Умножаем числители на соответствующие множители
-        new_up1 = self.up.MUL_ZZ_Z(IntegerModule(0, m1.n, m1.A)) # числитель первой дроби после умножения
-        new_up2 = other.up.MUL_ZZ_Z(IntegerModule(0, m2.n, m2.A)) # числитель второй дроби после умножения
+        # Умножаем числители на соответствующие множители (числители не изменяются)
+        new_up1 = self.up.MUL_ZZ_Z(IntegerModule._from_natural(m1, False)) # числитель первой дроби после умножения
+        new_up2 = other.up.MUL_ZZ_Z(IntegerModule._from_natural(m2, False)) # числитель второй дроби после умножения
 
 
         self.up = new_up1.SUB_ZZ_Z(new_up2) # вычитание числителей
@@ -130,6 +169,7 @@ class RationalModule:
         return self.RED_Q_Q() # сокращение
 
 
+    @values.value_op
     def MUL_QQ_Q(self, other):
         """
         Овчаренко 4384
@@ -140,18 +180,11 @@ class RationalModule:
         Принимает на вход: другую дробь (other)
         Алгоритм: Умножаем числители и знаменатели части дробей, затем сокращаем дробь
         """
-        # СОЗДАЕМ КОПИЮ other, чтобы не изменять исходный объект
-        other_copy = RationalModule(
-            IntegerModule(other.up.b, other.up.n, other.up.A.copy()),
-            NaturalModule(other.down.n, other.down.A.copy())
-        )
-        
-        # Умножаем числители
-        new_up = self.up.MUL_ZZ_Z(other_copy.up)
+        # Умножаем числители (MUL_ZZ_Z не изменяет множители, other не копируется)
+        new_up = self.up.MUL_ZZ_Z(other.up)
         
-        # Умножаем знаменатели  
-        new_down = NaturalModule(self.down.n, self.down.A.copy())
-        new_down.MUL_NN_N(other_copy.down)
+        # Умножаем знаменатели: копия знаменателя self (за O(1)) на знаменатель other
+        new_down = self.down._clone().MUL_NN_N(other.down)
         
         # Обновляем текущий объект
         self.up = new_up
@@ -160,6 +193,7 @@ class RationalModule:
         return self.RED_Q_Q()
 
 
+    @values.value_op
     def DIV_QQ_Q(self, other):
         """
         Овчаренко 4384
@@ -174,26 +208,18 @@ class RationalModule:
         if other.up.POZ_Z_D() == 0:
             raise ZeroDivisionError("Деление на ноль")
         
-        # Создаем копии для безопасности
-        self_up_copy = IntegerModule(self.up.b, self.up.n, self.up.A.copy())
-        self_down_copy = NaturalModule(self.down.n, self.down.A.copy())
-        other_up_copy = IntegerModule(other.up.b, other.up.n, other.up.A.copy())
-        other_down_copy = NaturalModule(other.down.n, other.down.A.copy())
-        
-        # Умножаем на обратную дробь: (a/b) / (c/d) = (a*d) / (b*c)
-        
-        # Преобразуем other_down_copy в IntegerModule для умножения
-        other_down_int = IntegerModule(0, other_down_copy.n, other_down_copy.A.copy())
-        new_up = self_up_copy.MUL_ZZ_Z(other_down_int)
-        
-        new_down = NaturalModule(self_down_copy.n, self_down_copy.A.copy())
-        
+        # Умножаем на обратную дробь: (a/b) / (c/d) = (a*d) / (b*c);
+        # операнды не изменяются, поэтому не копируются
+
+        # Знаменатель other как неотрицательное целое (копия модуля за O(1))
+        other_down_int = IntegerModule._from_natural(other.down._clone(), False)
+        new_up = self.up.MUL_ZZ_Z(other_down_int)
+
         # Для знаменателя используем модуль числителя other
-        other_up_abs = other_up_copy.ABS_Z_Z().TRANS_Z_N()
-        new_down.MUL_NN_N(other_up_abs)
-        
+        new_down = self.down._clone().MUL_NN_N(other.up.magnitude)
+
         # Учитываем знак other
-        if other_up_copy.b == 1:  # Если other отрицательный
+        if other.up.b == 1:  # Если other отрицательный
             new_up = new_up.MUL_ZM_Z()
         
         # Обновляем объект
@@ -205,24 +231,23 @@ class RationalModule:
 
     def __ge__(self, other):
 
-        self_copy = RationalModule(
-            IntegerModule(self.up.b, self.up.n, self.up.A.copy()),
-            NaturalModule(self.down.n, self.down.A.copy())
-        )
-        other_copy = RationalModule(
-            IntegerModule(other.up.b, other.up.n, other.up.A.copy()),
-            NaturalModule(other.down.n, other.down.A.copy())
-        )
-        sub = self_copy.SUB_QQ_Q(other_copy)
-        if sub.up.POZ_Z_D() == 1 or sub.up.POZ_Z_D() == 0:
+        # SUB_QQ_Q изменяет только уменьшаемое: копируется одна дробь (за O(1))
+        sub = self._clone().SUB_QQ_Q(other)
+        if sub.sign() >= 0:
             return True
         return False
 
 
     def __str__(self):
-        sign = "-" if self.up.b else ""
-        if self.up.A == [0]:
+        # Числитель и знаменатель выводятся своими __str__ (без распаковки в цифры)
+        if self.up.is_zero():
             return "0"
-        if self.down.A == [1]:
-            return f"{sign}{''.join(map(str, self.up.A[::-1]))}"
-        return f"{sign}{''.join(map(str, self.up.A[::-1]))}/{''.join(map(str, self.down.A[::-1]))}"
\ No newline at end of file
+        if self.down.is_one():
+            return str(self.up)
+        return f"{self.up}/{self.down}"
+
+
+# Неизменяемые константы (см. values.py)
+RationalModule.ZERO = values.freeze(RationalModule(IntegerModule.ZERO, NaturalModule.ONE))
+RationalModule.ONE = values.freeze(RationalModule(IntegerModule.ONE, NaturalModule.ONE))
+RationalModule.TEN = values.freeze(RationalModule(IntegerModule.TEN, NaturalModule.ONE))
@@ -31,18 +31,8 @@ class RealModule:
             coef2 = other.C[i] if i < len(other.C) else RationalModule(
                 IntegerModule(0, 0, [0]), NaturalModule(0, [1]))
 
-            # Создаем копии коэффициентов
-            coef1_copy = RationalModule(
-                IntegerModule(coef1.up.b, coef1.up.n, coef1.up.A.copy()),
-                NaturalModule(coef1.down.n, coef1.down.A.copy())
-            )
-            coef2_copy = RationalModule(
-                IntegerModule(coef2.up.b, coef2.up.n, coef2.up.A.copy()),
-                NaturalModule(coef2.down.n, coef2.down.A.copy())
-            )
-
-            # Складываем коэффициенты
-            result_coef = coef1_copy.ADD_QQ_Q(coef2_copy)
+            # Складываем коэффициенты: изменяется только копия первого (за O(1))
+            result_coef = coef1._clone().ADD_QQ_Q(coef2)
             new_C.append(result_coef)
 
         return RealModule(max_degree, new_C)
@@ -70,18 +60,8 @@ class RealModule:
             coef2 = other.C[i] if i < len(other.C) else RationalModule(
                 IntegerModule(0, 0, [0]), NaturalModule(0, [1]))
 
-            # Создаем копии коэффициентов
-            coef1_copy = RationalModule(
-                IntegerModule(coef1.up.b, coef1.up.n, coef1.up.A.copy()),
-                NaturalModule(coef1.down.n, coef1.down.A.copy())
-            )
-            coef2_copy = RationalModule(
-                IntegerModule(coef2.up.b, coef2.up.n, coef2.up.A.copy()),
-                NaturalModule(coef2.down.n, coef2.down.A.copy())
-            )
-
-            # Вычитаем коэффициенты
-            result_coef = coef1_copy.SUB_QQ_Q(coef2_copy)
+            # Вычитаем коэффициенты: изменяется только копия первого (за O(1))
+            result_coef = coef1._clone().SUB_QQ_Q(coef2)
             new_C.append(result_coef)
 
         return RealModule(max_degree, new_C)
@@ -98,26 +78,14 @@ class RealModule:
         3. Вернуть новый многочлен с полученными коэффициентами
         """
         # Если умножаем на ноль, возвращаем нулевой многочлен
-        if q.up.POZ_Z_D() == 0:
+        if q.is_zero():
             return RealModule(0, [RationalModule(IntegerModule(0, 0, [0]), NaturalModule(0, [1]))])
 
-        # СОЗДАЕМ КОПИЮ рационального числа, чтобы не изменять исходный
-        q_copy = RationalModule(
-            IntegerModule(q.up.b, q.up.n, q.up.A.copy()),
-            NaturalModule(q.down.n, q.down.A.copy())
-        )
-
         new_C = []
 
         for coef in self.C:
-            # Создаем копию коэффициента
-            coef_copy = RationalModule(
-                IntegerModule(coef.up.b, coef.up.n, coef.up.A.copy()),
-                NaturalModule(coef.down.n, coef.down.A.copy())
-            )
-
-            # Умножаем на копию рационального числа
-            result_coef = coef_copy.MUL_QQ_Q(q_copy)
+            # Умножаем копию коэффициента (за O(1)) на q; q не изменяется
+            result_coef = coef._clone().MUL_QQ_Q(q)
             new_C.append(result_coef)
 
         return RealModule(self.m, new_C)
@@ -164,6 +132,13 @@ class RealModule:
             )
         return self.C[-1]
 
+    def is_zero(self) -> bool:
+        """
+        Проверка: все коэффициенты многочлена равны нулю
+        (каждый коэффициент проверяется за O(1)).
+        """
+        return all(c.is_zero() for c in self.C)
+
     def DEG_P_N(self):
         """
         Боков 4384
@@ -183,33 +158,26 @@ class RealModule:
         4. Вернуть рациональное число: НОД числителей / НОК знаменателей
         """
         # Если многочлен нулевой, возвращаем 1/1
-        if all(coef.up.A == [0] for coef in self.C):
+        if self.is_zero():
             one_int = IntegerModule(0, 0, [1])
             one_natural = NaturalModule(0, [1])
             return RationalModule(one_int, one_natural)
 
-        # Находим НОК всех знаменателей
-        lcm_denom = None
-        for coef in self.C:
-            if coef.up.A != [0]:  # Пропускаем нулевые коэффициенты
-                if lcm_denom is None:
-                    lcm_denom = NaturalModule(coef.down.n, coef.down.A.copy())
-                else:
-                    current_denom = NaturalModule(coef.down.n, coef.down.A.copy())
-                    lcm_denom = lcm_denom.LCM_NN_N(current_denom)
+        # Находим НОК всех знаменателей (деревом попарных НОК)
+        denoms = [coef.down for coef in self.C if not coef.is_zero()]  # Пропускаем нулевые коэффициенты
+        lcm_denom = NaturalModule.LCM_MANY_N(denoms) if denoms else None
 
         # Находим НОД всех числителей (взятых по модулю)
         gcd_num = None
         for coef in self.C:
-            if coef.up.A != [0]:  # Пропускаем нулевые коэффициенты
-                # Получаем модуль числителя
-                abs_num = coef.up.ABS_Z_Z()  # Используем ABS_Z_Z для получения модуля
+            if not coef.is_zero():  # Пропускаем нулевые коэффициенты
+                # Получаем модуль числителя (копия за O(1), коэффициент не изменяется)
+                abs_num = coef.up._natural_abs()
 
                 if gcd_num is None:
-                    gcd_num = NaturalModule(abs_num.n, abs_num.A.copy())
+                    gcd_num = abs_num
                 else:
-                    current_num = NaturalModule(abs_num.n, abs_num.A.copy())
-                    gcd_num = gcd_num.GCF_NN_N(current_num)
+                    gcd_num = gcd_num.GCF_NN_N(abs_num)
 
         # Если все коэффициенты нулевые
         if lcm_denom is None:
@@ -218,8 +186,7 @@ class RealModule:
             return RationalModule(one_int, one_natural)
 
         # Преобразуем НОД числителей в целое число
-        gcd_int = IntegerModule(0, 0, [0])
-        gcd_int = gcd_int.TRANS_N_Z(gcd_num.n, gcd_num.A.copy())
+        gcd_int = IntegerModule._from_natural(gcd_num, False)
 
         # Создаем результирующее рациональное число: НОД_числителей / НОК_знаменателей
         return RationalModule(gcd_int, lcm_denom)
@@ -228,7 +195,7 @@ class RealModule:
         """
         Шакуров 4384
         Умножение многочленов
-        Использует: MUL_PQ_P, MUL_Pxk_P, ADD_PP_P
+        Использует: MUL_PQ_P, MUL_Pxk_P, ADD_PP_P (квадрат - SQR_P_P)
 
         Параметры:
         - self: первый многочлен (текущий объект)
@@ -237,6 +204,10 @@ class RealModule:
         Возвращает:
         - result: произведение многочленов self × other
         """
+        # Квадрат (тот же объект или те же коэффициенты) - отдельным алгоритмом
+        if other is self or self._same_coefs(other):
+            return self.SQR_P_P()
+
         # Создаем нулевой рациональный коэффициент 0/1
         zero = RationalModule(IntegerModule(0, 0, [0]), NaturalModule(0, [1]))
 
@@ -266,13 +237,85 @@ class RealModule:
         # Проверяем, что все коэффициенты равны нулю
         # c.up.A - числитель рационального числа (коэффициента)
         # [0] - представление нуля в модуле целых чисел
-        if all(c.up.A == [0] for c in result.C):
+        if result.is_zero():
             # Если все коэффициенты нулевые, создаем канонический нулевой многочлен
             # степени 0 с одним нулевым коэффициентом
             result = RealModule(0, [zero])
 
         return result
 
+    def _same_coefs(self, other) -> bool:
+        """
+        Совпадают ли многочлены покоэффициентно (коэффициенты не изменяются).
+        Числители и знаменатели сравниваются по значению (COM_NN_D) до первого
+        несовпадения, без перевода в строки.
+        """
+        if len(self.C) != len(other.C):
+            return False
+        for a, b in zip(self.C, other.C):
+            if (a.sign() != b.sign()
+                    or a.up.magnitude.COM_NN_D(b.up.magnitude) != 0
+                    or a.down.COM_NN_D(b.down) != 0):
+                return False
+        return True
+
+    def SQR_P_P(self):
+        """
+        Возведение многочлена в квадрат
+
+        Принимает на вход: self - многочлен (не изменяется)
+        Возвращает: новый многочлен self × self
+
+        Алгоритм: коэффициенты приводятся к общему знаменателю D (НОК знаменателей),
+        дальше работа идёт с целыми числителями a_i. Коэффициент квадрата при x^k
+        равен 2 * сумма a_i * a_j (i < j, i + j = k) + a_(k/2)^2, поэтому каждое
+        попарное произведение вычисляется один раз, а не дважды, как при умножении
+        многочлена на себя; знаменатель у всех коэффициентов - D^2 (с сокращением).
+        """
+        zero = RationalModule(IntegerModule(0, 0, [0]), NaturalModule(0, [1]))
+        if self.is_zero():
+            return RealModule(0, [zero])
+
+        # Общий знаменатель и числители a_i = up_i * (D / down_i) по модулю со знаками
+        denom = NaturalModule.LCM_MANY_N([c.down for c in self.C if not c.is_zero()])
+        mags, signs = [], []
+        for c in self.C:
+            if c.is_zero():
+                mags.append(None)
+                signs.append(0)
+                continue
+            factor = denom._clone().DIV_NN_N(c.down._clone())
+            mags.append(c.up._natural_abs().MUL_NN_N(factor))
+            signs.append(c.up.b)
+
+        # Суммы положительных и отрицательных вкладов в каждый коэффициент
+        size = len(self.C)
+        pos = [NaturalModule(0, [0]) for _ in range(2 * size - 1)]
+        neg = [NaturalModule(0, [0]) for _ in range(2 * size - 1)]
+        for i in range(size):
+            if mags[i] is None:
+                continue
+            square = mags[i]._clone().SQR_N_N()
+            pos[2 * i] = pos[2 * i].ADD_NN_N(square)
+            for j in range(i + 1, size):
+                if mags[j] is None:
+                    continue
+                prod = mags[i]._clone().MUL_NN_N(mags[j]).MUL_ND_N(2)
+                target = neg if signs[i] != signs[j] else pos
+                target[i + j] = target[i + j].ADD_NN_N(prod)
+
+        denom_sqr = denom._clone().SQR_N_N()
+        new_C = []
+        for k in range(2 * size - 1):
+            if pos[k].COM_NN_D(neg[k]) == 1:
+                up = IntegerModule._from_natural(neg[k].SUB_NN_N(pos[k]), True)
+            else:
+                up = IntegerModule._from_natural(pos[k].SUB_NN_N(neg[k]), False)
+            down = denom_sqr._clone()
+            new_C.append(RationalModule(up, down).RED_Q_Q())
+
+        return RealModule(2 * size - 2, new_C)
+
     def DIV_PP_P(self, other):
         """
         Шакуров 4384
@@ -290,16 +333,13 @@ class RealModule:
         """
         # Проверка деления на нулевой многочлен
         # Если все коэффициенты делителя равны нулю, вызываем ошибку
-        if all(c.up.A == [0] for c in other.C):
+        if other.is_zero():
             raise ZeroDivisionError("Деление на нулевой многочлен")
 
         # Создаем глубокую копию делимого (self) для работы с остатком R
         # Это нужно, чтобы не изменять исходный многочлен
         # Копируем каждый коэффициент с сохранением всех свойств
-        R = RealModule(self.m, [RationalModule(
-            IntegerModule(c.up.b, c.up.n, c.up.A.copy()),  # Копируем числитель
-            NaturalModule(c.down.n, c.down.A.copy())       # Копируем знаменатель
-        ) for c in self.C])
+        R = RealModule(self.m, [c._clone() for c in self.C])
 
         # Инициализируем частное Q как нулевой многочлен
         # RationalModule(IntegerModule(0, 0, [0]), NaturalModule(0, [1])) - создает рациональный 0
@@ -321,7 +361,7 @@ class RealModule:
 
             # Проверяем, не стал ли остаток нулевым
             # Если все коэффициенты остатка равны нулю, деление завершено
-            if all(c.up.A == [0] for c in R.C):
+            if R.is_zero():
                 break
 
             # Получаем старшие коэффициенты (leading coefficients) остатка и делителя
@@ -330,13 +370,10 @@ class RealModule:
             lc_B = other.LED_P_Q()  # Старший коэффициент делителя
 
             # Создаем копию старшего коэффициента остатка для деления
-            coef = RationalModule(
-                IntegerModule(lc_R.up.b, lc_R.up.n, lc_R.up.A.copy()),
-                NaturalModule(lc_R.down.n, lc_R.down.A.copy())
-            )
+            coef = lc_R._clone()
             # Делим старший коэффициент остатка на старший коэффициент делителя
             # Это дает коэффициент для следующего члена частного
-            coef.DIV_QQ_Q(lc_B)
+            coef = coef.DIV_QQ_Q(lc_B)
 
             # Вычисляем степень, на которую нужно сдвинуть
             # Разность степеней остатка и делителя определяет степень x в текущем члене
@@ -361,7 +398,7 @@ class RealModule:
             while len(R.C) > 1:
                 last_coef = R.C[-1]  # Берем старший коэффициент
                 # Проверяем, является ли коэффициент нулевым
-                if last_coef.up.A == [0] or (last_coef.up.n == 0 and last_coef.up.A[0] == 0):
+                if last_coef.is_zero():
                     R.C.pop()  # Удаляем нулевой коэффициент
                 else:
                     break  # Встретили ненулевой коэффициент - останавливаемся
@@ -392,31 +429,11 @@ class RealModule:
         # Для каждого коэффициента начиная со второго (a1*x^1, a2*x^2, ...)
         for i in range(1, len(self.C)):
             coef = self.C[i]
-            # умножаем коэффициент на степень i (натуральное число)
-            # создаём новый RationalModule вручную
-            new_up = IntegerModule(
-                coef.up.b,  # знак
-                coef.up.n,
-                coef.up.A.copy()
-            )
+            # умножаем числитель на степень i (числитель коэффициента не изменяется)
+            new_up = coef.up.MUL_ZZ_Z(IntegerModule._from_int(i))
 
-            # умножаем числитель на i
-            # простое целочисленное умножение 
-            carry = 0
-            res = []
-            A = new_up.A.copy()
-            for digit in A:
-                prod = digit * i + carry
-                res.append(prod % 10)
-                carry = prod // 10
-            while carry > 0:
-                res.append(carry % 10)
-                carry //= 10
-            new_up.A = res
-            new_up.n = len(res)
-
-            # знаменатель не меняется
-            new_down = NaturalModule(coef.down.n, coef.down.A.copy())
+            # знаменатель не меняется (копия за O(1))
+            new_down = coef.down._clone()
 
             new_coeffs.append(RationalModule(new_up, new_down))
 
@@ -437,22 +454,11 @@ class RealModule:
         Возвращает:
         - remainder: остаток от деления self на other
         
-        Использует: DIV_PP_P, MUL_PP_P, SUB_PP_P, POZ_Z_D
+        Использует: DIV_PP_P, MUL_PP_P, SUB_PP_P, is_zero
         """
-        
-        # Вспомогательная функция для проверки, является ли многочлен нулевым
-        def is_zero_poly(p):
-            """
-            Проверяет, является ли многочлен нулевым
-            POZ_Z_D() возвращает:
-            - 0 если число равно нулю
-            - 1 если число положительное  
-            - 2 если число отрицательное
-            """
-            return all(coef.up.POZ_Z_D() == 0 for coef in p.C)
 
         # Проверка деления на нулевой многочлен
-        if is_zero_poly(other):
+        if other.is_zero():
             raise ZeroDivisionError("Деление на нулевой многочлен")
 
         # Шаг 1: Вычисляем частное от деления
@@ -474,7 +480,7 @@ class RealModule:
         # Это необходимо для канонического представления многочлена
         
         # Пока в остатке больше одного коэффициента и старший коэффициент равен нулю
-        while len(remainder.C) > 1 and remainder.C[-1].up.POZ_Z_D() == 0:
+        while len(remainder.C) > 1 and remainder.C[-1].is_zero():
             remainder.C.pop()  # Удаляем нулевой старший коэффициент
         
         # Обновляем степень многочлена (степень = количество коэффициентов - 1)
@@ -500,35 +506,9 @@ class RealModule:
         """
         # Создаем глубокие копии многочленов для работы
         # Это необходимо, чтобы не изменять исходные многочлены
-        A = RealModule(self.m, [RationalModule(
-            IntegerModule(c.up.b, c.up.n, c.up.A.copy()),  # Копируем числитель
-            NaturalModule(c.down.n, c.down.A.copy())       # Копируем знаменатель
-        ) for c in self.C])
-
-        B = RealModule(other.m, [RationalModule(
-            IntegerModule(c.up.b, c.up.n, c.up.A.copy()),  # Копируем числитель  
-            NaturalModule(c.down.n, c.down.A.copy())       # Копируем знаменатель
-        ) for c in other.C])
-
-        def is_zero_poly(p: "RealModule") -> bool:
-            """
-            Проверка: все коэффициенты равны 0.
-
-            coef.up.POZ_Z_D():
-            0 – число = 0
-            1 – > 0
-            2 – < 0
-            """
-            for coef in p.C:
-                try:
-                    if coef.up.POZ_Z_D() != 0:
-                        return False
-                except Exception:
-                    # На всякий случай: если внутреннее представление "битое",
-                    # но есть хотя бы одна ненулевая цифра, считаем коэффициент ненулевым.
-                    if getattr(coef.up, "A", None) and any(d != 0 for d in coef.up.A):
-                        return False
-            return True
+        A = RealModule(self.m, [c._clone() for c in self.C])
+
+        B = RealModule(other.m, [c._clone() for c in other.C])
 
         # Алгоритм Евклида с улучшенными условиями остановки
         max_iterations = 100  # Защита от бесконечного цикла
@@ -536,7 +516,7 @@ class RealModule:
 
         # Основной цикл алгоритма Евклида
         # Продолжаем, пока B не станет нулевым многочленом
-        while not is_zero_poly(B) and iteration < max_iterations:
+        while not B.is_zero() and iteration < max_iterations:
             iteration += 1
 
             # Если степень B больше степени A, меняем местами
@@ -564,10 +544,10 @@ class RealModule:
         # Определяем результат:
         # Если B стал нулевым, то НОД = A
         # Иначе НОД = B (последний ненулевой остаток)
-        result = A if is_zero_poly(B) else B
+        result = A if B.is_zero() else B
 
         # Нормализация результата (делаем старший коэффициент равным 1)
-        if not is_zero_poly(result):
+        if not result.is_zero():
             # Получаем старший коэффициент многочлена
             leading_coef = result.LED_P_Q()
 
@@ -578,12 +558,9 @@ class RealModule:
                 new_coeffs = []
                 for coef in result.C:
                     # Создаем копию коэффициента
-                    coef_copy = RationalModule(
-                        IntegerModule(coef.up.b, coef.up.n, coef.up.A.copy()),
-                        NaturalModule(coef.down.n, coef.down.A.copy())
-                    )
+                    coef_copy = coef._clone()
                     # Делим коэффициент на старший коэффициент
-                    coef_copy.DIV_QQ_Q(leading_coef)
+                    coef_copy = coef_copy.DIV_QQ_Q(leading_coef)
                     new_coeffs.append(coef_copy)
 
                 # Создаем нормализованный многочлен
@@ -651,7 +628,7 @@ class RealModule:
             coef = self.C[i]
 
             # Пропускаем нулевые коэффициенты
-            if coef.up.POZ_Z_D() == 0:
+            if coef.is_zero():
                 continue
 
             degree = i
@@ -0,0 +1,148 @@
+from array import array
+from . import limbs
+from . import multiplication
+from . import division
+from .natural_module import NaturalModule
+
+
+# Длина (в лимбах), до которой обратная величина вычисляется одним делением.
+# Для более длинных делителей точность удваивается итерациями Ньютона
+# (значение должно быть не меньше 6, иначе рекурсия не уменьшает длину).
+NEWTON_BASECASE = 16
+
+
+def _reciprocal(b, n: int):
+    """
+    Обратная величина делителя: floor(BASE^(2n) / b).
+
+    Принимает на вход: b - нормализованный массив лимбов длины n
+    Возвращает: массив лимбов (не длиннее n + 1)
+
+    Алгоритм: обратная величина старшей половины делителя (с двумя защитными
+    лимбами) даёт начальное приближение с относительной погрешностью меньше
+    BASE^(-n/2); один шаг Ньютона
+    x = x + x * (BASE^(2n) - b * x) / BASE^(2n) удваивает число верных лимбов,
+    после чего результат уточняется несколькими сложениями/вычитаниями b.
+    """
+    power = limbs.shift(array(limbs.TYPECODE, [1]), 2 * n)
+    if n <= NEWTON_BASECASE:
+        x, _ = division.div_mod(power, b)
+        return x
+
+    h = (n + 1) // 2 + 2
+    x = limbs.shift(_reciprocal(b[n - h:], h), n - h)
+
+    # Шаг Ньютона; невязка BASE^(2n) - b * x может быть любого знака
+    e = multiplication.mul(b, x)
+    if limbs.compare(e, power) != 2:
+        x = limbs.add(x, limbs.high(multiplication.mul(x, limbs.sub(power, e)), 2 * n))
+    else:
+        correction = limbs.high(multiplication.mul(x, limbs.sub(e, power)), 2 * n)
+        x = limbs.sub(x, limbs.add(correction, array(limbs.TYPECODE, [1])))
+
+    # Коррекция: 0 <= BASE^(2n) - b * x < b
+    one = array(limbs.TYPECODE, [1])
+    e = multiplication.mul(b, x)
+    while limbs.compare(e, power) == 2:
+        x = limbs.sub(x, one)
+        e = limbs.sub(e, b)
+    r = limbs.sub(power, e)
+    while limbs.compare(r, b) != 1:
+        x = limbs.add(x, one)
+        r = limbs.sub(r, b)
+    return x
+
+
+class Reciprocal:
+    """
+    Предвычисленная обратная величина натурального делителя.
+
+    Используется, когда много разных чисел делятся на один и тот же делитель:
+    после однократного построения (итерации Ньютона) каждое деление числа длиной
+    до 2n лимбов (n - длина делителя) сводится к двум умножениям и не более чем
+    двум вычитаниям (редукция Барретта). Более длинные делимые обрабатываются
+    блоками по n лимбов, как при делении "в столбик".
+    """
+
+    def __init__(self, divisor: NaturalModule):
+        """
+        Принимает на вход: divisor - натуральное число, отличное от нуля
+        """
+        b = divisor._get_limbs()
+        if limbs.is_zero(b):
+            raise ZeroDivisionError("Деление на ноль")
+        self._b = b
+        self._size = len(b)
+        self._v = _reciprocal(b, self._size)
+
+    def _reduce(self, x):
+        """
+        Деление x < BASE^(2n) на делитель: (частное, остаток).
+
+        Оценка частного floor(floor(x / BASE^(n-1)) * v / BASE^(n+1)) меньше
+        истинного не более чем на 2.
+        """
+        n = self._size
+        if limbs.compare(x, self._b) == 1:
+            return array(limbs.TYPECODE, [0]), x
+        q = limbs.high(multiplication.mul(limbs.high(x, n - 1), self._v), n + 1)
+        r = limbs.sub(x, multiplication.mul(q, self._b))
+        one = array(limbs.TYPECODE, [1])
+        while limbs.compare(r, self._b) != 1:
+            q = limbs.add(q, one)
+            r = limbs.sub(r, self._b)
+        return q, r
+
+    def _div_mod(self, a):
+        """
+        Частное и остаток в лимбах для делимого любой длины.
+        """
+        n = self._size
+        if len(a) <= 2 * n:
+            return self._reduce(a)
+
+        # Блоки по n лимбов от старшего к младшему: остаток всегда меньше делителя,
+        # поэтому остаток, дополненный блоком, короче 2n лимбов
+        q_blocks = []
+        r = array(limbs.TYPECODE, [0])
+        for i in range((len(a) - 1) // n * n, -1, -n):
+            q_block, r = self._reduce(limbs.add(limbs.shift(r, n), limbs.normalize(a[i:i + n])))
+            q_blocks.append(q_block)
+
+        q = []
+        for q_block in reversed(q_blocks):
+            q.extend(q_block)
+            q.extend([0] * (n - len(q_block)))
+        return limbs.normalize(q), r
+
+    def DIVMOD_NN_NN(self, other: NaturalModule):
+        """
+        Неполное частное и остаток от деления other на делитель
+
+        Принимает на вход: натуральное число (other)
+        Возвращает: (other, remainder) - other становится неполным частным,
+        remainder - новый объект NaturalModule с остатком
+        """
+        quotient, remainder = self._div_mod(other._get_limbs())
+        other._set_limbs(quotient)
+        return other, NaturalModule(None, None)._set_limbs(remainder)
+
+    def DIV_NN_N(self, other: NaturalModule):
+        """
+        Неполное частное от деления other на делитель
+
+        Принимает на вход: натуральное число (other)
+        Возвращает: other (изменённый объект) - неполное частное
+        """
+        quotient, _ = self._div_mod(other._get_limbs())
+        return other._set_limbs(quotient)
+
+    def MOD_NN_N(self, other: NaturalModule):
+        """
+        Остаток от деления other на делитель
+
+        Принимает на вход: натуральное число (other)
+        Возвращает: other (изменённый объект) - остаток
+        """
+        _, remainder = self._div_mod(other._get_limbs())
+        return other._set_limbs(remainder)
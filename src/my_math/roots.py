@@ -0,0 +1,143 @@
+import math
+from array import array
+from . import limbs
+from . import multiplication
+from . import division
+from . import power
+
+
+def _estimate(a, k: int):
+    """
+    Оценка сверху для корня k-й степени из a по длине числа и старшим лимбам:
+    a ~ t * BASE^(len - 3), где t - три старших лимба, корень ~ 10^(lg(a) / k).
+    Относительная погрешность оценки много меньше 10^(-9), поэтому к ней
+    добавляется такой запас.
+    """
+    top = limbs.to_int(a[-3:])
+    digits = math.log10(top + 1) + limbs.BASE_DIGITS * max(len(a) - 3, 0)
+    return limbs.from_int(int(10 ** (digits / k) * (1 + 1e-9)) + 1)
+
+
+def root(a, k: int):
+    """
+    Целая часть корня k-й степени: наибольшее x, для которого x^k <= a.
+
+    Принимает на вход: a - нормализованный массив лимбов, k >= 1
+    Возвращает: array('I') лимбов
+
+    Алгоритм: итерации Ньютона x = ((k - 1) * x + a // x^(k - 1)) // k, начиная
+    с оценки сверху; последовательность убывает, пока не дойдёт до ответа.
+    Начальная оценка для длинного корня берётся рекурсивно: корень из старших
+    лимбов a (примерно половина точности) сдвигается на h лимбов, после чего
+    хватает одной-двух итераций с полным делением. Короткий корень (до четырёх
+    лимбов) оценивается по длине числа и его старшим лимбам.
+    """
+    one = array(limbs.TYPECODE, [1])
+    if k == 1 or limbs.compare(a, one) != 2:
+        return array(limbs.TYPECODE, a)
+    # 2^k > a: корень равен единице (в лимбе меньше 2^30)
+    if k >= 30 * len(a):
+        return one
+
+    if len(a) >= 4 * k:
+        # Корень из старших лимбов, дополненный h нулевыми лимбами, плюс BASE^h
+        h = len(a) // k // 2
+        x = limbs.shift(limbs.add(root(a[k * h:], k), one), h)
+    else:
+        x = _estimate(a, k)
+
+    divisor = limbs.from_int(k)
+    k1 = limbs.from_int(k - 1)
+    while True:
+        q, _ = division.div_mod(a, power.power(x, k - 1))
+        y, _ = division.div_mod(limbs.add(multiplication.mul(x, k1), q), divisor)
+        if limbs.compare(y, x) != 1:
+            return x
+        x = y
+
+
+def isqrt(a):
+    """
+    Целая часть квадратного корня (root при k = 2).
+    """
+    return root(a, 2)
+
+
+def _primes(limit: int) -> list:
+    """
+    Простые числа, не превосходящие limit (решето Эратосфена).
+    """
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytearray(len(range(p * p, limit + 1, p)))
+    return [p for p in range(limit + 1) if sieve[p]]
+
+
+def _is_small_prime(q: int) -> bool:
+    """
+    Проверка простоты небольшого числа пробным делением.
+    """
+    if q < 2:
+        return False
+    return all(q % d for d in range(2, math.isqrt(q) + 1))
+
+
+def _power_residues(a, p: int, count: int = 8) -> bool:
+    """
+    Может ли a быть степенью p: для простых q = 1 (mod p) степень p по модулю q
+    удовлетворяет r^((q - 1) / p) = 1 (mod q) или r = 0. Не-степень проходит
+    каждую проверку с вероятностью около 1/p, поэтому count проверок (остаток
+    от деления на короткое q - один проход по лимбам) отсеивают почти все
+    показатели до дорогого вычисления корня.
+    """
+    q = p + 1
+    while count:
+        if _is_small_prime(q):
+            _, r = limbs.divmod_small(a, q)
+            if r and pow(r, (q - 1) // p, q) != 1:
+                return False
+            count -= 1
+        q += p
+    return True
+
+
+# Корень не длиннее стольких цифр находится по оценке через lg(a) (точность float)
+FLOAT_ROOT_DIGITS = 12
+
+
+def perfect_power(a):
+    """
+    Представление числа в виде точной степени с наибольшим показателем.
+
+    Принимает на вход: a - нормализованный массив лимбов
+    Возвращает: (x, k) - a = x^k, k >= 2 наибольший; None, если a - не точная
+    степень (0 и 1 степенями не считаются)
+
+    Алгоритм: достаточно перебрать простые показатели p <= log2(a). Для больших p
+    корень короткий: кандидат x - округлённое 10^(lg(a) / p), и x^p сравнивается
+    с a сначала по младшему лимбу (встроенное возведение по модулю BASE), затем
+    целиком. Для малых p показатель сначала проверяется вычетами по модулю
+    нескольких простых q = 1 (mod p) и только затем вычисляется root(a, p).
+    При совпадении перебор повторяется для x: показатели перемножаются.
+    """
+    if limbs.compare(a, array(limbs.TYPECODE, [1])) != 2:
+        return None
+    digits = math.log10(limbs.to_int(a[-3:])) + limbs.BASE_DIGITS * max(len(a) - 3, 0)
+    for p in _primes(math.ceil(digits * math.log2(10))):
+        if digits / p <= FLOAT_ROOT_DIGITS:
+            x = limbs.from_int(round(10 ** (digits / p)))
+            if pow(x[0], p, limbs.BASE) != a[0]:
+                continue
+        elif _power_residues(a, p):
+            x = root(a, p)
+        else:
+            continue
+        if limbs.compare(power.power(x, p), a) != 0:
+            continue
+        deeper = perfect_power(x)
+        if deeper is None:
+            return x, p
+        return deeper[0], deeper[1] * p
+    return None
@@ -0,0 +1,110 @@
+"""
+Калибровка порогов переключения алгоритмов умножения на текущей машине.
+
+Запуск (из каталога src):
+    python -m my_math.tuning
+
+Для каждого уровня (Карацуба, Toom-3, NTT) ищется наименьшая длина операндов,
+начиная с которой один шаг более быстрого алгоритма над уже настроенными
+нижними уровнями выигрывает у нижнего уровня. Найденные значения печатаются
+в виде, пригодном для вставки в my_math/multiplication.py.
+"""
+import random
+import time
+
+from . import limbs
+from . import multiplication
+
+
+def _random_limbs(size: int, rnd: random.Random):
+    """
+    Случайное число из size лимбов.
+    """
+    return limbs.normalize([rnd.randrange(limbs.BASE) for _ in range(size - 1)] +
+                           [rnd.randrange(1, limbs.BASE)])
+
+
+def _measure(a, b, repeat: int = 3) -> float:
+    """
+    Минимальное время умножения a * b из нескольких запусков.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        multiplication.mul(a, b)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _crossover(name: str, sizes, rnd: random.Random) -> int:
+    """
+    Поиск порога для уровня name (имя переменной модуля multiplication).
+
+    На каждой длине сравниваются два варианта: порог выше длины (работает нижний
+    уровень) и порог, равный длине (верхний уровень срабатывает один раз).
+    Порог принимается, если верхний уровень выиграл на двух длинах подряд.
+    Возвращает: порог в десятичных цифрах
+    """
+    saved = getattr(multiplication, name)
+    candidate = None
+    try:
+        for size in sizes:
+            a = _random_limbs(size, rnd)
+            b = _random_limbs(size, rnd)
+            digits = size * limbs.BASE_DIGITS
+
+            setattr(multiplication, name, digits + limbs.BASE_DIGITS)
+            lower = _measure(a, b)
+            setattr(multiplication, name, digits)
+            upper = _measure(a, b)
+
+            # Одиночный выигрыш часто оказывается шумом измерений
+            if upper < lower:
+                if candidate is not None:
+                    return candidate
+                candidate = digits
+            else:
+                candidate = None
+        return sizes[-1] * limbs.BASE_DIGITS
+    finally:
+        setattr(multiplication, name, saved)
+
+
+def calibrate(seed: int = 0) -> dict:
+    """
+    Калибровка всех порогов умножения (от нижнего уровня к верхнему).
+    Найденные значения сразу применяются в текущем процессе.
+
+    Возвращает: словарь {имя порога: значение в десятичных цифрах}
+    """
+    rnd = random.Random(seed)
+    result = {}
+
+    # Верхние уровни не должны вмешиваться в калибровку нижних
+    saved_toom = multiplication.TOOM3_THRESHOLD
+    multiplication.TOOM3_THRESHOLD = 10 ** 12
+    result["KARATSUBA_THRESHOLD"] = _crossover(
+        "KARATSUBA_THRESHOLD", [8, 12, 16, 24, 32, 40, 48, 64, 80, 96, 128], rnd)
+    multiplication.TOOM3_THRESHOLD = saved_toom
+
+    multiplication.KARATSUBA_THRESHOLD = result["KARATSUBA_THRESHOLD"]
+    saved_ntt = multiplication.NTT_THRESHOLD
+    multiplication.NTT_THRESHOLD = 10 ** 12
+    result["TOOM3_THRESHOLD"] = _crossover(
+        "TOOM3_THRESHOLD", [128, 192, 256, 384, 512, 768, 1024, 1536, 2048], rnd)
+    multiplication.NTT_THRESHOLD = saved_ntt
+
+    multiplication.TOOM3_THRESHOLD = result["TOOM3_THRESHOLD"]
+    result["NTT_THRESHOLD"] = _crossover(
+        "NTT_THRESHOLD", [256, 384, 512, 768, 1024, 1536, 2048, 3072, 4096], rnd)
+    multiplication.NTT_THRESHOLD = result["NTT_THRESHOLD"]
+    return result
+
+
+def main():
+    for name, value in calibrate().items():
+        print(f"{name} = {value}")
+
+
+if __name__ == "__main__":
+    main()
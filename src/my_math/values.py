@@ -0,0 +1,217 @@
+"""
+Режим значений: числа как неизменяемые значения.
+
+По умолчанию методы NaturalModule, IntegerModule и RationalModule изменяют
+объект, у которого вызваны (self), а иногда и аргументы, поэтому вызывающий код
+копирует операнды перед каждой операцией. В режиме значений каждая операция,
+вызванная снаружи модулей, выполняется над копией self и копиями аргументов и
+возвращает новое неизменяемое число: исходные числа не изменяются, копировать
+их заранее не нужно. Операции, вызванные изнутри других операций, по-прежнему изменяют
+промежуточные объекты на месте, так что внутренний код модулей не меняется.
+В обычном режиме операции вызываются без обёрток.
+
+Независимо от режима неизменяемы константы ZERO, ONE и TEN каждого класса
+(например, NaturalModule.ONE): любая изменяющая операция константы выполняется
+над её копией (в том числе когда константа - аргумент, который операция
+изменяет). В режиме значений from_str (и IntegerModule._from_int вне операций)
+возвращают эти константы вместо новых объектов, равных 0, 1 или 10.
+
+Числа сравниваются по значению (==). Хэшируются только неизменяемые числа:
+константы, результаты операций в режиме значений и копии, полученные через
+frozen(x). Числа из конструкторов и from_str (кроме констант) изменяемы в любом
+режиме (например, через массив цифр A), поэтому ключом словаря служит
+values.frozen(x).
+
+Режим значений несовместим с кодом, который рассчитывает на изменение операндов
+на месте (x.ADD_1N_N() без присваивания результата, DIVMOD_NN_NN с частным
+в self и т.п.): в этом режиме такие вызовы не изменяют x. Тесты такого поведения
+отмечены pytest.mark.in_place и при MY_MATH_VALUES=1 пропускаются
+(см. tests/conftest.py).
+
+Режим включается на весь процесс переменной окружения MY_MATH_VALUES=1
+(читается при импорте пакета my_math) или вызовом enable(), например:
+    with values.using():
+        c = a.ADD_NN_N(b)  # a и b не изменились
+"""
+import os
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+
+ENV_VAR = "MY_MATH_VALUES"  # переменная окружения: 1 - режим значений
+_TRUE = {"1", "true", "yes", "on"}
+
+_enabled = False
+
+
+class _State(threading.local):
+    """
+    Вложенность операций в текущем потоке: 0 - вызов снаружи модулей
+    (у каждого потока, например запроса Flask, свой счётчик).
+    """
+    depth = 0
+
+
+_state = _State()
+
+
+def enabled() -> bool:
+    """
+    Включён ли режим значений.
+    """
+    return _enabled
+
+
+def enable(flag: bool = True) -> bool:
+    """
+    Включение (flag=True) или выключение режима значений для всего процесса.
+
+    Возвращает: прежнее состояние режима
+    """
+    global _enabled
+    previous, _enabled = _enabled, bool(flag)
+    if previous != _enabled:
+        for cls in _classes:
+            _apply(cls)
+    return previous
+
+
+@contextmanager
+def using(flag: bool = True):
+    """
+    Временное включение (или выключение) режима значений.
+    """
+    previous = enable(flag)
+    try:
+        yield
+    finally:
+        enable(previous)
+
+
+def use_from_env(environ=None) -> bool:
+    """
+    Выбор режима по переменной окружения MY_MATH_VALUES.
+
+    Возвращает: включён ли режим значений
+    """
+    environ = os.environ if environ is None else environ
+    flag = environ.get(ENV_VAR, "").strip().lower() in _TRUE
+    enable(flag)
+    return flag
+
+
+_classes = []  # классы чисел, зарегистрированные через register
+
+
+def value_op(method):
+    """
+    Отметка операции, изменяющей self (и, возможно, аргументы).
+
+    В обычном режиме метод вызывается как есть (без накладных расходов);
+    в режиме значений register подменяет его обёрткой, а у констант он
+    всегда выполняется над копией.
+    """
+    method._value_op = True
+    return method
+
+
+def _is_number(value) -> bool:
+    return hasattr(value, "_clone")
+
+
+def _value_wrapper(method):
+    """
+    Операция в режиме значений: внешний вызов работает с копиями self
+    и всех числовых аргументов и возвращает неизменяемые числа, вложенные
+    вызовы - как в обычном режиме.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        state = _state
+        outer = state.depth == 0
+        if outer:
+            self = self._clone()
+            args = tuple(arg._clone() if _is_number(arg) else arg for arg in args)
+        state.depth += 1
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            state.depth -= 1
+        return _freeze_result(result) if outer else result
+    return wrapper
+
+
+def _frozen_op(name: str):
+    """
+    Операция константы: выполняется над изменяемой копией.
+    """
+    def op(self, *args, **kwargs):
+        return getattr(self._clone(), name)(*args, **kwargs)
+    op.__name__ = name
+    return op
+
+
+def _frozen_hash(self):
+    return hash(self._key())
+
+
+def _apply(cls):
+    for name, method in cls._VALUE_OPS.items():
+        setattr(cls, name, _value_wrapper(method) if _enabled else method)
+
+
+def register(cls):
+    """
+    Декоратор класса чисел: собирает отмеченные value_op операции и строит
+    подкласс неизменяемых констант (см. freeze).
+    """
+    cls._VALUE_OPS = {name: method for name, method in vars(cls).items()
+                      if getattr(method, "_value_op", False)}
+    namespace = {name: _frozen_op(name) for name in cls._VALUE_OPS}
+    namespace["__slots__"] = ()
+    namespace["__hash__"] = _frozen_hash
+    namespace["__module__"] = cls.__module__
+    cls._FROZEN = type("Frozen" + cls.__name__, (cls,), namespace)
+    _classes.append(cls)
+    _apply(cls)
+    return cls
+
+
+def constant(cls, value: int):
+    """
+    Константа cls для значения value (0, 1 или 10) в режиме значений
+    вне операций, иначе None.
+    """
+    if not _enabled or _state.depth:
+        return None
+    return cls._CONSTANTS.get(value)
+
+
+def freeze(number):
+    """
+    Делает число неизменяемым (константы, frozen) и возвращает его.
+    """
+    number.__class__ = type(number)._FROZEN
+    return number
+
+
+def _freeze_result(result):
+    """
+    Замораживает на месте новое число (вместе с частями из _PARTS, например
+    числителем и знаменателем дроби) или числа в кортеже результатов.
+    """
+    if _is_number(result):
+        for name in getattr(type(result), "_PARTS", ()):
+            _freeze_result(getattr(result, name))
+        return freeze(result)
+    if isinstance(result, tuple):
+        return tuple(_freeze_result(item) for item in result)
+    return result
+
+
+def frozen(number):
+    """
+    Неизменяемая копия числа; её можно хэшировать и использовать как ключ словаря.
+    """
+    return _freeze_result(number._clone())
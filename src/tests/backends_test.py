@@ -0,0 +1,118 @@
+import math
+import random
+import pytest
+from ..my_math import backends
+from ..my_math import division
+from ..my_math import gcd
+from ..my_math.natural_module import NaturalModule
+from ..my_math.integer_module import IntegerModule
+
+
+def test_registry():
+    """Встроенные движки зарегистрированы, неизвестное имя - ошибка"""
+    assert {"auto", "digits", "limbs", "native"} <= set(backends.available())
+    with pytest.raises(ValueError):
+        backends.get("abacus")
+
+
+@pytest.mark.parametrize("environ,expected", [
+    ({}, "auto"),
+    ({"MY_MATH_BACKEND": ""}, "auto"),
+    ({"MY_MATH_BACKEND": "native"}, "native"),
+    ({"MY_MATH_BACKEND": " limbs "}, "limbs"),
+])
+def test_use_from_env(environ, expected):
+    """use_from_env: выбор движка по переменной окружения"""
+    previous = backends.current()
+    try:
+        assert backends.use_from_env(environ) == expected
+        assert backends.current() == expected
+    finally:
+        backends.use(previous)
+
+
+def test_using_restores():
+    """using: после блока возвращается прежний движок"""
+    previous = backends.current()
+    with backends.using("digits"):
+        assert backends.current() == "digits"
+        assert NaturalModule.from_str("12")._as_small() is None
+    assert backends.current() == previous
+
+
+def natural_ops(a: int, b: int) -> list:
+    """Результаты операций над натуральными числами в текущем движке"""
+    def num(v):
+        return NaturalModule.from_str(str(v))
+    result = [
+        num(a).COM_NN_D(num(b)),
+        str(num(a).ADD_NN_N(num(b))),
+        str(num(a).MUL_NN_N(num(b))),
+        str(num(a).MUL_Nk_N(7)),
+        str(num(a).ADD_1N_N()),
+        str(num(a).GCF_NN_N(num(b))),
+        str(num(a).LCM_NN_N(num(b))),
+    ]
+    if a >= b:
+        result.append(str(num(a).SUB_NN_N(num(b))))
+    if b:
+        q, r = num(a).DIVMOD_NN_NN(num(b))
+        result += [str(q), str(r)]
+    x = num(a)
+    result.append(x.A[:3] + [x.n])  # представление цифрами доступно в любом движке
+    return result
+
+
+def integer_ops(a: int, b: int) -> list:
+    """Результаты операций над целыми числами в текущем движке"""
+    def num(v):
+        return IntegerModule.from_str(str(v))
+    result = [
+        str(num(a).ADD_ZZ_Z(num(b))),
+        str(num(a).SUB_ZZ_Z(num(b))),
+        str(num(a).MUL_ZZ_Z(num(b))),
+        num(a).POZ_Z_D(),
+        str(num(a).MUL_ZM_Z()),
+    ]
+    if b:
+        result += [str(num(a).DIV_ZZ_Z(num(b))), str(num(a).MOD_ZZ_Z(num(b)))]
+    return result
+
+
+@pytest.mark.parametrize("name", ["auto", "limbs", "native"])
+def test_backends_match_reference(name):
+    """Все движки совпадают с эталонным движком digits"""
+    rnd = random.Random(14)
+    pairs = [(0, 0), (5, 0), (2 ** 64 - 1, 1), (10 ** 50, 10 ** 50 - 1)]
+    pairs += [(rnd.randrange(10 ** rnd.randint(1, 80)), rnd.randrange(10 ** rnd.randint(1, 60)))
+              for _ in range(40)]
+    for a, b in pairs:
+        with backends.using("digits"):
+            expected = natural_ops(a, b), integer_ops(a, -b), integer_ops(-a, b)
+        with backends.using(name):
+            assert (natural_ops(a, b), integer_ops(a, -b), integer_ops(-a, b)) == expected
+
+
+def test_reference_without_limb_kernels(monkeypatch):
+    """digits: деление, НОД и НОК не обращаются к ядрам в лимбах"""
+    def forbidden(*args):
+        raise AssertionError("эталонный движок вызвал ядро в лимбах")
+    for module, name in [(division, "div_mod"), (gcd, "gcd"), (gcd, "_binary_gcd")]:
+        monkeypatch.setattr(module, name, forbidden)
+    a, b = 3 ** 300, 7 ** 90 + 12
+    with backends.using("digits"):
+        assert natural_ops(a, b)[5:] == [str(math.gcd(a, b)), str(math.lcm(a, b)),
+                                         str(a - b), str(a // b), str(a % b), [1, 0, 0, 143]]
+        assert integer_ops(-a, b)[5:] == [str(-a // b), str(-a % b)]
+        with pytest.raises(ZeroDivisionError):
+            NaturalModule.from_str("5").DIV_NN_N(NaturalModule.from_str("0"))
+
+
+def test_native_long_string():
+    """native: перевод чисел длиннее предела str() для int"""
+    s = "7" * 6000
+    with backends.using("native"):
+        num = NaturalModule.from_str(s)
+        assert num._as_small() is not None
+        assert str(num.MUL_NN_N(NaturalModule.from_str("1"))) == s
+        assert str(IntegerModule.from_str("-" + s)) == "-" + s
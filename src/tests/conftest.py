@@ -0,0 +1,17 @@
+import pytest
+from ..my_math import values
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "in_place: тест проверяет изменение self на месте; в режиме значений пропускается")
+
+
+def pytest_collection_modifyitems(config, items):
+    """В режиме значений (MY_MATH_VALUES=1) операции не изменяют self - тесты in_place не применимы"""
+    if not values.enabled():
+        return
+    skip = pytest.mark.skip(reason="режим значений: операции не изменяют операнды")
+    for item in items:
+        if "in_place" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,65 @@
+import pytest
+from ..my_math import limbs
+from ..my_math.digit_buffer import DigitBuffer, as_buffer
+from ..my_math.natural_module import NaturalModule
+from ..my_math.integer_module import IntegerModule
+
+
+def test_copy_shares_until_write():
+    """copy(): копия общая до первой записи, запись не видна в другой копии"""
+    data = [1, 2, 3]
+    a = DigitBuffer(data)
+    b = a.copy()
+    assert b == a and b == [1, 2, 3]
+    b[0] = 9
+    a.append(4)
+    assert a == [1, 2, 3, 4]
+    assert b == [9, 2, 3]
+    assert data == [1, 2, 3]  # общий список при записи копируется
+
+
+@pytest.mark.parametrize("value", [0, 7, 10 ** 9, 12345678901234567890123, 10 ** 100 - 1])
+def test_from_limbs_is_lazy(value):
+    """Буфер по лимбам: длина и лимбы без распаковки, цифры - по запросу"""
+    L = limbs.from_int(value)
+    buffer = DigitBuffer.from_limbs(L)
+    assert len(buffer) == len(str(value))
+    assert buffer.limbs is L
+    assert buffer.copy().limbs is L
+    assert list(buffer) == list(map(int, reversed(str(value))))
+    buffer[0] = 0
+    assert buffer.limbs is None  # изменённый буфер больше не совпадает с лимбами
+
+
+def test_list_operations():
+    """Буфер ведёт себя как список цифр"""
+    buffer = as_buffer([0, 1, 2])
+    assert as_buffer(buffer) is buffer
+    assert buffer[::-1] == [2, 1, 0]
+    assert [5] + buffer == [5, 0, 1, 2]
+    assert buffer + [5] == [0, 1, 2, 5]
+    assert buffer != [0, 1]
+    assert buffer.pop() == 2
+    buffer.insert(0, 7)
+    del buffer[1]
+    assert buffer == [7, 1] and len(buffer) == 2 and 7 in buffer
+
+
+@pytest.mark.parametrize("value", [5, 2 ** 70, 10 ** 120 + 17])
+def test_natural_copy_idiom(value):
+    """NaturalModule(x.n, x.A.copy()) - независимая копия числа"""
+    x = NaturalModule.from_str(str(value))
+    y = NaturalModule(x.n, x.A.copy())
+    assert x._is_packed() == y._is_packed()
+    y = y.ADD_1N_N()
+    assert str(x) == str(value)
+    assert str(y) == str(value + 1)
+
+
+def test_integer_copy_idiom():
+    """IntegerModule(z.b, z.n, z.A.copy()): запись в копию не меняет исходное число"""
+    z = IntegerModule.from_str("-" + "9" * 80)
+    copy = IntegerModule(z.b, z.n, z.A.copy())
+    copy.A[0] = 0
+    assert str(z) == "-" + "9" * 80
+    assert str(copy) == "-" + "9" * 79 + "0"
@@ -0,0 +1,81 @@
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import division
+from ..my_math.natural_module import NaturalModule
+
+
+def limbs_of(num: int):
+    """Упакованное представление числа"""
+    return limbs.from_digits([int(d) for d in str(num)][::-1])
+
+
+# Алгоритм D: делители из одного и нескольких лимбов
+@pytest.mark.parametrize("a,b", [
+    (0, 7),
+    (5, 10 ** 20),
+    (10 ** 30, 7),
+    (10 ** 40 - 1, 10 ** 18 - 1),
+    (2 ** 300, 3 ** 100),
+    (10 ** 100, 10 ** 50 + 1),
+    (999999999 * 10 ** 27 + 123, 999999999 * 10 ** 9 + 999999999),
+])
+def test_div_mod(a, b):
+    """div_mod: частное и остаток"""
+    q, r = division.div_mod(limbs_of(a), limbs_of(b))
+    assert limbs.to_string(q) == str(a // b)
+    assert limbs.to_string(r) == str(a % b)
+
+
+def test_div_mod_random():
+    """div_mod: случайные операнды разной длины"""
+    rnd = random.Random(5)
+    for _ in range(300):
+        b = rnd.randrange(1, 10 ** rnd.randint(1, 120))
+        a = rnd.randrange(10 ** rnd.randint(1, 240))
+        q, r = division.div_mod(limbs_of(a), limbs_of(b))
+        assert (limbs.to_string(q), limbs.to_string(r)) == (str(a // b), str(a % b))
+
+
+def test_div_by_zero():
+    """DIV_NN_N: деление на ноль"""
+    with pytest.raises(ZeroDivisionError):
+        NaturalModule(0, [5]).DIV_NN_N(NaturalModule(0, [0]))
+
+
+@pytest.fixture
+def small_bz_threshold(monkeypatch):
+    """Низкий порог, чтобы деление Бурникеля-Циглера срабатывало на коротких числах"""
+    monkeypatch.setattr(division, "BURNIKEL_ZIEGLER_THRESHOLD", 18)
+
+
+# Бурникель-Циглер: нечётные длины, частное длиннее делителя, граничные остатки
+@pytest.mark.parametrize("len_a,len_b", [(8, 4), (20, 7), (40, 13), (64, 32), (150, 20), (97, 60)])
+def test_burnikel_ziegler(small_bz_threshold, len_a, len_b):
+    """div_mod: деление Бурникеля-Циглера совпадает с делением столбиком"""
+    rnd = random.Random(len_a * 100 + len_b)
+    b = rnd.randrange(10 ** (9 * len_b - 9), 10 ** (9 * len_b))
+    a = rnd.randrange(10 ** (9 * len_a))
+    for x in (a, b * (a // b) - 1, b * (a // b)):
+        q, r = division.div_mod(limbs_of(x), limbs_of(b))
+        assert (limbs.to_string(q), limbs.to_string(r)) == (str(x // b), str(x % b))
+
+
+def test_burnikel_ziegler_max_quotient(small_bz_threshold):
+    """div_mod: делимое b * BASE^k - 1 даёт максимальные лимбы частного"""
+    b = 10 ** 270 - 1
+    a = b * 10 ** 450 - 1
+    q, r = division.div_mod(limbs_of(a), limbs_of(b))
+    assert (limbs.to_string(q), limbs.to_string(r)) == (str(a // b), str(a % b))
+
+
+@pytest.mark.in_place
+def test_divmod_nn(small_bz_threshold):
+    """DIVMOD_NN_NN: частное в self, остаток - новый объект"""
+    a = 7 ** 900
+    b = 3 ** 500
+    x = NaturalModule(len(str(a)) - 1, [int(d) for d in str(a)][::-1])
+    y = NaturalModule(len(str(b)) - 1, [int(d) for d in str(b)][::-1])
+    q, r = x.DIVMOD_NN_NN(y)
+    assert q is x
+    assert (str(q), str(r)) == (str(a // b), str(a % b))
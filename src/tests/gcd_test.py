@@ -0,0 +1,102 @@
+import math
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import gcd
+from ..my_math.natural_module import NaturalModule
+
+
+def limbs_of(num: int):
+    """Упакованное представление числа"""
+    return limbs.from_digits([int(d) for d in str(num)][::-1])
+
+
+def fibonacci(k: int) -> int:
+    """k-е число Фибоначчи: худший случай для алгоритма Евклида"""
+    x, y = 0, 1
+    for _ in range(k):
+        x, y = y, x + y
+    return x
+
+
+@pytest.mark.parametrize("x,y", [(0, 0), (0, 12), (48, 18), (2 ** 40, 2 ** 35 * 3), (17, 10 ** 18 + 9)])
+def test_binary_gcd(x, y):
+    """_binary_gcd: бинарный алгоритм на коротких числах"""
+    assert gcd._binary_gcd(x, y) == math.gcd(x, y)
+
+
+# Метод Лемера: общий множитель, сильно разные длины, соседние числа Фибоначчи
+@pytest.mark.parametrize("a,b", [
+    (10 ** 50, 0),
+    (10 ** 50, 10 ** 50),
+    (3 ** 200 * 7 ** 30, 3 ** 150 * 7 ** 80),
+    (10 ** 300 + 1, 10 ** 40 + 3),
+    (fibonacci(900), fibonacci(901)),
+    (2 ** 500 - 1, 2 ** 300 - 1),
+])
+def test_gcd(a, b):
+    """gcd: НОД в лимбах"""
+    assert limbs.to_string(gcd.gcd(limbs_of(a), limbs_of(b))) == str(math.gcd(a, b))
+
+
+def test_gcd_random():
+    """gcd: случайные числа с общим множителем"""
+    rnd = random.Random(8)
+    for _ in range(200):
+        g = rnd.randrange(1, 10 ** rnd.randint(1, 50))
+        a = g * rnd.randrange(10 ** rnd.randint(1, 150))
+        b = g * rnd.randrange(10 ** rnd.randint(1, 150))
+        assert limbs.to_string(gcd.gcd(limbs_of(a), limbs_of(b))) == str(math.gcd(a, b))
+
+
+def test_gcf_keeps_other():
+    """GCF_NN_N: второй аргумент не изменяется"""
+    a = NaturalModule(2, [0, 0, 1])
+    b = NaturalModule(1, [0, 4])
+    assert str(a.GCF_NN_N(b)) == "20"
+    assert b.n == 1 and b.A == [0, 4]
+
+
+@pytest.fixture
+def small_hgcd_threshold(monkeypatch):
+    """Низкий порог, чтобы half-GCD срабатывал на коротких числах"""
+    monkeypatch.setattr(gcd, "HGCD_THRESHOLD", 45)
+
+
+# Half-GCD: рекурсия на числах из десятков лимбов
+@pytest.mark.parametrize("a,b", [
+    (fibonacci(2000), fibonacci(2001)),
+    (3 ** 900 * 7 ** 50, 3 ** 700 * 7 ** 300),
+    (10 ** 600 - 1, 10 ** 450 - 1),
+    (2 ** 1500 + 1, 2 ** 1400 + 3),
+])
+def test_hgcd(small_hgcd_threshold, a, b):
+    """gcd: половинный НОД совпадает с алгоритмом Евклида"""
+    assert limbs.to_string(gcd.gcd(limbs_of(a), limbs_of(b))) == str(math.gcd(a, b))
+
+
+@pytest.mark.parametrize("a,b", [
+    (1, 0),
+    (12, 18),
+    (18, 12),
+    (10 ** 30, 10 ** 30),
+    (fibonacci(301), fibonacci(300)),
+    (3 ** 300 * 5, 7 ** 200 * 5),
+])
+def test_gcdext(small_hgcd_threshold, a, b):
+    """gcdext: a * x - b * y = НОД, коэффициенты неотрицательны"""
+    g, x, y = gcd.gcdext(limbs_of(a), limbs_of(b))
+    g, x, y = (int(limbs.to_string(v)) for v in (g, x, y))
+    assert g == math.gcd(a, b)
+    assert a * x - b * y == g
+
+
+@pytest.mark.in_place
+def test_gcfext_nn():
+    """GCFEXT_NN_NNN: НОД в self и коэффициенты Безу"""
+    a = NaturalModule(1, [0, 3])
+    result, x, y = a.GCFEXT_NN_NNN(NaturalModule(1, [2, 4]))
+    assert result is a and str(a) == "6"
+    assert 30 * int(str(x)) - 42 * int(str(y)) == 6
+    with pytest.raises(ValueError):
+        NaturalModule(0, [0]).GCFEXT_NN_NNN(NaturalModule(0, [5]))
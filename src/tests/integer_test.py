@@ -1,4 +1,6 @@
+import math
 import pytest
+from ..my_math import backends
 from ..my_math.integer_module import IntegerModule
 
 
@@ -182,6 +184,37 @@ def test_mod_zz_z(b1, n1, A1, b2, n2, A2, expected_b, expected_n, expected_A):
     assert result.A == expected_A
 
 
+# Тесты для DIVMOD_ZZ_ZZ: частное и остаток за одно деление
+@pytest.mark.parametrize("b1,n1,A1,b2,n2,A2,expected_q,expected_r", [
+    (0, 1, [7, 1], 0, 0, [5], "3", "2"),         # 17 = 5 * 3 + 2
+    (1, 1, [7, 1], 0, 0, [5], "-4", "3"),        # -17 = 5 * (-4) + 3
+    (0, 1, [7, 1], 1, 0, [5], "-3", "2"),        # 17 = -5 * (-3) + 2
+    (1, 1, [7, 1], 1, 0, [5], "4", "3"),         # -17 = -5 * 4 + 3
+    (0, 0, [2], 1, 0, [5], "0", "2"),            # 2 = -5 * 0 + 2
+    (1, 1, [5, 1], 0, 0, [5], "-3", "0"),        # -15 = 5 * (-3)
+])
+def test_divmod_zz_zz(b1, n1, A1, b2, n2, A2, expected_q, expected_r):
+    """DIVMOD_ZZ_ZZ: неотрицательный остаток, аргументы не изменяются"""
+    num1 = IntegerModule(b1, n1, A1.copy())
+    num2 = IntegerModule(b2, n2, A2.copy())
+    q, r = num1.DIVMOD_ZZ_ZZ(num2)
+    assert str(q) == expected_q and q.b == (1 if expected_q.startswith("-") else 0)
+    assert str(r) == expected_r and r.b == 0
+    assert (num1.b, num1.A, num2.b, num2.A) == (b1, A1, b2, A2)
+
+
+@pytest.mark.parametrize("s,expected_b,expected_A", [
+    ("0", 0, [0]),
+    ("-17", 1, [7, 1]),
+    ("305", 0, [5, 0, 3]),
+])
+def test_from_str(s, expected_b, expected_A):
+    """from_str: знак и массив цифр от младшей к старшей"""
+    num = IntegerModule.from_str(s)
+    assert (num.b, num.n, num.A) == (expected_b, len(expected_A) - 1, expected_A)
+    assert str(num) == s
+
+
 # Тест на деление на ноль
 def test_div_by_zero():
     """DIV_ZZ_Z: Деление на ноль должно вызывать исключение"""
@@ -195,4 +228,163 @@ def test_mod_by_zero():
     num1 = IntegerModule(0, 0, [5])
     num2 = IntegerModule(0, 0, [0])
     with pytest.raises(Exception, match="Деление на ноль"):
-        num1.MOD_ZZ_Z(num2)
\ No newline at end of file
+        num1.MOD_ZZ_Z(num2)
+
+
+@pytest.mark.parametrize("a,e", [(-2, 3), (-2, 4), (0, 0), (5, 1), (-(10 ** 20), 3), (7, 30)])
+def test_pow_zz_z(a, e):
+    """POW_ZZ_Z: знак результата по чётности показателя"""
+    assert str(IntegerModule.from_str(str(a)).POW_ZZ_Z(IntegerModule.from_str(str(e)))) == str(a ** e)
+
+
+@pytest.mark.parametrize("a,e,m", [(-3, 201, 1000007), (-3, 200, 1000007), (5, 3, -7), (-(10 ** 30), 7, 10 ** 25 + 9), (-4, 1, 2)])
+def test_powmod_zzz_z(a, e, m):
+    """POWMOD_ZZZ_Z: результат от 0 до |m| - 1, как у MOD_ZZ_Z"""
+    result = IntegerModule.from_str(str(a)).POWMOD_ZZZ_Z(IntegerModule.from_str(str(e)), IntegerModule.from_str(str(m)))
+    assert str(result) == str(pow(a, e, abs(m)))
+
+
+def test_pow_zz_z_negative_exponent():
+    """POW_ZZ_Z: отрицательный показатель"""
+    with pytest.raises(ValueError):
+        IntegerModule.from_str("2").POW_ZZ_Z(IntegerModule.from_str("-1"))
+
+
+@pytest.fixture
+def auto_backend():
+    """Проверки представления чисел рассчитаны на смешанный движок"""
+    with backends.using("auto"):
+        yield
+
+
+# Малые значения: арифметика на int совпадает с арифметикой над цифрами
+@pytest.mark.parametrize("bound", [1, 2 ** 64])
+def test_small_values(monkeypatch, bound):
+    """ADD/SUB/MUL/DIVMOD: результаты не зависят от границы SMALL_BOUND"""
+    monkeypatch.setattr(IntegerModule, "SMALL_BOUND", bound)
+    values = [0, 1, -1, 7, -7, 3, -3, 2 ** 64 - 1, -(2 ** 64 - 1), 10 ** 25 + 3, -(10 ** 25)]
+    for a in values:
+        for b in values:
+            x, y = IntegerModule.from_str(str(a)), IntegerModule.from_str(str(b))
+            assert str(x.ADD_ZZ_Z(y)) == str(a + b)
+            x, y = IntegerModule.from_str(str(a)), IntegerModule.from_str(str(b))
+            assert str(x.SUB_ZZ_Z(y)) == str(a - b)
+            x, y = IntegerModule.from_str(str(a)), IntegerModule.from_str(str(b))
+            assert str(x.MUL_ZZ_Z(y)) == str(a * b)
+            if b:
+                x, y = IntegerModule.from_str(str(a)), IntegerModule.from_str(str(b))
+                q, r = x.DIVMOD_ZZ_ZZ(y)
+                assert int(str(r)) == a % abs(b) and a == b * int(str(q)) + int(str(r))
+
+
+def test_small_digits_view(auto_backend):
+    """Малое число отдаёт массив цифр по требованию"""
+    num = IntegerModule.from_str("-120")
+    assert num._small == 120
+    assert (num.b, num.n, num.A) == (1, 2, [0, 2, 1])
+    assert str(num.ABS_Z_Z().TRANS_Z_N()) == "120"
+
+
+@pytest.mark.parametrize("b,A,expected_sign,expected_str", [
+    (1, [0, 0], 0, "0"),     # отрицательный ноль становится нулём
+    (1, [5, 0], -1, "-5"),
+    (0, [0, 1, 0], 1, "10"),
+    (0, [0], 0, "0"),
+])
+def test_canonical_form(b, A, expected_sign, expected_str):
+    """Целое число: без ведущих нулей и отрицательного нуля, sign и is_zero за O(1)"""
+    num = IntegerModule(b, len(A) - 1, A)
+    assert num.sign() == num.POZ_Z_D() == expected_sign
+    assert num.is_zero() == (expected_sign == 0)
+    assert num.n == len(num.A) - 1
+    assert str(num) == expected_str
+    assert num.b == (1 if expected_sign == -1 else 0)
+
+
+@pytest.mark.parametrize("a,b", [(-7, 3), (12, -30), (-(10 ** 60), 10 ** 59 + 1), (2 ** 70, -(2 ** 70)), (0, -5)])
+def test_signed_ops_keep_operands(a, b):
+    """ADD/SUB/MUL/DIVMOD не изменяют операнды (ни знак, ни модуль)"""
+    x = IntegerModule.from_str(str(a))
+    y = IntegerModule.from_str(str(b))
+    assert str(x.ADD_ZZ_Z(y)) == str(a + b)
+    assert str(x.SUB_ZZ_Z(y)) == str(a - b)
+    assert str(x.MUL_ZZ_Z(y)) == str(a * b)
+    if a:
+        assert str(y.DIVMOD_ZZ_ZZ(x)[1]) == str(b % abs(a))
+    assert str(x) == str(a) and str(y) == str(b)
+
+
+def test_magnitude_view():
+    """Модуль - натуральное число без копирования; TRANS_Z_N и ABS дают независимую копию"""
+    x = IntegerModule.from_str("-" + "9" * 50)
+    assert str(x.magnitude) == "9" * 50
+    assert x.magnitude is x.magnitude
+    copy = x._natural_abs().ADD_1N_N()
+    assert str(copy) == "1" + "0" * 50
+    assert str(x) == "-" + "9" * 50
+    negated = IntegerModule._from_natural(copy, True)
+    assert negated.magnitude is copy and str(negated) == "-1" + "0" * 50
+
+
+def _reference_divmod(a: int, b: int, mode: str):
+    """Частное и остаток в режиме mode по встроенной арифметике"""
+    if mode == IntegerModule.FLOOR:
+        q = a // b
+    elif mode == IntegerModule.CEIL:
+        q = -(-a // b)
+    elif mode == IntegerModule.TRUNC:
+        q = abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1)
+    else:
+        q = (a - a % abs(b)) // b
+    return q, a - b * q
+
+
+@pytest.mark.parametrize("mode", IntegerModule.DIVISION_MODES)
+@pytest.mark.parametrize("a,b", [
+    (7, 3), (-7, 3), (7, -3), (-7, -3), (6, 3), (-6, -3), (0, -4),
+    (10 ** 50 + 7, 10 ** 20), (-(10 ** 50) - 7, 10 ** 20), (10 ** 50 + 7, -(10 ** 20)),
+    (-(2 ** 200), -(2 ** 64 + 1)),
+])
+def test_divmod_modes(a, b, mode):
+    """DIVMOD_ZZ_ZZ во всех режимах: a = b * q + r, частное округляется по режиму"""
+    x = IntegerModule.from_str(str(a))
+    y = IntegerModule.from_str(str(b))
+    q, r = x.DIVMOD_ZZ_ZZ(y, mode)
+    assert (str(q), str(r)) == tuple(map(str, _reference_divmod(a, b, mode)))
+    assert str(x.DIV_ZZ_Z(y, mode)) == str(q)
+    assert str(x.MOD_ZZ_Z(y, mode=mode)) == str(r)
+
+
+def test_divmod_unknown_mode():
+    """DIVMOD_ZZ_ZZ: неизвестный режим деления"""
+    with pytest.raises(ValueError):
+        IntegerModule.from_str("7").DIVMOD_ZZ_ZZ(IntegerModule.from_str("2"), "round")
+
+
+@pytest.mark.parametrize("a,b", [
+    (0, 0), (0, -7), (5, 0), (-12, 18), (12, -18), (-35, -49), (1, 10 ** 30),
+    (3 * 10 ** 40 + 9, -(6 * 10 ** 25 + 3)), (-(2 ** 127 - 1), 2 ** 89 - 1),
+])
+def test_gcfext_zz_zzz(a, b):
+    """GCFEXT_ZZ_ZZZ: НОД >= 0 и a * x + b * y = НОД; GCF_ZZ_Z - тот же НОД"""
+    x = IntegerModule.from_str(str(a))
+    y = IntegerModule.from_str(str(b))
+    g, u, v = (int(str(t)) for t in x.GCFEXT_ZZ_ZZZ(y))
+    assert g == math.gcd(a, b)
+    assert a * u + b * v == g
+    assert str(x.GCF_ZZ_Z(y)) == str(g)
+    assert str(x) == str(a) and str(y) == str(b)
+
+
+@pytest.mark.parametrize("a,m", [(3, 7), (-3, 7), (10, -17), (2 ** 80 + 1, 10 ** 25 + 3), (5, 1), (-(10 ** 30), 7 ** 40)])
+def test_invmod_zz_z(a, m):
+    """INVMOD_ZZ_Z: обратный элемент от 0 до |m| - 1"""
+    inverse = IntegerModule.from_str(str(a)).INVMOD_ZZ_Z(IntegerModule.from_str(str(m)))
+    assert str(inverse) == str(pow(a, -1, abs(m)) if abs(m) > 1 else 0)
+
+
+@pytest.mark.parametrize("a,m", [(6, 9), (0, 5), (-10 ** 20, 10 ** 10)])
+def test_invmod_zz_z_no_inverse(a, m):
+    """INVMOD_ZZ_Z: при НОД(a, m) != 1 обратного нет"""
+    with pytest.raises(ValueError):
+        IntegerModule.from_str(str(a)).INVMOD_ZZ_Z(IntegerModule.from_str(str(m)))
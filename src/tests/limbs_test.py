@@ -0,0 +1,113 @@
+import pytest
+from array import array
+from ..my_math import limbs
+
+
+def digits_of(num: int) -> list:
+    """Массив цифр числа от младшей к старшей"""
+    return [int(d) for d in str(num)][::-1]
+
+
+# Упаковка и распаковка цифр
+@pytest.mark.parametrize("num", [0, 7, 999999999, 1000000000, 10 ** 30 + 5, 123456789012345678901234567890])
+def test_digits_roundtrip(num):
+    """from_digits / to_digits: цифры -> лимбы -> цифры"""
+    L = limbs.from_digits(digits_of(num))
+    assert isinstance(L, array)
+    assert limbs.to_digits(L) == digits_of(num)
+    assert limbs.to_string(L) == str(num)
+    assert limbs.digit_count(L) == len(str(num))
+
+
+def test_from_digits_strips_leading_zeros():
+    """from_digits: ведущие нули не создают лишних лимбов"""
+    L = limbs.from_digits([5] + [0] * 20)
+    assert list(L) == [5]
+
+
+# Арифметика в лимбах
+@pytest.mark.parametrize("a,b", [
+    (0, 0),
+    (999999999, 1),
+    (10 ** 27 - 1, 10 ** 27 - 1),
+    (123456789123456789123456789, 987654321),
+    (10 ** 45, 10 ** 9 - 1),
+])
+def test_arithmetic(a, b):
+    """add, sub, mul_schoolbook, compare"""
+    La = limbs.from_digits(digits_of(a))
+    Lb = limbs.from_digits(digits_of(b))
+    assert limbs.to_string(limbs.add(La, Lb)) == str(a + b)
+    assert limbs.to_string(limbs.sub(La, Lb)) == str(a - b)
+    assert limbs.to_string(limbs.mul_schoolbook(La, Lb)) == str(a * b)
+    assert limbs.compare(La, Lb) == (0 if a == b else 2 if a > b else 1)
+
+
+def test_sub_negative_raises():
+    """sub: вычитаемое больше уменьшаемого"""
+    with pytest.raises(ValueError):
+        limbs.sub(limbs.from_digits([1]), limbs.from_digits([2]))
+
+
+@pytest.mark.parametrize("a,k", [(0, 5), (1, 9), (12345, 13), (10 ** 20 + 1, 0)])
+def test_mul_pow10(a, k):
+    """mul_pow10: умножение на 10^k"""
+    L = limbs.mul_pow10(limbs.from_digits(digits_of(a)), k)
+    assert limbs.to_string(L) == str(a * 10 ** k)
+
+
+@pytest.mark.parametrize("base,exp,add", [
+    (0, 1, 0), (1, 1, 0), (10, 9, -1), (10, 9, 0), (10, 288, 0), (10, 288, -1),
+    (7, 5000, 0),    # длиннее лимита str()
+    (3, 80000, 1),   # длиннее FROM_INT_DECIMAL_BITS
+])
+def test_from_int_int_to_string(base, exp, add):
+    """from_int / int_to_string: короткие числа, границы степеней BASE и длинные числа (через decimal)"""
+    x = base ** exp + add
+    L = limbs.from_int(x)
+    assert limbs.to_int(L) == x
+    assert limbs.int_to_string(x) == limbs.to_string(L)
+    assert limbs.int_from_string(limbs.int_to_string(x)) == x
+
+
+@pytest.mark.parametrize("s", ["0", "000", "7", "000000000123", "999999999", "1000000000", "12" * 50])
+def test_from_string(s):
+    """from_string: блоки по 9 цифр, ведущие нули отбрасываются"""
+    L = limbs.from_string(s)
+    assert limbs.to_string(L) == str(int(s))
+    assert L == limbs.from_digits([int(d) for d in s][::-1])
+
+
+@pytest.mark.parametrize("a,b,n", [(0, 5, 1), (10 ** 30 - 1, 10 ** 25 + 7, 2), (3 ** 100, 7 ** 80, 4), (2 ** 90, 3, 9)])
+def test_mul_low(a, b, n):
+    """mul_low: младшие n лимбов произведения"""
+    L = limbs.mul_low(limbs.from_int(a), limbs.from_int(b), n)
+    assert limbs.to_int(L) == a * b % limbs.BASE ** n
+
+
+@pytest.mark.parametrize("a", [0, 5, 999999999, 10 ** 45 - 1, 3 ** 200])
+def test_sqr_basecase(a):
+    """sqr_basecase: квадрат совпадает с умножением столбиком"""
+    L = limbs.from_int(a)
+    assert limbs.sqr_basecase(L) == limbs.mul_basecase(L, L)
+    assert limbs.to_int(limbs.normalize(limbs.sqr_basecase(L))) == a * a
+
+
+@pytest.mark.parametrize("x,k", [(0, 1), (123, 0), (10 ** 30 + 5, 1), (10 ** 30 + 5, 2), (10 ** 30 + 5, 7)])
+def test_high_low(x, k):
+    """high / low: частное и остаток от деления на BASE^k"""
+    L = limbs.from_int(x)
+    assert limbs.to_int(limbs.high(L, k)) == x // limbs.BASE ** k
+    assert limbs.to_int(limbs.low(L, k)) == x % limbs.BASE ** k
+
+
+@pytest.mark.parametrize("x,d", [(0, 7), (10 ** 50 + 3, 7), (3 ** 400, 2 ** 30 - 35), (3 ** 400, 10 ** 20 + 39)])
+def test_mod_small(x, d):
+    """mod_small: остаток по короткому (и не только) модулю"""
+    assert limbs.mod_small(limbs.from_int(x), d) == x % d
+
+
+@pytest.mark.parametrize("digits,minimum,expected", [(1, 1, 1), (9, 1, 1), (10, 1, 2), (576, 4, 64), (1, 4, 4)])
+def test_limbs_for_digits(digits, minimum, expected):
+    """limbs_for_digits: порог в цифрах -> лимбы (с нижней границей)"""
+    assert limbs.limbs_for_digits(digits, minimum) == expected
@@ -0,0 +1,71 @@
+import math
+import random
+import pytest
+from ..my_math.modulus import Modulus
+from ..my_math.natural_module import NaturalModule
+from ..my_math.integer_module import IntegerModule
+
+
+MODULI = [
+    1,
+    7,
+    10 ** 9 + 7,
+    2 ** 64 + 13,            # длинный модуль, взаимно простой с 10 (Монтгомери)
+    10 ** 50,                # длинный модуль, кратный 10 (только Барретт)
+    3 ** 300,
+    2 ** 1000 * 5 + 10,
+]
+
+
+@pytest.mark.parametrize("montgomery", [True, False])
+@pytest.mark.parametrize("m", MODULI)
+def test_ring_operations(m, montgomery):
+    """Modulus: вычеты и операции совпадают с арифметикой int по модулю m"""
+    ring = Modulus(NaturalModule.from_str(str(m)), montgomery)
+    rng = random.Random(m)
+    for _ in range(10):
+        a = rng.randrange(-3 * m * m, 3 * m * m)
+        b = rng.randrange(5 * m)
+        x = ring.reduce(IntegerModule.from_str(str(a)))
+        y = ring.reduce(NaturalModule.from_str(str(b)))
+        A, B = a % m, b % m
+        assert (str(x), str(y)) == (str(A), str(B))
+        assert str(ring.add(x, y)) == str((A + B) % m)
+        assert str(ring.sub(x, y)) == str((A - B) % m)
+        assert str(ring.neg(x)) == str(-A % m)
+        assert str(ring.mul(x, y)) == str(A * B % m)
+        e = rng.randrange(2000)
+        assert str(ring.pow(x, e)) == str(pow(A, e, m))
+        assert str(ring.pow(x, NaturalModule.from_str(str(e)))) == str(pow(A, e, m))
+        # Операции не изменяют аргументы
+        assert (str(x), str(y)) == (str(A), str(B))
+
+
+@pytest.mark.parametrize("m", MODULI)
+def test_inverse(m):
+    """inverse: обратный вычет или ValueError, если НОД(x, m) != 1"""
+    ring = Modulus(NaturalModule.from_str(str(m)))
+    rng = random.Random(m + 1)
+    for a in [0, 1, m - 1] + [rng.randrange(m) for _ in range(10)]:
+        x = ring.from_int(a)
+        if math.gcd(a, m) == 1:
+            assert str(ring.inverse(x)) == str(pow(a, -1, m) if m > 1 else 0)
+            if m > 1:
+                assert str(ring.div(ring.from_int(5), x)) == str(5 * pow(a, -1, m) % m)
+        elif m > 1:
+            with pytest.raises(ValueError):
+                ring.inverse(x)
+
+
+def test_zero_modulus():
+    """Modulus: модуль 0 запрещён"""
+    with pytest.raises(ZeroDivisionError):
+        Modulus(NaturalModule.from_str("0"))
+
+
+def test_pow_zero_exponent():
+    """x^0 = 1 по модулю m (и 0 по модулю 1)"""
+    assert str(Modulus(NaturalModule.from_str(str(10 ** 30 + 1))).pow(NaturalModule.from_str("0"), 0)) == "1"
+    assert str(Modulus(NaturalModule.from_str("1")).pow(NaturalModule.from_str("0"), 0)) == "0"
+    with pytest.raises(ValueError):
+        Modulus(NaturalModule.from_str("7")).pow(NaturalModule.from_str("2"), -1)
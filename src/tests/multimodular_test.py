@@ -0,0 +1,124 @@
+import math
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import multimodular
+from ..my_math.multimodular import ResidueVector
+from ..my_math.natural_module import NaturalModule
+from ..my_math.integer_module import IntegerModule
+
+
+def test_primes():
+    """Таблица простых: различные простые меньше 2^PRIME_BITS по убыванию"""
+    table = multimodular.primes(50)
+    assert table == sorted(set(table), reverse=True)
+    assert table[0] == 2 ** 30 - 35
+    assert all(2 ** 29 < p < 2 ** 30 for p in table)
+    assert all(pow(2, p - 1, p) == 1 and pow(3, p - 1, p) == 1 for p in table)
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 40])
+def test_basis_constants(count):
+    """Базис: M - произведение простых, s_i * (M / p_i) = 1 (mod p_i)"""
+    b = multimodular.basis(count)
+    M = math.prod(b.moduli)
+    assert limbs.to_int(b.M) == M
+    assert all(s * (M // p) % p == 1 for s, p in zip(b.inverses, b.moduli))
+    assert multimodular.basis(count) is b
+    assert 2 ** b.bits <= M // 2
+
+
+@pytest.mark.parametrize("count", [3, 70])
+def test_reduce_and_combine(count):
+    """Вычеты (в т.ч. деревом остатков) и восстановление по КТО"""
+    b = multimodular.basis(count)
+    M = limbs.to_int(b.M)
+    rng = random.Random(count)
+    for x in [0, 1, M - 1, rng.randrange(M), rng.randrange(M)]:
+        residues = b.reduce(limbs.from_int(x))
+        assert residues == [x % p for p in b.moduli]
+        assert limbs.to_int(b.combine(residues)) == x
+
+
+@pytest.mark.parametrize("a,b", [
+    (0, 0),
+    (-5, 7),
+    (123456789 ** 5, -(987654321 ** 7)),
+    (-(10 ** 300 + 7), -(3 ** 700)),
+])
+def test_residue_arithmetic(a, b):
+    """ResidueVector: сложение, вычитание, умножение, степень и знак результата"""
+    basis = multimodular.basis_for_bits(2 * max(abs(a), abs(b), 1).bit_length() + 2)
+    x = ResidueVector.from_number(IntegerModule.from_str(str(a)), basis)
+    y = ResidueVector.from_number(IntegerModule.from_str(str(b)), basis)
+    assert str(x.add(y).to_integer()) == str(a + b)
+    assert str(x.sub(y).to_integer()) == str(a - b)
+    assert str(x.mul(y).to_integer()) == str(a * b)
+    assert str(x.neg().to_integer()) == str(-a)
+    assert str(x.pow(2).to_integer()) == str(a * a)
+    assert str(ResidueVector.from_int(a, basis).to_integer()) == str(a)
+
+
+def test_from_natural():
+    """Вектор вычетов натурального числа и восстановление в NaturalModule"""
+    value = 7 ** 400
+    basis = multimodular.basis_for_bits(value.bit_length())
+    x = ResidueVector.from_number(NaturalModule.from_str(str(value)), basis)
+    assert str(x.to_natural()) == str(value)
+    assert isinstance(x.to_natural(), NaturalModule)
+
+
+def test_different_bases():
+    """Векторы из разных базисов не складываются"""
+    x = ResidueVector.from_int(1, multimodular.basis(2))
+    y = ResidueVector.from_int(1, multimodular.basis(3))
+    with pytest.raises(ValueError):
+        x.add(y)
+
+
+def test_product():
+    """product: произведение многих чисел через вычеты"""
+    values = [(-1) ** i * (10 ** 40 + i) for i in range(30)]
+    numbers = [IntegerModule.from_str(str(v)) for v in values]
+    assert str(multimodular.product(numbers)) == str(math.prod(values))
+    assert str(multimodular.product([NaturalModule.from_str("0"), numbers[0]])) == "0"
+
+
+@pytest.mark.parametrize("matrix,expected", [
+    ([], 1),
+    ([[-7]], -7),
+    ([[1, 2], [3, 4]], -2),
+    ([[1, 2], [2, 4]], 0),
+    ([[0, 1], [1, 0]], -1),
+    ([[2, -3, 1], [2, 0, -1], [1, 4, 5]], 49),
+])
+def test_determinant(matrix, expected):
+    """determinant: определитель целочисленной матрицы"""
+    m = [[IntegerModule.from_str(str(v)) for v in row] for row in matrix]
+    assert str(multimodular.determinant(m)) == str(expected)
+
+
+def _det_exact(matrix):
+    """Эталон: метод Барейса в целых числах Python"""
+    a = [row[:] for row in matrix]
+    n, sign, prev = len(a), 1, 1
+    for k in range(n - 1):
+        if a[k][k] == 0:
+            swap = next((r for r in range(k + 1, n) if a[r][k]), None)
+            if swap is None:
+                return 0
+            a[k], a[swap] = a[swap], a[k]
+            sign = -sign
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                a[i][j] = (a[i][j] * a[k][k] - a[i][k] * a[k][j]) // prev
+        prev = a[k][k]
+    return sign * a[-1][-1]
+
+
+def test_determinant_large_entries():
+    """determinant: матрица с длинными элементами"""
+    rng = random.Random(24)
+    matrix = [[rng.randrange(-10 ** 30, 10 ** 30) for _ in range(6)] for _ in range(6)]
+    m = [[IntegerModule.from_str(str(v)) for v in row] for row in matrix]
+    assert str(multimodular.determinant(m)) == str(_det_exact(matrix))
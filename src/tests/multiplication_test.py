@@ -0,0 +1,111 @@
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import multiplication
+from ..my_math.natural_module import NaturalModule
+
+
+def limbs_of(num: int):
+    """Упакованное представление числа"""
+    return limbs.from_digits([int(d) for d in str(num)][::-1])
+
+
+@pytest.fixture
+def small_thresholds(monkeypatch):
+    """Низкие пороги, чтобы быстрые алгоритмы срабатывали на коротких числах"""
+    monkeypatch.setattr(multiplication, "KARATSUBA_THRESHOLD", 36)
+    monkeypatch.setattr(multiplication, "TOOM3_THRESHOLD", 108)
+    monkeypatch.setattr(multiplication, "NTT_THRESHOLD", 10 ** 12)
+
+
+# Умножение Карацубы: симметричные и несимметричные операнды
+@pytest.mark.parametrize("len_a,len_b", [(5, 5), (40, 40), (41, 17), (100, 3), (90, 60), (200, 199)])
+def test_karatsuba(small_thresholds, len_a, len_b):
+    """mul: метод Карацубы совпадает с умножением столбиком"""
+    rnd = random.Random(len_a * 1000 + len_b)
+    a = rnd.randrange(10 ** (9 * len_a))
+    b = rnd.randrange(10 ** (9 * len_b))
+    assert limbs.to_string(multiplication.mul(limbs_of(a), limbs_of(b))) == str(a * b)
+
+
+# Toom-3: операнды близкой длины, в том числе не кратной трём
+@pytest.mark.parametrize("len_a,len_b", [(12, 12), (37, 30), (100, 99), (150, 101), (230, 200)])
+def test_toom3(small_thresholds, len_a, len_b):
+    """mul: метод Тоома-Кука совпадает с умножением столбиком"""
+    rnd = random.Random(len_a * 7 + len_b)
+    a = rnd.randrange(10 ** (9 * len_a))
+    b = rnd.randrange(10 ** (9 * len_b))
+    assert limbs.to_string(multiplication.mul(limbs_of(a), limbs_of(b))) == str(a * b)
+
+
+@pytest.mark.parametrize("x", [3, 6, 999999999, 3 ** 100, 10 ** 40 * 3])
+def test_divexact_by3(x):
+    """Точное деление на 3 в интерполяции Toom-3"""
+    q = multiplication._divexact_by3(list(limbs_of(x)))
+    assert limbs.to_string(limbs.normalize(q)) == str(x // 3)
+
+
+# NTT: точное умножение по трём простым модулям
+@pytest.mark.parametrize("len_a,len_b", [(1, 1), (2, 1), (7, 5), (64, 64), (200, 3), (230, 200)])
+def test_ntt(len_a, len_b):
+    """_mul_ntt совпадает с умножением столбиком"""
+    rnd = random.Random(len_a * 31 + len_b)
+    a = list(limbs_of(rnd.randrange(10 ** (9 * len_a))))
+    b = list(limbs_of(rnd.randrange(10 ** (9 * len_b))))
+    assert limbs.normalize(multiplication._mul_ntt(a, b)) == limbs.mul_schoolbook(a, b)
+
+
+def test_ntt_max_coefficients():
+    """_mul_ntt: коэффициенты свёртки максимальны (все лимбы равны BASE - 1)"""
+    a = [limbs.BASE - 1] * 300
+    assert limbs.normalize(multiplication._mul_ntt(a, a)) == limbs.mul_schoolbook(a, a)
+
+
+def test_mul_dispatches_to_ntt(monkeypatch):
+    """mul: выше NTT_THRESHOLD используется NTT"""
+    monkeypatch.setattr(multiplication, "NTT_THRESHOLD", 90)
+    a, b = 3 ** 500, 7 ** 400
+    assert limbs.to_string(multiplication.mul(limbs_of(a), limbs_of(b))) == str(a * b)
+
+
+@pytest.mark.parametrize("a,b", [(3 ** 5000, 7 ** 4000), (3 ** 5000, 3 ** 5000), (10 ** 4000 - 1, 11 ** 200)])
+def test_mul_beyond_ntt_size(monkeypatch, a, b):
+    """mul: произведение длиннее 2^NTT_MAX_LOG лимбов вычисляется по частям, а не отвергается"""
+    monkeypatch.setattr(multiplication, "NTT_THRESHOLD", 90)
+    monkeypatch.setattr(multiplication, "KARATSUBA_THRESHOLD", 90)
+    monkeypatch.setattr(multiplication, "NTT_MAX_LOG", 6)
+    assert limbs.to_int(multiplication.mul(limbs_of(a), limbs_of(b))) == a * b
+    assert limbs.to_int(multiplication.sqr(limbs_of(a))) == a * a
+
+
+def test_karatsuba_all_nines(small_thresholds):
+    """mul: максимальные переносы"""
+    a = 10 ** 900 - 1
+    assert limbs.to_string(multiplication.mul(limbs_of(a), limbs_of(a))) == str(a * a)
+
+
+# Возведение в квадрат: все уровни (столбик, Карацуба, Toom-3, NTT)
+@pytest.mark.parametrize("size,ntt", [(1, False), (20, False), (64, False), (150, False), (233, False), (70, True)])
+def test_sqr(monkeypatch, small_thresholds, size, ntt):
+    """sqr: квадрат совпадает с квадратом int"""
+    if ntt:
+        monkeypatch.setattr(multiplication, "NTT_THRESHOLD", 90)
+    a = random.Random(size).randrange(10 ** (9 * size))
+    assert limbs.to_string(multiplication.sqr(limbs_of(a))) == str(a * a)
+    x = limbs_of(a)
+    assert limbs.to_string(multiplication.mul(x, x)) == str(a * a)
+
+
+def test_sqr_all_nines(small_thresholds):
+    """sqr: максимальные лимбы на каждом уровне"""
+    a = 10 ** (9 * 230) - 1
+    assert limbs.to_string(multiplication.sqr(limbs_of(a))) == str(a * a)
+
+
+
+def test_mul_nn_n_karatsuba(small_thresholds):
+    """MUL_NN_N: длинные числа умножаются через быстрые алгоритмы"""
+    a, b = 7 ** 900, 3 ** 1000
+    num1 = NaturalModule(0, [int(d) for d in str(a)][::-1])
+    num2 = NaturalModule(0, [int(d) for d in str(b)][::-1])
+    assert str(num1.MUL_NN_N(num2)) == str(a * b)
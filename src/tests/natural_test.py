@@ -1,4 +1,6 @@
+import math
 import pytest
+from ..my_math import backends
 from ..my_math.natural_module import NaturalModule
 
 
@@ -228,6 +230,7 @@ def test_gcf_nn_n(n1, A1, n2, A2, expected_n, expected_A):
     
 
 
+@pytest.mark.in_place
 @pytest.mark.parametrize("N_1, N_2, expected", [
     (NaturalModule(0, [9]), NaturalModule(1, [2, 1]), NaturalModule(1, [6, 3])),
 ])
@@ -244,3 +247,222 @@ def test_LCM_NN_N(N_1, N_2, expected):
 
 
     assert natural_1.n == expected.n and natural_1.A == expected.A
+
+
+
+# Длинные числа: арифметика в упакованном представлении
+def natural_from_int(num: int) -> NaturalModule:
+    digits = [int(d) for d in str(num)][::-1]
+    return NaturalModule(len(digits) - 1, digits)
+
+
+@pytest.mark.parametrize("a,b", [
+    (10 ** 60 - 1, 1),
+    (3 ** 200, 2 ** 150),
+    (123456789 * 10 ** 50 + 987654321, 10 ** 45 + 7),
+])
+def test_packed_arithmetic(a, b):
+    """ADD_NN_N, SUB_NN_N, MUL_NN_N на длинных числах"""
+    assert str(natural_from_int(a).ADD_NN_N(natural_from_int(b))) == str(a + b)
+    assert str(natural_from_int(a).SUB_NN_N(natural_from_int(b))) == str(a - b)
+
+    result = natural_from_int(a).MUL_NN_N(natural_from_int(b))
+    expected = [int(d) for d in str(a * b)][::-1]
+    assert result.A == expected
+    assert result.n == len(expected) - 1
+
+
+def test_packed_result_is_lazy():
+    """Результат длинной операции хранится в лимбах, массив цифр строится по запросу"""
+    result = natural_from_int(10 ** 80).ADD_NN_N(natural_from_int(1))
+    assert result.n == 80
+    assert result.COM_NN_D(natural_from_int(10 ** 80)) == 2
+    result.A[0] = 5  # изменение массива цифр отражается на числе
+    assert str(result) == str(10 ** 80 + 5)
+
+
+@pytest.mark.in_place
+@pytest.mark.parametrize("a,b", [
+    (0, 12),
+    (12, 0),
+    (4, 6),
+    (2 ** 100 * 3 ** 20, 2 ** 40 * 5 ** 60),
+    (10 ** 70 + 1, 10 ** 35 + 1),
+])
+def test_lcm_nn_n_long(a, b):
+    """LCM_NN_N: результат в self, второй аргумент не изменяется"""
+    x = natural_from_int(a)
+    y = natural_from_int(b)
+    x.LCM_NN_N(y)
+    expected = a * b // math.gcd(a, b) if a and b else 0
+    assert str(x) == str(expected)
+    assert str(y) == str(b)
+
+
+def test_lcm_many_n():
+    """LCM_MANY_N: НОК списка чисел, аргументы не изменяются"""
+    values = [12, 18, 10 ** 40 + 7, 2 ** 90, 35, 1]
+    numbers = [natural_from_int(v) for v in values]
+    assert str(NaturalModule.LCM_MANY_N(numbers)) == str(math.lcm(*values))
+    assert [str(x) for x in numbers] == [str(v) for v in values]
+    assert str(NaturalModule.LCM_MANY_N([natural_from_int(7)])) == "7"
+
+
+@pytest.mark.parametrize("s", ["0", "42", "007", "9" * 39, "1" + "0" * 99])
+def test_from_str(s):
+    """from_str: короткие записи - int, длинные - сразу лимбы"""
+    num = NaturalModule.from_str(s)
+    assert num._is_packed() == (len(s) >= NaturalModule.PACKED_THRESHOLD)
+    assert str(num) == str(int(s))
+    assert num.n == len(str(int(s))) - 1
+    assert num.A == [int(d) for d in str(int(s))][::-1]
+
+
+@pytest.mark.parametrize("a,e", [(0, 0), (0, 3), (7, 0), (2, 64), (2, 200), (10 ** 30 + 1, 5), (99, 77)])
+def test_pow_nn_n(a, e):
+    """POW_NN_N: степень, показатель не изменяется"""
+    exponent = natural_from_int(e)
+    assert str(natural_from_int(a).POW_NN_N(exponent)) == str(a ** e)
+    assert str(exponent) == str(e)
+
+
+@pytest.mark.parametrize("a,e,m", [
+    (3, 0, 7),
+    (3, 1000, 10 ** 9 + 7),
+    (2, 10 ** 20, 10 ** 40 + 3),
+    (10 ** 45 + 1, 12345, 2 ** 100),
+    (7, 3, 1),
+])
+def test_powmod_nnn_n(a, e, m):
+    """POWMOD_NNN_N: степень по модулю"""
+    assert str(natural_from_int(a).POWMOD_NNN_N(natural_from_int(e), natural_from_int(m))) == str(pow(a, e, m))
+
+
+def test_powmod_nnn_n_zero_modulus():
+    """POWMOD_NNN_N: нулевой модуль"""
+    with pytest.raises(ZeroDivisionError):
+        NaturalModule(0, [2]).POWMOD_NNN_N(NaturalModule(0, [3]), NaturalModule(0, [0]))
+
+
+@pytest.mark.parametrize("a", [0, 1, 9, 2 ** 32, 2 ** 64 - 1, 10 ** 39 - 1, 10 ** 39, 3 ** 500])
+def test_sqr_n_n(a):
+    """SQR_N_N: квадрат, совпадает с MUL_NN_N для того же и для равного числа"""
+    assert str(natural_from_int(a).SQR_N_N()) == str(a * a)
+    x = natural_from_int(a)
+    assert str(x.MUL_NN_N(x)) == str(a * a)
+    assert str(natural_from_int(a).MUL_NN_N(natural_from_int(a))) == str(a * a)
+
+
+@pytest.mark.parametrize("a", [0, 1, 15, 16, 2 ** 64 - 1, 2 ** 64, 10 ** 80 + 1])
+def test_sqrt_n_n(a):
+    """SQRT_N_N: целая часть квадратного корня"""
+    assert str(natural_from_int(a).SQRT_N_N()) == str(math.isqrt(a))
+
+
+@pytest.mark.parametrize("a,k,expected", [(27, 3, 3), (26, 3, 2), (10 ** 60, 20, 1000), (5, 1, 5), (0, 4, 0)])
+def test_root_nk_n(a, k, expected):
+    """ROOT_Nk_N: целая часть корня k-й степени"""
+    assert str(natural_from_int(a).ROOT_Nk_N(k)) == str(expected)
+
+
+def test_root_nk_n_bad_degree():
+    """ROOT_Nk_N: степень корня должна быть положительной"""
+    with pytest.raises(ValueError):
+        NaturalModule(0, [8]).ROOT_Nk_N(0)
+
+
+@pytest.mark.parametrize("a,expected", [(1, None), (10, None), (81, ("3", 4)), (10 ** 45, ("10", 45))])
+def test_perfpow_n_nk(a, expected):
+    """PERFPOW_N_Nk: точная степень, число не изменяется"""
+    x = natural_from_int(a)
+    found = x.PERFPOW_N_Nk()
+    assert (found if found is None else (str(found[0]), found[1])) == expected
+    assert str(x) == str(a)
+
+
+@pytest.fixture
+def auto_backend():
+    """Проверки представления чисел рассчитаны на смешанный движок"""
+    with backends.using("auto"):
+        yield
+
+
+# Малые значения: граница SMALL_BOUND и переход в цифры/лимбы
+@pytest.mark.parametrize("a,b", [
+    (0, 0),
+    (7, 5),
+    (2 ** 64 - 1, 1),
+    (2 ** 64 - 1, 2 ** 64 - 1),
+    (2 ** 63, 2),
+    (12345678901234567890, 9876543210),
+])
+def test_small_arithmetic(a, b):
+    """Малые числа: результаты совпадают с int и переходят за границу"""
+    assert str(NaturalModule.from_str(str(a)).ADD_NN_N(NaturalModule.from_str(str(b)))) == str(a + b)
+    assert str(NaturalModule.from_str(str(a)).MUL_NN_N(NaturalModule.from_str(str(b)))) == str(a * b)
+    assert NaturalModule.from_str(str(a)).COM_NN_D(NaturalModule.from_str(str(b))) == \
+        (2 if a > b else 1 if a < b else 0)
+    if a >= b:
+        assert str(NaturalModule.from_str(str(a)).SUB_NN_N(NaturalModule.from_str(str(b)))) == str(a - b)
+    if b:
+        q, r = NaturalModule.from_str(str(a)).DIVMOD_NN_NN(NaturalModule.from_str(str(b)))
+        assert (str(q), str(r)) == (str(a // b), str(a % b))
+    assert str(NaturalModule.from_str(str(a)).GCF_NN_N(NaturalModule.from_str(str(b)))) == str(math.gcd(a, b))
+    assert str(NaturalModule.from_str(str(a)).LCM_NN_N(NaturalModule.from_str(str(b)))) == str(math.lcm(a, b))
+
+
+@pytest.mark.in_place
+def test_small_promotion(auto_backend):
+    """Результат за границей SMALL_BOUND хранится цифрами и остаётся верным"""
+    num = NaturalModule.from_str(str(2 ** 64 - 1))
+    assert num._small is not None
+    num.ADD_1N_N()
+    assert num._small is None and str(num) == str(2 ** 64)
+    num.SUB_NN_N(NaturalModule(0, [1]))
+    assert num._as_small() == 2 ** 64 - 1
+    num.A[0] = 0  # Изменение массива цифр снаружи учитывается
+    assert str(num) == str(2 ** 64 - 6)
+
+
+@pytest.mark.in_place
+@pytest.mark.parametrize("bound", [1, 10, 2 ** 20])
+def test_small_bound_configurable(monkeypatch, bound):
+    """Граница SMALL_BOUND настраивается: результаты не зависят от неё"""
+    monkeypatch.setattr(NaturalModule, "SMALL_BOUND", bound)
+    a, b = 98765432123456789, 123456789
+    x = NaturalModule.from_str(str(a))
+    assert str(x.MUL_NN_N(NaturalModule.from_str(str(b)))) == str(a * b)
+    assert str(x.DIV_NN_N(NaturalModule.from_str(str(b)))) == str(a)
+
+
+def test_small_sub_negative(auto_backend):
+    """SUB_NN_N: малое вычитаемое больше уменьшаемого"""
+    with pytest.raises(ValueError):
+        NaturalModule.from_str("3").SUB_NN_N(NaturalModule.from_str("5"))
+
+
+@pytest.mark.parametrize("A,expected_A", [
+    ([3, 2, 1, 0, 0], [3, 2, 1]),
+    ([0, 0, 0], [0]),
+    ([], [0]),
+    ([5], [5]),
+])
+def test_canonical_form(A, expected_A):
+    """Массив цифр хранится без ведущих нулей, n == len(A) - 1"""
+    num = NaturalModule(len(A) + 3, A)
+    assert num.A == expected_A
+    assert num.n == len(expected_A) - 1
+    num.A = A + [0, 0]
+    assert num.n == len(num.A) - 1
+
+
+@pytest.mark.parametrize("value", [0, 1, 10, 2 ** 70, 10 ** 90, 10 ** 90 + 1])
+def test_is_zero_is_one(value):
+    """is_zero и is_one во всех представлениях числа"""
+    num = natural_from_int(value)
+    assert num.is_zero() == (value == 0)
+    assert num.is_one() == (value == 1)
+    assert num.NZER_N_B() == (value != 0)
+    digits = NaturalModule(None, list(num.A))
+    assert digits.is_zero() == (value == 0)
+    assert digits.is_one() == (value == 1)
@@ -0,0 +1,32 @@
+import pytest
+from ..app.validation import natural_expression_parser
+from ..app.validation.natural_expression_parser import NatExpressionParser
+from ..app.validation.rational_expression_parser import RatExpressionParser
+
+
+# Парсер работает с классами my_math, импортированными им самим
+NaturalModule = natural_expression_parser.NaturalModule
+
+
+@pytest.mark.parametrize("a,b", [
+    (int("7" * 400), int("3" * 250)),
+    (10 ** 600 + 12345, 10 ** 199 + 7),  # делитель ровно в RECIPROCAL_MIN_DIGITS цифр
+])
+def test_repeated_long_divisor(a, b):
+    """Повторный длинный делитель: деление через кэш обратных величин"""
+    expression = f"{a} % {b} + {a} % {b} + {a * 3} / {b} + {a} / {b}"
+    expected = a % b + a % b + a * 3 // b + a // b
+    assert NatExpressionParser().evaluate(expression, NaturalModule) == str(expected)
+
+
+@pytest.mark.parametrize("expression,expected", [
+    ("2^3/2", "4"),        # (2^3)/2, а не 2^(3/2)
+    ("3/2^2", "3/4"),      # 3/(2^2), а не (3/2)^2
+    ("2^-3/2", "1/16"),
+    ("-3/2^2", "-3/4"),
+    ("(3/2)^2", "9/4"),
+    ("1/3 + 5/6", "7/6"),
+])
+def test_rational_power_and_fraction(expression, expected):
+    """Степень связывает сильнее черты дроби: a/b рядом с ^ - деление"""
+    assert RatExpressionParser().evaluate(expression) == expected
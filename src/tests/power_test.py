@@ -0,0 +1,61 @@
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import power
+
+
+@pytest.mark.parametrize("a,e", [(0, 0), (0, 5), (1, 1000), (2, 100), (10 ** 9, 3), (3 ** 50, 17), (12345, 64)])
+def test_power(a, e):
+    """power: бинарное возведение в степень"""
+    assert limbs.to_int(power.power(limbs.from_int(a), e)) == a ** e
+
+
+@pytest.mark.parametrize("m", [1, 3, 7, 10 ** 9 + 7, 10 ** 40 + 3, 3 ** 120, 10 ** 18 - 1])
+def test_montgomery_neg_inverse(m):
+    """_Montgomery: m * m' = -1 по модулю BASE^n"""
+    L = limbs.from_int(m)
+    mont = power._Montgomery(L)
+    R = limbs.BASE ** len(L)
+    assert m * limbs.to_int(mont.m_neg_inv) % R == R - 1
+
+
+# Модули, взаимно простые с 10 (только Монтгомери), степени 2 и 5 и смешанные
+@pytest.mark.parametrize("a,e,m", [
+    (0, 0, 7),
+    (5, 0, 1),
+    (2, 10, 1000),
+    (3, 200, 2 ** 70),
+    (7, 12345, 10 ** 20),
+    (10 ** 30 + 1, 10 ** 5, 3 * 10 ** 40 + 7),
+    (12, 3, 12),
+    (2 ** 200, 2 ** 64 + 1, 10 ** 60 + 33),
+    (3, 10 ** 30, 2 ** 40 * 5 ** 7 * (10 ** 25 + 13)),
+    (10 ** 50, 2, 10 ** 50 + 1),
+])
+def test_powmod(a, e, m):
+    """powmod: совпадает со встроенным pow"""
+    assert limbs.to_int(power.powmod(limbs.from_int(a), e, limbs.from_int(m))) == pow(a, e, m)
+
+
+def test_powmod_random():
+    """powmod: случайные основания, показатели и модули разной длины"""
+    rnd = random.Random(15)
+    for _ in range(150):
+        m = rnd.randrange(1, 10 ** rnd.randint(1, 60)) * rnd.choice([1, 2, 5, 10, 2 ** 30, 5 ** 12])
+        a = rnd.randrange(10 ** rnd.randint(1, 80))
+        e = rnd.randrange(10 ** rnd.randint(0, 25))
+        assert limbs.to_int(power.powmod(limbs.from_int(a), e, limbs.from_int(m))) == pow(a, e, m)
+
+
+def test_powmod_by_zero():
+    """powmod: нулевой модуль"""
+    with pytest.raises(ZeroDivisionError):
+        power.powmod(limbs.from_int(5), 3, limbs.from_int(0))
+
+
+@pytest.mark.parametrize("e", [1, 2, 3, 255, 256, 2 ** 100 + 1, 3 ** 500])
+def test_sliding_window(e):
+    """_sliding_window: любые показатели (окна разной ширины)"""
+    m = 10 ** 9 + 7
+    result = power._sliding_window(3, e, lambda x, y: x * y % m, lambda x: x * x % m)
+    assert result == pow(3, e, m)
@@ -5,6 +5,7 @@ from ..my_math.rational_module import RationalModule
 
 
 # RED_Q_Q: сокращение дробей разных видов
+@pytest.mark.in_place
 @pytest.mark.parametrize("num_b,num_n,num_A,den_n,den_A,expected_str", [
     (0, 0, [0], 0, [5], "0"),          # 0/5 -> 0/1
     (0, 3, [3, 0, 0, 0], 0, [9], "1/3"), # 3000/9 -> 1/3
@@ -56,6 +57,7 @@ def test_TRANS_Q_Z_various(num_b, num_n, num_A, den_n, den_A, expected_is_none):
 
 
 # ADD_QQ_Q: сложение пяти пар дробей
+@pytest.mark.in_place
 @pytest.mark.parametrize("n1_b,n1_n,n1_A,d1_n,d1_A,n2_b,n2_n,n2_A,d2_n,d2_A,expected_str", [
     (0, 0, [1], 0, [2], 0, 0, [1], 0, [3], "5/6"),   # 1/2 + 1/3 = 5/6
     (1, 0, [2], 0, [5], 0, 0, [3], 0, [10], "-1/10"),# -2/5 + 3/10 = -1/10
@@ -71,6 +73,7 @@ def test_ADD_QQ_Q_multiple(n1_b, n1_n, n1_A, d1_n, d1_A, n2_b, n2_n, n2_A, d2_n,
 
 
 # SUB_QQ_Q: вычитание пяти пар дробей
+@pytest.mark.in_place
 @pytest.mark.parametrize("n1_b,n1_n,n1_A,d1_n,d1_A,n2_b,n2_n,n2_A,d2_n,d2_A,expected_str", [
     (0, 0, [1], 0, [2], 0, 0, [1], 0, [3], "1/6"),    # 1/2 - 1/3 = 1/6
     (0, 1, [4], 0, [5], 0, 0, [2], 0, [5], "2/5"),    # 14/5 - 2/5 = 12/5
@@ -86,6 +89,7 @@ def test_SUB_QQ_Q_multiple(n1_b, n1_n, n1_A, d1_n, d1_A, n2_b, n2_n, n2_A, d2_n,
 
 
 # MUL_QQ_Q: умножение 5 пар дробей
+@pytest.mark.in_place
 @pytest.mark.parametrize("n1_b,n1_n,n1_A,d1_n,d1_A,n2_b,n2_n,n2_A,d2_n,d2_A,expected_str", [
     (0, 0, [2], 0, [3], 0, 0, [3], 0, [4], "1/2"),     # 2/3 * 3/4 = 6/12 = 1/2
     (1, 0, [1], 0, [2], 1, 0, [2], 0, [5], "1/5"),     # -1/2 * -2/5 = 2/10 = 1/5
@@ -101,6 +105,7 @@ def test_MUL_QQ_Q_multiple(n1_b, n1_n, n1_A, d1_n, d1_A, n2_b, n2_n, n2_A, d2_n,
 
 
 # DIV_QQ_Q: деление пяти пар дробей
+@pytest.mark.in_place
 @pytest.mark.parametrize("n1_b,n1_n,n1_A,d1_n,d1_A,n2_b,n2_n,n2_A,d2_n,d2_A,expected_str", [
     (0, 0, [1], 0, [2], 0, 0, [1], 0, [4], "2"),     # 1/2 / 1/4 = 2/1
     (1, 0, [3], 0, [5], 0, 0, [1], 0, [2], "-6/5"),   # -3/5 / 1/2 = -6/5
@@ -111,4 +116,24 @@ def test_DIV_QQ_Q_multiple(n1_b, n1_n, n1_A, d1_n, d1_A, n2_b, n2_n, n2_A, d2_n,
     rat1 = RationalModule(IntegerModule(n1_b, n1_n, n1_A), NaturalModule(d1_n, d1_A))
     rat2 = RationalModule(IntegerModule(n2_b, n2_n, n2_A), NaturalModule(d2_n, d2_A))
     rat1.DIV_QQ_Q(rat2)
-    assert str(rat1) == expected_str
\ No newline at end of file
+    assert str(rat1) == expected_str
+
+@pytest.mark.parametrize("s,expected_sign", [("0", 0), ("-0", 0), ("-7", -1), ("12", 1)])
+def test_is_zero_sign(s, expected_sign):
+    """is_zero и sign дроби определяются по числителю"""
+    q = RationalModule(IntegerModule.from_str(s), NaturalModule(0, [3]))
+    assert q.sign() == expected_sign
+    assert q.is_zero() == (expected_sign == 0)
+
+@pytest.mark.parametrize("up,down,expected", [
+    ("-12", "7", "-12/7"), ("5", "1", "5"), ("-5", "1", "-5"), ("0", "9", "0"),
+    ("3" * 40, "7" * 30, "3" * 40 + "/" + "7" * 30),
+])
+def test_str_keeps_representation(up, down, expected):
+    """__str__ не распаковывает числитель и знаменатель в массивы цифр"""
+    q = RationalModule(IntegerModule.from_str(up), NaturalModule.from_str(down))
+    packed = (q.up.magnitude._is_packed(), q.down._is_packed())
+    small = (q.up._small, q.down._small)
+    assert str(q) == expected
+    assert (q.up.magnitude._is_packed(), q.down._is_packed()) == packed
+    assert (q.up._small, q.down._small) == small
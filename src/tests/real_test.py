@@ -568,6 +568,69 @@ def test_gcf_pp_p_coprime_normalized():
     assert result.DEG_P_N() == 0
     assert result.C[0].up.A == [1] and result.C[0].up.b == 0  # +1
 
+@pytest.mark.parametrize("coefs", [
+    [(0, 1)],
+    [(3, 1)],
+    [(1, 1), (1, 1)],
+    [(-1, 2), (0, 1), (2, 3)],
+    [(5, 7), (-3, 4), (1, 6), (0, 1), (-11, 1)],
+    [(10 ** 30 + 7, 3), (-(10 ** 25), 9), (1, 10 ** 12)],
+])
+def test_sqr_p_p(coefs):
+    """SQR_P_P: совпадает с умножением столбиком, многочлен не изменяется"""
+    from fractions import Fraction
+    values = [Fraction(a, b) for a, b in coefs]
+    poly = create_polynomial([create_rational(a, b) for a, b in coefs])
+    before = str(poly)
+    result = poly.SQR_P_P()
+    expected = [Fraction(0)] * (2 * len(values) - 1)
+    for i, a in enumerate(values):
+        for j, b in enumerate(values):
+            expected[i + j] += a * b
+    if not any(expected):
+        expected = [Fraction(0)]
+    assert [Fraction(str(c)) for c in result.C] == expected
+    assert str(poly) == before
+
+
+def test_mul_pp_p_square_detection():
+    """MUL_PP_P: квадрат распознаётся и для того же объекта, и для равного многочлена"""
+    p1 = create_polynomial([create_rational(1, 2), create_rational(-3)])
+    p2 = create_polynomial([create_rational(1, 2), create_rational(-3)])
+    expected = [str(c) for c in p1.SQR_P_P().C]
+    assert [str(c) for c in p1.MUL_PP_P(p1).C] == expected
+    assert [str(c) for c in p1.MUL_PP_P(p2).C] == expected
+
+
+@pytest.mark.parametrize("other", [
+    [(-1, 2), (-3, 1)],   # другой знак
+    [(1, 3), (-3, 1)],    # другой знаменатель
+    [(1, 2), (-4, 1)],    # другой числитель
+    [(1, 2)],             # другая степень
+])
+def test_mul_pp_p_different_coefs(other):
+    """MUL_PP_P: многочлены с разными коэффициентами не считаются квадратом"""
+    from fractions import Fraction
+    p1 = create_polynomial([create_rational(1, 2), create_rational(-3)])
+    p2 = create_polynomial([create_rational(a, b) for a, b in other])
+    assert not p1._same_coefs(p2)
+    values = [Fraction(a, b) for a, b in other]
+    expected = [Fraction(0)] * (len(values) + 1)
+    for i, a in enumerate([Fraction(1, 2), Fraction(-3)]):
+        for j, b in enumerate(values):
+            expected[i + j] += a * b
+    assert [Fraction(str(c)) for c in p1.MUL_PP_P(p2).C] == expected
+
+def test_fac_p_q_keeps_coefficients():
+    """FAC_P_Q не изменяет знаки коэффициентов"""
+    poly = RealModule(1, [
+        RationalModule(IntegerModule.from_str("-4"), NaturalModule(0, [3])),
+        RationalModule(IntegerModule.from_str("6"), NaturalModule(0, [5])),
+    ])
+    assert str(poly.FAC_P_Q()) == "2/15"
+    assert str(poly.C[0]) == "-4/3"
+
+
 def run_complete_nmr_test_suite():
     """
     Полный набор тестов для NMR_P_P
@@ -629,4 +692,4 @@ def run_complete_nmr_test_suite():
     print("=" * 60)
 
 if __name__ == "__main__":
-    run_complete_nmr_test_suite()
\ No newline at end of file
+    run_complete_nmr_test_suite()
@@ -0,0 +1,55 @@
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import reciprocal
+from ..my_math.reciprocal import Reciprocal
+from ..my_math.natural_module import NaturalModule
+
+
+def natural_of(num: int) -> NaturalModule:
+    """NaturalModule из целого числа Python"""
+    digits = [int(d) for d in str(num)][::-1]
+    return NaturalModule(len(digits) - 1, digits)
+
+
+@pytest.fixture
+def small_basecase(monkeypatch):
+    """Низкий порог, чтобы итерации Ньютона срабатывали на коротких делителях"""
+    monkeypatch.setattr(reciprocal, "NEWTON_BASECASE", 6)
+
+
+# Обратная величина: делители с малым и большим старшим лимбом, степени основания
+@pytest.mark.parametrize("b", [7, 10 ** 9, 10 ** 63 + 1, 10 ** 90 - 1, 3 ** 200, 2 ** 700 + 12345])
+def test_reciprocal_value(small_basecase, b):
+    """_reciprocal: floor(BASE^(2n) / b)"""
+    size = -(-len(str(b)) // limbs.BASE_DIGITS)
+    v = reciprocal._reciprocal(natural_of(b)._get_limbs(), size)
+    assert limbs.to_string(v) == str(10 ** (18 * size) // b)
+
+
+@pytest.mark.parametrize("len_b", [1, 3, 8, 20, 33])
+def test_reciprocal_divmod(small_basecase, len_b):
+    """DIVMOD_NN_NN: делимые короче, длиннее и много длиннее делителя"""
+    rnd = random.Random(len_b)
+    b = rnd.randrange(10 ** (9 * len_b - 9), 10 ** (9 * len_b))
+    r = Reciprocal(natural_of(b))
+    for len_a in (len_b - 1, 2 * len_b, 2 * len_b + 1, 5 * len_b + 3):
+        a = rnd.randrange(10 ** (9 * len_a)) if len_a else 0
+        for x in (a, b * (a // b), b * (a // b) - 1 if a >= b else a):
+            q, m = r.DIVMOD_NN_NN(natural_of(x))
+            assert (str(q), str(m)) == (str(x // b), str(x % b))
+
+
+def test_reciprocal_div_mod():
+    """DIV_NN_N и MOD_NN_N изменяют делимое, делитель переиспользуется"""
+    b = 10 ** 40 + 7
+    r = Reciprocal(natural_of(b))
+    for a in (0, 5, 10 ** 80, 123456789 ** 9):
+        assert str(r.DIV_NN_N(natural_of(a))) == str(a // b)
+        assert str(r.MOD_NN_N(natural_of(a))) == str(a % b)
+
+
+def test_reciprocal_zero():
+    """Reciprocal: делитель ноль"""
+    with pytest.raises(ZeroDivisionError):
+        Reciprocal(NaturalModule(0, [0]))
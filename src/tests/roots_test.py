@@ -0,0 +1,56 @@
+import math
+import random
+import pytest
+from ..my_math import limbs
+from ..my_math import roots
+
+
+def int_root(a: int, k: int) -> int:
+    """Эталон: наибольшее x, для которого x^k <= a (бинарный поиск)"""
+    lo, hi = 0, 1 << (a.bit_length() // k + 1)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if mid ** k <= a:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+@pytest.mark.parametrize("a", [0, 1, 2, 3, 4, 99, 100, 10 ** 18, 10 ** 18 - 1, (10 ** 50 + 7) ** 2, 3 ** 1001])
+def test_isqrt(a):
+    """isqrt: целая часть квадратного корня, в том числе на границах квадратов"""
+    for v in (a, a + 1, max(a - 1, 0)):
+        assert limbs.to_int(roots.isqrt(limbs.from_int(v))) == math.isqrt(v)
+
+
+@pytest.mark.parametrize("a,k", [
+    (0, 3), (1, 5), (7, 1), (8, 3), (26, 3), (2 ** 64, 64), (2 ** 64 - 1, 64),
+    (10 ** 100, 7), ((10 ** 20 + 3) ** 5, 5), ((10 ** 20 + 3) ** 5 - 1, 5), (3 ** 700, 100), (12345, 1000),
+])
+def test_root(a, k):
+    """root: целая часть корня k-й степени"""
+    assert limbs.to_int(roots.root(limbs.from_int(a), k)) == int_root(a, k)
+
+
+def test_root_random():
+    """root: случайные числа и степени (короткие и длинные корни)"""
+    rnd = random.Random(17)
+    for _ in range(300):
+        a = rnd.randrange(10 ** rnd.randint(1, 200))
+        k = rnd.choice([2, 3, 5, rnd.randint(2, 50), rnd.randint(2, 700)])
+        assert limbs.to_int(roots.root(limbs.from_int(a), k)) == int_root(a, k)
+
+
+@pytest.mark.parametrize("a,expected", [
+    (0, None), (1, None), (2, None), (12, None), (4, (2, 2)), (64, (2, 6)), (1000, (10, 3)),
+    (6 ** 97, (6, 97)), (2 ** 60, (2, 60)), (3 ** 40 + 1, None), ((10 ** 30 + 1) ** 6, (10 ** 30 + 1, 6)),
+    ((10 ** 30 + 1) ** 6 - 1, None),
+])
+def test_perfect_power(a, expected):
+    """perfect_power: основание и наибольший показатель"""
+    found = roots.perfect_power(limbs.from_int(a))
+    if expected is None:
+        assert found is None
+    else:
+        assert (limbs.to_int(found[0]), found[1]) == expected
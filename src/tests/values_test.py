@@ -0,0 +1,138 @@
+import math
+import threading
+import pytest
+from ..my_math import values
+from ..my_math.natural_module import NaturalModule
+from ..my_math.integer_module import IntegerModule
+from ..my_math.rational_module import RationalModule
+
+
+@pytest.fixture
+def value_mode():
+    """Режим значений на время теста"""
+    with values.using():
+        yield
+
+
+@pytest.mark.parametrize("environ,expected", [
+    ({}, False),
+    ({"MY_MATH_VALUES": "0"}, False),
+    ({"MY_MATH_VALUES": "1"}, True),
+    ({"MY_MATH_VALUES": " Yes "}, True),
+])
+def test_use_from_env(environ, expected):
+    """use_from_env: выбор режима по переменной окружения"""
+    previous = values.enabled()
+    try:
+        assert values.use_from_env(environ) == expected
+        assert values.enabled() == expected
+    finally:
+        values.enable(previous)
+
+
+@pytest.mark.parametrize("a,b", [("12", "30"), ("98765432109876543210", "3"), ("7" * 60, "12345" * 10)])
+def test_natural_operands_unchanged(value_mode, a, b):
+    """Режим значений: операции возвращают новые числа, операнды не изменяются"""
+    x = NaturalModule.from_str(a)
+    y = NaturalModule.from_str(b)
+    assert str(x.ADD_NN_N(y)) == str(int(a) + int(b))
+    assert str(x.MUL_NN_N(y)) == str(int(a) * int(b))
+    assert str(x.DIV_NN_N(y)) == str(int(a) // int(b))
+    assert str(x.GCF_NN_N(y)) == str(math.gcd(int(a), int(b)))
+    x.ADD_1N_N()
+    assert (str(x), str(y)) == (a, b)
+
+
+def test_integer_and_rational_operands_unchanged(value_mode):
+    """Режим значений: знаки и дроби не портятся (SUB_ZZ_Z, ADD_QQ_Q)"""
+    a = IntegerModule.from_str("-" + "9" * 30)
+    b = IntegerModule.from_str("5" * 25)
+    assert str(a.SUB_ZZ_Z(b)) == str(-int("9" * 30) - int("5" * 25))
+    assert (str(a), str(b)) == ("-" + "9" * 30, "5" * 25)
+    p = RationalModule(IntegerModule.from_str("1"), NaturalModule.from_str("6"))
+    q = RationalModule(IntegerModule.from_str("-1"), NaturalModule.from_str("3"))
+    assert str(p.ADD_QQ_Q(q)) == "-1/6"
+    assert (str(p), str(q)) == ("1/6", "-1/3")
+
+
+def test_interned_constants(value_mode):
+    """Режим значений: from_str возвращает общие константы 0, 1 и 10"""
+    assert NaturalModule.from_str("1") is NaturalModule.ONE
+    assert NaturalModule.from_str("10") is NaturalModule.TEN
+    assert IntegerModule.from_str("0") is IntegerModule.ZERO
+    assert NaturalModule.from_str("2") is not NaturalModule.from_str("2")
+
+
+@pytest.mark.parametrize("mode", [False, True])
+def test_constants_immutable(mode):
+    """Константы не изменяются ни в одном режиме (в том числе как аргументы)"""
+    with values.using(mode):
+        assert str(NaturalModule.ONE.ADD_1N_N()) == "2"
+        assert str(IntegerModule.TEN.MUL_ZM_Z()) == "-10"
+        assert str(IntegerModule.from_str("3").SUB_ZZ_Z(IntegerModule.TEN)) == "-7"
+        assert str(RationalModule.ONE.DIV_QQ_Q(RationalModule.TEN)) == "1/10"
+    assert (str(NaturalModule.ONE), str(IntegerModule.TEN), str(RationalModule.ONE)) == ("1", "10", "1")
+
+
+def test_eq_and_hash():
+    """Сравнение и хэш по значению независимо от представления"""
+    assert NaturalModule(2, [5, 2, 1]) == NaturalModule.from_str("125")
+    assert NaturalModule(2, [5, 2, 0]) == NaturalModule.from_str("25")  # ведущий ноль
+    assert NaturalModule.from_str("9" * 50) == NaturalModule(49, [9] * 50)
+    assert IntegerModule(1, 0, [0]) == IntegerModule.ZERO  # отрицательный ноль
+    assert IntegerModule.from_str("-5") != IntegerModule.from_str("5")
+    half = RationalModule(IntegerModule.from_str("2"), NaturalModule.from_str("4"))
+    assert half == RationalModule(IntegerModule.from_str("1"), NaturalModule.from_str("2"))
+    cache = {values.frozen(NaturalModule.from_str("125")): "a", values.frozen(half): "b"}
+    assert cache[values.frozen(NaturalModule(2, [5, 2, 1]))] == "a"
+    assert cache[values.frozen(RationalModule(IntegerModule.from_str("3"), NaturalModule.from_str("6")))] == "b"
+    assert hash(IntegerModule.ONE) == hash(values.frozen(IntegerModule.from_str("1")))
+    assert NaturalModule.ONE != IntegerModule.ONE
+
+
+@pytest.mark.parametrize("mode", [False, True])
+def test_mutable_unhashable(mode):
+    """Хэшируются только неизменяемые числа: изменяемое число - не ключ словаря"""
+    half = RationalModule(IntegerModule.from_str("1"), NaturalModule.from_str("2"))
+    with values.using(mode):
+        for number in [NaturalModule.from_str("125"), IntegerModule.from_str("-5"), half]:
+            with pytest.raises(TypeError):
+                hash(number)
+        key = values.frozen(half)
+        assert key == half and key is not half
+        assert str(key.ADD_QQ_Q(RationalModule.ONE)) == "3/2"
+        assert str(key.up.ADD_ZZ_Z(IntegerModule.ONE)) == "2"
+        assert (str(key), str(half)) == ("1/2", "1/2")
+
+
+def test_depth_per_thread(value_mode):
+    """Вложенность операций своя у каждого потока: другой поток копирует операнды"""
+    values._state.depth = 1  # этот поток - внутри операции
+    seen = []
+
+    def worker():
+        x = NaturalModule.from_str("5")
+        x.ADD_1N_N()
+        seen.append(str(x))
+
+    try:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    finally:
+        values._state.depth = 0
+    assert seen == ["5"]
+
+
+def test_value_mode_results_hashable(value_mode):
+    """Режим значений: результаты операций неизменяемы и служат ключами словарей"""
+    a = NaturalModule.from_str("12")
+    b = NaturalModule.from_str("30")
+    cache = {a.ADD_NN_N(b): "sum"}
+    assert cache[values.frozen(NaturalModule.from_str("42"))] == "sum"
+    q, r = a.DIVMOD_NN_NN(NaturalModule.from_str("5"))
+    assert {q: "q", r: "r"}[values.frozen(NaturalModule.from_str("2"))] == "r"
+    half = RationalModule(IntegerModule.from_str("1"), NaturalModule.from_str("2")).ADD_QQ_Q(RationalModule.ZERO)
+    assert {half: 1}[values.frozen(half)] == 1
+    assert str(half.up.ADD_ZZ_Z(IntegerModule.ONE)) == "2" and str(half) == "1/2"
+    assert str(a.ADD_NN_N(b).ADD_NN_N(b)) == "72"